@@ -1,9 +1,18 @@
 """Emonk - Open-source framework for building single-purpose AI agents."""
 
-from .core.deepagent import build_deep_agent
+from typing import Any
 
 __version__ = "1.0.0"
 
 __all__ = [
     "build_deep_agent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the agent factory on first access; it pulls in the LLM SDKs."""
+    if name == "build_deep_agent":
+        from src.core.deepagent import build_deep_agent
+
+        return build_deep_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -35,6 +35,30 @@ except ImportError:
     SandboxBackendProtocol = object
 
 
+def is_available() -> bool:
+    """Report whether build_deep_agent() can run in this environment.
+
+    Checks only what build_deep_agent() would otherwise fail on partway
+    through: the deepagents package being importable and the checkpoint
+    backend config being complete. Nothing is constructed.
+
+    Returns:
+        True if build_deep_agent() is expected to succeed
+    """
+    if not _DEEPAGENTS_AVAILABLE:
+        logger.info("Deep agents unavailable: deepagents package not installed")
+        return False
+    if os.getenv("CHECKPOINT_BACKEND", "memory") == "firestore" and not (
+        os.getenv("GCP_PROJECT_ID") or os.getenv("VERTEX_AI_PROJECT_ID")
+    ):
+        logger.info(
+            "Deep agents unavailable: CHECKPOINT_BACKEND=firestore requires "
+            "GCP_PROJECT_ID or VERTEX_AI_PROJECT_ID"
+        )
+        return False
+    return True
+
+
 def build_deep_agent(
     model: str | BaseChatModel,
     *,
@@ -79,6 +103,9 @@ def build_deep_agent(
     Returns:
         Compiled deep agent (LangGraph graph)
 
+    Call is_available() first to check for the deepagents package and a
+    complete checkpoint config without building anything.
+
     Raises:
         ImportError: If deepagents package is not installed
         ValueError: If required dependencies are missing for enabled features
@@ -245,6 +272,7 @@ def build_deep_agent(
     except ImportError:
         pass
 
+    hb_handler = None
     if heartbeat is not None:
         if scheduler is None:
             logger.warning(
@@ -298,6 +326,9 @@ def build_deep_agent(
     # Attach voice_handler to agent
     agent.voice_handler = voice_handler
 
+    # Attach heartbeat_handler so lifespan shutdown can close its HTTP client
+    agent.heartbeat_handler = hb_handler
+
     logger.info(
         "Deep agent created",
         extra={
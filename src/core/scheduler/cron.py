@@ -43,6 +43,7 @@ class CronScheduler:
         agent_state: Any, 
         check_interval_seconds: int = 10,
         storage: JobStorage | None = None,
+        max_concurrent_jobs: int = 8,
     ):
         """Initialize scheduler.
 
@@ -50,9 +51,15 @@ class CronScheduler:
             agent_state: Agent state for accessing skills and memory
             check_interval_seconds: How often to check for due jobs (default 10)
             storage: Job storage backend (defaults to JSON file storage)
+            max_concurrent_jobs: Worker count for executing due jobs within a
+                tick (default 8)
         """
+        if max_concurrent_jobs < 1:
+            raise ValueError("max_concurrent_jobs must be at least 1")
+
         self.agent_state = agent_state
         self.check_interval = check_interval_seconds
+        self.max_concurrent_jobs = max_concurrent_jobs
         self.jobs: list[dict[str, Any]] = []
         self.running = False
         self._job_handlers: dict[str, Any] = {}
@@ -120,7 +127,7 @@ class CronScheduler:
 
         return job_id
 
-    async def run_tick(self) -> dict[str, int]:
+    async def run_tick(self) -> dict[str, Any]:
         """Run a single scheduler tick (check and execute due jobs once).
         
         This is the primary method for Cloud Scheduler-triggered execution.
@@ -128,14 +135,20 @@ class CronScheduler:
         
         This method is idempotent and safe to call concurrently from multiple
         scheduler instances (with proper state backend locking).
+
+        Expected failures don't raise: per-job errors (including a failed
+        claim) are counted in jobs_failed, and a storage backend that can't
+        load jobs yields ok=False with the error. Callers branch on "ok".
         
         Returns:
             Dict with execution metrics:
+                - ok: False if the tick couldn't run (see error/error_type)
                 - jobs_checked: Total jobs examined
                 - jobs_due: Number of jobs that were due
                 - jobs_executed: Number of jobs attempted
                 - jobs_succeeded: Number of jobs that completed successfully
                 - jobs_failed: Number of jobs that failed
+                - error, error_type: Only present when ok is False
                 
         Example:
             >>> scheduler = CronScheduler(agent_state)
@@ -145,19 +158,29 @@ class CronScheduler:
         now = datetime.now(timezone.utc)
         logger.info(f"Running scheduler tick at {now.isoformat()}")
         
-        # Reload jobs from storage to get latest state
-        await self._load_jobs()
-        logger.info(f"Loaded {len(self.jobs)} total jobs from storage")
-        
-        now = datetime.now(timezone.utc)
-        metrics = {
-            "jobs_checked": len(self.jobs),
+        metrics: dict[str, Any] = {
+            "ok": True,
+            "jobs_checked": 0,
             "jobs_due": 0,
             "jobs_executed": 0,
             "jobs_succeeded": 0,
             "jobs_failed": 0,
         }
+
+        # Reload jobs from storage to get latest state
+        try:
+            await self._load_jobs()
+        except Exception as e:
+            logger.error(f"Scheduler tick could not load jobs: {e}")
+            metrics.update(ok=False, error=str(e), error_type=type(e).__name__)
+            return metrics
+        logger.info(f"Loaded {len(self.jobs)} total jobs from storage")
         
+        now = datetime.now(timezone.utc)
+        metrics["jobs_checked"] = len(self.jobs)
+        
+        due_jobs: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
         # Check each job
         for job in self.jobs:
             job_id = job.get("id", "unknown")
@@ -186,30 +209,13 @@ class CronScheduler:
             
             if schedule_at <= now:
                 metrics["jobs_due"] += 1
-                
-                # Try to claim the job (distributed lock)
-                job_id = job["id"]
-                claimed = await self.storage.claim_job(job_id)
-                
-                if not claimed:
-                    logger.info(f"Job {job_id} already claimed by another worker")
-                    continue
-                
-                metrics["jobs_executed"] += 1
-                
-                try:
-                    # Execute job and track result
-                    await self._execute_job(job)
-                    
-                    # Check final status to update metrics
-                    if job.get("status") == "completed":
-                        metrics["jobs_succeeded"] += 1
-                    elif job.get("status") == "failed":
-                        metrics["jobs_failed"] += 1
-                finally:
-                    # Always release the lease
-                    await self.storage.release_job(job_id)
-        
+                due_jobs.put_nowait(job)
+
+        # Fan due jobs out to a bounded pool of workers so one slow job
+        # doesn't hold up the rest of the tick
+        workers = min(self.max_concurrent_jobs, due_jobs.qsize())
+        await asyncio.gather(*(self._tick_worker(due_jobs, metrics) for _ in range(workers)))
+
         logger.info(
             f"Scheduler tick completed: checked={metrics['jobs_checked']}, "
             f"due={metrics['jobs_due']}, executed={metrics['jobs_executed']}, "
@@ -218,6 +224,47 @@ class CronScheduler:
         
         return metrics
 
+    async def _tick_worker(
+        self, due_jobs: asyncio.Queue[dict[str, Any]], metrics: dict[str, Any]
+    ) -> None:
+        """Claim and execute due jobs from the queue until it is empty.
+
+        Args:
+            due_jobs: Jobs found due in this tick
+            metrics: Tick metrics, updated in place
+        """
+        while not due_jobs.empty():
+            job = due_jobs.get_nowait()
+
+            # Try to claim the job (distributed lock)
+            job_id = job["id"]
+            try:
+                claimed = await self.storage.claim_job(job_id)
+            except Exception as e:
+                # Lock backend unavailable: count it and leave the job pending
+                logger.error(f"Failed to claim job {job_id}: {e}")
+                metrics["jobs_failed"] += 1
+                continue
+
+            if not claimed:
+                logger.info(f"Job {job_id} already claimed by another worker")
+                continue
+
+            metrics["jobs_executed"] += 1
+
+            try:
+                # Execute job and track result
+                await self._execute_job(job)
+
+                # Check final status to update metrics
+                if job.get("status") == "completed":
+                    metrics["jobs_succeeded"] += 1
+                elif job.get("status") == "failed":
+                    metrics["jobs_failed"] += 1
+            finally:
+                # Always release the lease
+                await self.storage.release_job(job_id)
+
     async def start(self):
         """Start the scheduler background task (legacy/dev mode).
 
@@ -15,6 +15,8 @@ from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 if TYPE_CHECKING:
+    import httpx
+
     from ..config import HeartbeatConfig
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,7 @@ class HeartbeatHandler:
         config: HeartbeatConfig,
         bot_root: str | Path = ".",
         google_chat_webhook_url: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize HeartbeatHandler.
 
@@ -52,11 +55,21 @@ class HeartbeatHandler:
             bot_root: Root directory to look for HEARTBEAT.md
             google_chat_webhook_url: Optional webhook URL override.
                 Falls back to GOOGLE_CHAT_WEBHOOK env var.
+            http_client: Optional shared client for webhook notifications.
+                If omitted, one is created on first notification and reused.
         """
         self.agent = agent
         self.config = config
         self.bot_root = Path(bot_root)
         self.webhook_url = google_chat_webhook_url or os.getenv("GOOGLE_CHAT_WEBHOOK")
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+
+    async def aclose(self) -> None:
+        """Close the webhook HTTP client if this handler created it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def handle(self, job: dict) -> None:
         """Called by CronScheduler._execute_job() for job_type='heartbeat'.
@@ -196,13 +209,17 @@ class HeartbeatHandler:
             return
 
         try:
-            import httpx
+            if self._http_client is None:
+                import httpx
+
+                # Kept for the handler's lifetime so repeat notifications
+                # reuse the keep-alive connection instead of a new TLS handshake
+                self._http_client = httpx.AsyncClient(timeout=10.0)
 
             payload = {"text": f"🔔 *Heartbeat Alert*\n{result.summary}"}
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    self.webhook_url, json=payload, timeout=10.0
-                )
+            resp = await self._http_client.post(
+                self.webhook_url, json=payload, timeout=10.0
+            )
             if resp.status_code >= 300:
                 logger.warning(
                     "Webhook returned non-200: status=%d",
@@ -85,9 +85,15 @@ class JSONFileStorage(JobStorage):
         return []
 
     async def save_jobs(self, jobs: list[dict[str, Any]]) -> None:
-        """Save jobs to JSON file."""
+        """Save jobs to JSON file.
+
+        Internal fields (prefixed with "_", e.g. the agent state injected
+        while a job runs) are skipped, since other jobs in the same tick may
+        save while one is executing.
+        """
         self.jobs_file.parent.mkdir(parents=True, exist_ok=True)
-        self.jobs_file.write_text(json.dumps(jobs, indent=2))
+        job_data = [{k: v for k, v in job.items() if not k.startswith("_")} for job in jobs]
+        self.jobs_file.write_text(json.dumps(job_data, indent=2))
 
     async def claim_job(self, job_id: str, lease_duration_seconds: int = 300) -> bool:
         """Claim job (no-op for JSON storage - no distributed locking)."""
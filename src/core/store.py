@@ -8,13 +8,80 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Optional
+import math
+import operator
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
 
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 from langgraph.store.base import BaseStore, Item
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Connection pool size for the shared GCS HTTP session
+GCS_POOL_SIZE = 32
+
+# Maximum number of calls GCS accepts in one JSON API batch request
+GCS_BATCH_SIZE = 100
+
+# Concurrent blob downloads when listing a namespace (bounded by the pool)
+GCS_DOWNLOAD_WORKERS = GCS_POOL_SIZE
+
+# Scale for int8 quantization of unit-length query embeddings
+_EMBED_SCALE = 127
+
+# Process-wide storage clients keyed by project ID. Reusing one client keeps its
+# authorized HTTP session (TCP/TLS connections + credentials) warm across
+# GCSStore instances instead of re-negotiating per instance.
+_CLIENT_CACHE: dict[Optional[str], storage.Client] = {}
+
+
+# Process-wide executor for blob downloads, created on first use. Sharing
+# one executor across list() calls and stores reuses its threads and caps
+# in-flight downloads at the HTTP session's pool size (GCS_DOWNLOAD_WORKERS),
+# so concurrent searches queue instead of overflowing the connection pool.
+_DOWNLOAD_POOL: Optional[ThreadPoolExecutor] = None
+_DOWNLOAD_POOL_LOCK = threading.Lock()
+
+
+def _get_download_pool() -> ThreadPoolExecutor:
+    """Return the shared blob download executor, creating it on first use."""
+    global _DOWNLOAD_POOL
+    with _DOWNLOAD_POOL_LOCK:
+        if _DOWNLOAD_POOL is None:
+            _DOWNLOAD_POOL = ThreadPoolExecutor(
+                max_workers=GCS_DOWNLOAD_WORKERS, thread_name_prefix="gcs-download"
+            )
+        return _DOWNLOAD_POOL
+
+
+def _get_client(project_id: Optional[str]) -> storage.Client:
+    """Return the shared storage client for a project, creating it on first use.
+
+    The client's HTTP session is mounted with a larger connection pool so
+    concurrent requests from multiple stores don't serialize on the default
+    pool of 10 connections.
+
+    Args:
+        project_id: GCP project ID (None uses default credentials' project)
+
+    Returns:
+        Shared google.cloud.storage.Client
+    """
+    client = _CLIENT_CACHE.get(project_id)
+    if client is None:
+        client = storage.Client(project=project_id)
+        adapter = HTTPAdapter(pool_connections=GCS_POOL_SIZE, pool_maxsize=GCS_POOL_SIZE)
+        client._http.mount("https://", adapter)
+        _CLIENT_CACHE[project_id] = client
+    return client
+
 
 class GCSStore(BaseStore):
     """Google Cloud Storage-backed Store for LangGraph long-term memory.
@@ -51,6 +118,7 @@ class GCSStore(BaseStore):
         bucket_name: str,
         project_id: Optional[str] = None,
         index: Optional[dict] = None,
+        list_cache_ttl: float = 5.0,
     ):
         """Initialize GCSStore.
         
@@ -59,17 +127,27 @@ class GCSStore(BaseStore):
             project_id: GCP project ID (optional, uses default credentials)
             index: Optional index config for semantic search (future)
                    Format: {"embed": callable, "dims": int}
+            list_cache_ttl: Seconds to reuse a namespace listing (0 disables)
         """
         self.bucket_name = bucket_name
         self.project_id = project_id
         self.index_config = index
+        self.list_cache_ttl = list_cache_ttl
+        
+        # (namespace, limit) -> (listed_at, items); invalidated on put/delete
+        self._list_cache: dict[tuple, tuple[float, list[Item]]] = {}
+        # namespace -> write count, so caches built on search() can tell
+        # when a namespace changed (see generation())
+        self._generations: dict[tuple, int] = {}
         
-        # Initialize GCS client
-        self.client = storage.Client(project=project_id)
+        # Reuse the process-wide GCS client for this project
+        self.client = _get_client(project_id)
         self.bucket = self.client.bucket(bucket_name)
         
         logger.info(
-            f"GCSStore initialized: bucket={bucket_name}, project={project_id}",
+            "GCSStore initialized: bucket=%s, project=%s",
+            bucket_name,
+            project_id,
             extra={"component": "gcs_store"}
         )
     
@@ -97,8 +175,30 @@ class GCSStore(BaseStore):
         Returns:
             Full blob name
         """
-        prefix = self._namespace_to_prefix(namespace)
-        return f"{prefix}{key}.json"
+        return f"{'/'.join(namespace)}/{key}.json"
+    
+    def _invalidate_list_cache(self, namespace: tuple) -> None:
+        """Drop cached listings for a namespace after it changes.
+        
+        Also bumps the namespace's generation().
+        
+        Args:
+            namespace: Namespace tuple that was written to
+        """
+        for cache_key in [k for k in self._list_cache if k[0] == namespace]:
+            del self._list_cache[cache_key]
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+    
+    def generation(self, namespace: tuple) -> int:
+        """Return a counter that changes whenever the namespace is written to.
+        
+        Args:
+            namespace: Namespace tuple
+        
+        Returns:
+            Number of put/delete calls on the namespace in this process
+        """
+        return self._generations.get(namespace, 0)
     
     def put(
         self,
@@ -124,9 +224,11 @@ class GCSStore(BaseStore):
             content,
             content_type="application/json"
         )
+        self._invalidate_list_cache(namespace)
         
         logger.info(
-            f"Stored document: {blob_name}",
+            "Stored document: %s",
+            blob_name,
             extra={
                 "component": "gcs_store",
                 "namespace": namespace,
@@ -151,25 +253,30 @@ class GCSStore(BaseStore):
         blob_name = self._blob_name(namespace, key)
         blob = self.bucket.blob(blob_name)
         
-        if not blob.exists():
+        # Download directly rather than exists() + download: one round-trip
+        try:
+            content = blob.download_as_bytes()
+        except NotFound:
             logger.debug(
-                f"Document not found: {blob_name}",
+                "Document not found: %s",
+                blob_name,
                 extra={"component": "gcs_store"}
             )
             return None
         
-        # Download and parse JSON
-        content = blob.download_as_text()
+        # Parse JSON
         value = json.loads(content)
         
-        logger.debug(
-            f"Retrieved document: {blob_name}",
-            extra={
-                "component": "gcs_store",
-                "namespace": namespace,
-                "key": key,
-            }
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Retrieved document: %s",
+                blob_name,
+                extra={
+                    "component": "gcs_store",
+                    "namespace": namespace,
+                    "key": key,
+                }
+            )
         
         return Item(
             value=value,
@@ -195,8 +302,10 @@ class GCSStore(BaseStore):
         
         if blob.exists():
             blob.delete()
+            self._invalidate_list_cache(namespace)
             logger.info(
-                f"Deleted document: {blob_name}",
+                "Deleted document: %s",
+                blob_name,
                 extra={
                     "component": "gcs_store",
                     "namespace": namespace,
@@ -205,10 +314,55 @@ class GCSStore(BaseStore):
             )
         else:
             logger.warning(
-                f"Document not found for deletion: {blob_name}",
+                "Document not found for deletion: %s",
+                blob_name,
                 extra={"component": "gcs_store"}
             )
     
+    def delete_many(
+        self,
+        namespace: tuple,
+        keys: Iterable[str],
+    ) -> None:
+        """Delete several documents using GCS batch requests.
+        
+        Sends up to GCS_BATCH_SIZE deletes per HTTP round-trip. Unlike
+        delete(), there is no per-key existence check; keys that don't
+        exist are ignored.
+        
+        Args:
+            namespace: Namespace tuple
+            keys: Document keys to delete
+        """
+        keys = list(keys)
+        for start in range(0, len(keys), GCS_BATCH_SIZE):
+            chunk = keys[start:start + GCS_BATCH_SIZE]
+            try:
+                with self.client.batch():
+                    for key in chunk:
+                        self.bucket.blob(self._blob_name(namespace, key)).delete()
+            except NotFound:
+                # The batch only raises after every deferred delete has run,
+                # so a missing key doesn't stop the rest of the chunk
+                logger.debug(
+                    "Some documents in batch delete were already gone in namespace %s",
+                    namespace,
+                    extra={"component": "gcs_store"}
+                )
+        
+        self._invalidate_list_cache(namespace)
+        
+        logger.info(
+            "Batch deleted %d documents in namespace %s",
+            len(keys),
+            namespace,
+            extra={
+                "component": "gcs_store",
+                "namespace": namespace,
+                "count": len(keys),
+            }
+        )
+    
     def list(
         self,
         namespace: tuple,
@@ -216,6 +370,10 @@ class GCSStore(BaseStore):
     ) -> list[Item]:
         """List all documents in a namespace.
         
+        Only documents directly inside the namespace are returned; nested
+        namespaces are not descended into. Results are reused for
+        list_cache_ttl seconds unless the namespace is written to.
+        
         Args:
             namespace: Namespace tuple
             limit: Maximum number of items to return
@@ -223,46 +381,76 @@ class GCSStore(BaseStore):
         Returns:
             List of Items
         """
+        cache_key = (namespace, limit)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.list_cache_ttl:
+            return list(cached[1])
+        
         prefix = self._namespace_to_prefix(namespace)
         blobs = self.client.list_blobs(
             self.bucket_name,
             prefix=prefix,
+            delimiter="/",
             max_results=limit,
         )
         
-        items = []
-        for blob in blobs:
-            # Skip if not a JSON file
-            if not blob.name.endswith(".json"):
-                continue
-            
-            # Extract key from blob name
-            key = blob.name[len(prefix):].replace(".json", "")
-            
-            # Download and parse
-            try:
-                content = blob.download_as_text()
-                value = json.loads(content)
-                
-                items.append(Item(
-                    value=value,
-                    key=key,
-                    namespace=namespace,
-                    created_at=blob.time_created.isoformat() if blob.time_created else None,
-                    updated_at=blob.updated.isoformat() if blob.updated else None,
-                ))
-            except Exception as e:
-                logger.error(
-                    f"Failed to parse blob {blob.name}: {e}",
-                    extra={"component": "gcs_store"}
-                )
+        # Skip anything that isn't a JSON document
+        json_blobs = [blob for blob in blobs if blob.name.endswith(".json")]
+        
+        # Download concurrently: each blob is its own round-trip, and the
+        # shared session's pool (GCS_POOL_SIZE) keeps connections warm
+        if len(json_blobs) > 1:
+            loaded = list(_get_download_pool().map(
+                lambda blob: self._load_listed_blob(blob, prefix, namespace), json_blobs
+            ))
+        else:
+            loaded = [self._load_listed_blob(blob, prefix, namespace) for blob in json_blobs]
+        items = [item for item in loaded if item is not None]
         
         logger.info(
-            f"Listed {len(items)} documents in namespace {namespace}",
+            "Listed %d documents in namespace %s",
+            len(items),
+            namespace,
             extra={"component": "gcs_store"}
         )
         
-        return items
+        if self.list_cache_ttl > 0:
+            self._list_cache[cache_key] = (time.monotonic(), items)
+        
+        return list(items)
+    
+    def _load_listed_blob(self, blob: Any, prefix: str, namespace: tuple) -> Optional[Item]:
+        """Download and parse one blob from a namespace listing.
+        
+        Args:
+            blob: Listed blob
+            prefix: Namespace prefix the blob was listed under
+            namespace: Namespace tuple
+        
+        Returns:
+            Item, or None if the blob couldn't be downloaded or parsed
+        """
+        # Extract key from blob name
+        key = blob.name[len(prefix):].removesuffix(".json")
+        
+        try:
+            value = json.loads(blob.download_as_bytes())
+        except Exception as e:
+            logger.error(
+                "Failed to parse blob %s: %s",
+                blob.name,
+                e,
+                extra={"component": "gcs_store"}
+            )
+            return None
+        
+        return Item(
+            value=value,
+            key=key,
+            namespace=namespace,
+            created_at=blob.time_created.isoformat() if blob.time_created else None,
+            updated_at=blob.updated.isoformat() if blob.updated else None,
+        )
     
     def batch(self, ops) -> list:
         """Execute multiple operations synchronously in a single batch.
@@ -352,13 +540,14 @@ class GCSStore(BaseStore):
         # Apply filters
         filtered = all_items
         
-        # Filter by dict match
+        # Filter by dict match (filter pairs hoisted out of the per-item loop)
         if filter:
+            conditions = tuple(filter.items())
             filtered = [
                 item for item in filtered
                 if all(
                     item.value.get(k) == v
-                    for k, v in filter.items()
+                    for k, v in conditions
                 )
             ]
         
@@ -392,37 +581,174 @@ class GCSStore(BaseStore):
         # Apply limit
         results = filtered[:limit]
         
-        logger.info(
-            f"Search results: {len(results)} of {len(all_items)} documents matched",
-            extra={
-                "component": "gcs_store",
-                "namespace": namespace,
-                "query": query,
-                "filter": filter,
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Search results: %d of %d documents matched",
+                len(results),
+                len(all_items),
+                extra={
+                    "component": "gcs_store",
+                    "namespace": namespace,
+                    "query": query,
+                    "filter": filter,
+                }
+            )
         
         return results
 
 
+class QueryCache:
+    """LRU + TTL cache of formatted search results keyed by query.
+
+    Lookups match on the lowercased query text first (GCSStore.search() is
+    case-insensitive but whitespace-sensitive, so whitespace is kept). When an embedding
+    function is supplied, an exact-text miss falls back to cosine similarity
+    against the cached query embeddings, so near-identical phrasings of a
+    recent query reuse its result instead of re-listing GCS.
+
+    Cached embeddings are unit-normalized and quantized to int8 (one byte per
+    dimension instead of a boxed float), which keeps a full cache of
+    high-dimensional vectors small; the similarity error this introduces is
+    well below the hit threshold.
+
+    Example:
+        >>> cache = QueryCache(maxsize=256, ttl=60)
+        >>> cache.get_or_compute("AI trends", lambda: "...")  # computes
+        >>> cache.get_or_compute("ai TRENDS", lambda: "...")  # cache hit
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        embed: Optional[Any] = None,
+        threshold: float = 0.95,
+    ):
+        """Initialize QueryCache.
+
+        Args:
+            maxsize: Maximum number of cached queries (least recently used evicted)
+            ttl: Seconds a cached result stays valid
+            embed: Optional embeddings object (with embed_query) or callable
+                   mapping a list of texts to a list of vectors
+            threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.embed = embed
+        self.threshold = threshold
+        # key -> (created_at, value, quantized embedding or None)
+        self._entries: OrderedDict[str, tuple[float, str, Optional[array]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """Normalize query text the way GCSStore.search() does (case only)."""
+        return query.lower()
+
+    def _embed(self, text: str) -> array:
+        """Embed text, scale it to unit length and quantize it to int8."""
+        if hasattr(self.embed, "embed_query"):
+            vector = self.embed.embed_query(text)
+        else:
+            vector = self.embed([text])[0]
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        scale = _EMBED_SCALE / norm
+        return array("b", [round(x * scale) for x in vector])
+
+    def _nearest(self, vector: array, now: float) -> Optional[str]:
+        """Return the most similar live cached result above the threshold."""
+        best_key = None
+        # Compare in quantized units to avoid rescaling every dot product
+        best_score = self.threshold * _EMBED_SCALE * _EMBED_SCALE
+        for key, (created_at, _, cached) in self._entries.items():
+            if cached is None or now - created_at >= self.ttl:
+                continue
+            score = sum(map(operator.mul, vector, cached))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1]
+
+    def get_or_compute(self, query: str, compute: Callable[[], str]) -> str:
+        """Return the cached result for query, computing and caching it on a miss.
+
+        Args:
+            query: Search query
+            compute: Zero-argument callable producing the result on a miss
+
+        Returns:
+            Cached or freshly computed result
+        """
+        key = self._normalize(query)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+        vector = self._embed(key) if self.embed is not None else None
+        if vector is not None:
+            with self._lock:
+                hit = self._nearest(vector, now)
+            if hit is not None:
+                return hit
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = (now, value, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
 def create_search_memory_tool(
     store: GCSStore,
     namespace: tuple = ("shared", "session_summaries"),
+    cache_ttl: float = 300.0,
 ):
     """Create a LangChain tool for searching shared team memory.
 
     The namespace is pre-bound at creation time — the LLM never supplies it.
     Defaults to a single shared team namespace so all users see the same memory.
 
+    Results are cached per query for cache_ttl seconds (see QueryCache), and
+    the cache is cleared whenever the store reports a write to the namespace
+    (GCSStore.generation()). If the store was created with an index config
+    containing an "embed" function, near-identical queries also hit the cache.
+
     Args:
         store: GCSStore instance
         namespace: GCS namespace tuple to search. Defaults to ("shared", "session_summaries").
+        cache_ttl: Seconds to cache formatted results (0 disables caching)
 
     Returns:
         LangChain tool function
     """
     from langchain_core.tools import tool
 
+    cache = None
+    if cache_ttl > 0:
+        index_config = getattr(store, "index_config", None)
+        embed = index_config.get("embed") if isinstance(index_config, dict) else None
+        cache = QueryCache(ttl=cache_ttl, embed=embed)
+    generation = getattr(store, "generation", None)
+    seen_generation: Optional[int] = None
+
     @tool
     def search_memory(query: str) -> str:
         """Search past team conversation summaries by keyword.
@@ -435,6 +761,23 @@ def create_search_memory_tool(
         Returns:
             Formatted search results
         """
+        nonlocal seen_generation
+        # search() matches case-insensitively; searching the lowercased query
+        # keeps a cached result (including the "no memories" text) identical
+        # for every query sharing its cache key
+        query = query.lower()
+        if cache is None:
+            return _search(query)
+        if generation is not None:
+            # A memory saved since the results were cached makes them stale
+            current = generation(namespace)
+            if current != seen_generation:
+                cache.clear()
+                seen_generation = current
+        return cache.get_or_compute(query, lambda: _search(query))
+
+    def _search(query: str) -> str:
+        """Run the store search and format the results."""
         results = store.search(
             namespace=namespace,
             query=query,
@@ -444,16 +787,15 @@ def create_search_memory_tool(
         if not results:
             return f"No relevant memories found for query: {query}"
 
-        output = f"Found {len(results)} relevant memories:\n\n"
+        parts = [f"Found {len(results)} relevant memories:", ""]
         for i, item in enumerate(results, 1):
-            summary = item.value.get("summary", "No summary")
-            topics = item.value.get("key_topics", [])
-            timestamp = item.value.get("timestamp", "Unknown time")
-
-            output += f"{i}. {summary}\n"
-            output += f"   Topics: {', '.join(topics)}\n"
-            output += f"   Time: {timestamp}\n\n"
+            value = item.value
+            parts.append(f"{i}. {value.get('summary', 'No summary')}")
+            parts.append(f"   Topics: {', '.join(value.get('key_topics', []))}")
+            parts.append(f"   Time: {value.get('timestamp', 'Unknown time')}")
+            parts.append("")
 
-        return output
+        # Trailing "" keeps the blank line after the last entry
+        return "\n".join(parts) + "\n"
 
     return search_memory
@@ -44,6 +44,11 @@ ALLOWED_PATHS = [
     "./test-data/",      # Test data directory (for tests only)
 ]
 
+# Output limits: each stream is capped at 1MB, the rest is read and discarded
+MAX_OUTPUT_SIZE = 1024 * 1024
+TRUNCATION_SUFFIX = b"\n[Output truncated at 1MB limit]"
+_READ_CHUNK_SIZE = 64 * 1024
+
 
 @dataclass
 class ExecutionResult:
@@ -139,21 +144,21 @@ class TerminalExecutor:
             - Processes are killed if they exceed timeout
             - Output is truncated if it exceeds 1MB per stream
         """
-        # CRITICAL: Validate command against allowlist
-        self._validate_command(command)
-        
-        # CRITICAL: Validate all paths in arguments
-        self._validate_paths(args)
+        # CRITICAL: Validate command and paths against the allowlists
+        self.validate(command, args)
         
-        # Log execution for audit trail
-        logger.info(
-            f"Executing command: {command} {' '.join(args)}",
-            extra={
-                "component": "terminal_executor",
-                "command": command,
-                "args_count": len(args)
-            }
-        )
+        # Log execution for audit trail (skip the args join when INFO is off)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Executing command: %s %s",
+                command,
+                " ".join(args),
+                extra={
+                    "component": "terminal_executor",
+                    "command": command,
+                    "args_count": len(args)
+                }
+            )
         
         try:
             # Create subprocess with captured output
@@ -164,16 +169,16 @@ class TerminalExecutor:
                 stderr=asyncio.subprocess.PIPE
             )
             
-            # Wait for completion with timeout
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            # Read both streams (capped at 1MB each) and wait for exit
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    self._read_capped(process.stdout, "stdout"),
+                    self._read_capped(process.stderr, "stderr"),
+                    process.wait(),
+                ),
                 timeout=timeout
             )
             
-            # Truncate large outputs to prevent memory exhaustion
-            stdout = self._truncate_output(stdout, "stdout")
-            stderr = self._truncate_output(stderr, "stderr")
-            
             return ExecutionResult(
                 stdout=stdout.decode("utf-8", errors="replace"),
                 stderr=stderr.decode("utf-8", errors="replace"),
@@ -197,6 +202,24 @@ class TerminalExecutor:
             )
             raise TimeoutError(error_msg)
     
+    def validate(self, command: str, args: List[str]) -> None:
+        """
+        Check a command and its arguments against the allowlists.
+        
+        execute() calls this before spawning anything; callers that run an
+        allowlisted command some other way (e.g. the skill worker pool)
+        call it themselves so the same policy applies.
+        
+        Args:
+            command: Command to validate (must be in ALLOWED_COMMANDS)
+            args: Command arguments (paths must be in ALLOWED_PATHS)
+        
+        Raises:
+            SecurityError: If command or path violates security policy
+        """
+        self._validate_command(command)
+        self._validate_paths(args)
+    
     def _validate_command(self, command: str) -> None:
         """
         Validate command against allowlist.
@@ -210,7 +233,8 @@ class TerminalExecutor:
         if command not in ALLOWED_COMMANDS:
             error_msg = f"Command '{command}' not allowed"
             logger.error(
-                f"Security violation: {error_msg}",
+                "Security violation: %s",
+                error_msg,
                 extra={
                     "component": "terminal_executor",
                     "severity": "SECURITY_VIOLATION",
@@ -256,7 +280,8 @@ class TerminalExecutor:
                 if not any(arg.startswith(allowed) for allowed in ALLOWED_PATHS):
                     error_msg = f"Path '{arg}' not allowed"
                     logger.error(
-                        f"Security violation: {error_msg}",
+                        "Security violation: %s",
+                        error_msg,
                         extra={
                             "component": "terminal_executor",
                             "severity": "SECURITY_VIOLATION",
@@ -266,34 +291,52 @@ class TerminalExecutor:
                     )
                     raise SecurityError(error_msg)
     
-    def _truncate_output(self, output: bytes, stream_name: str) -> bytes:
+    async def _read_capped(
+        self,
+        stream: asyncio.StreamReader,
+        stream_name: str
+    ) -> bytearray:
         """
-        Truncate large output to prevent memory exhaustion.
+        Read a process stream, keeping at most MAX_OUTPUT_SIZE bytes.
+        
+        Output past the cap is read and discarded so the process never blocks
+        on a full pipe, but it is never buffered in memory.
         
         Args:
-            output: Raw output bytes from subprocess
+            stream: Subprocess stdout or stderr reader
             stream_name: Name of stream for logging ("stdout" or "stderr")
         
         Returns:
-            Truncated output bytes (original if under limit)
+            Captured output, with TRUNCATION_SUFFIX appended if truncated
         
         Notes:
             - Maximum output size: 1MB per stream
-            - Truncated outputs include warning message
             - Truncation is logged at WARNING level
         """
-        MAX_OUTPUT_SIZE = 1024 * 1024  # 1MB
+        buf = bytearray()
+        total = 0
+        
+        while chunk := await stream.read(_READ_CHUNK_SIZE):
+            total += len(chunk)
+            room = MAX_OUTPUT_SIZE - len(buf)
+            if room >= len(chunk):
+                buf += chunk
+            elif room > 0:
+                buf += memoryview(chunk)[:room]
         
-        if len(output) > MAX_OUTPUT_SIZE:
+        if total > MAX_OUTPUT_SIZE:
             logger.warning(
-                f"Truncating {stream_name}: {len(output)} bytes -> {MAX_OUTPUT_SIZE} bytes",
+                "Truncating %s: %d bytes -> %d bytes",
+                stream_name,
+                total,
+                MAX_OUTPUT_SIZE,
                 extra={
                     "component": "terminal_executor",
                     "stream": stream_name,
-                    "original_size": len(output),
+                    "original_size": total,
                     "truncated_size": MAX_OUTPUT_SIZE
                 }
             )
-            return output[:MAX_OUTPUT_SIZE] + b"\n[Output truncated at 1MB limit]"
+            buf += TRUNCATION_SUFFIX
         
-        return output
+        return buf
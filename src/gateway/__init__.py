@@ -1,7 +1,9 @@
 """Gateway module - HTTP interface and Google Chat integration."""
 
+from typing import Any
+
 from src.gateway.interfaces import AgentCoreInterface, AgentError
-from src.gateway.models import GoogleChatWebhook, GoogleChatResponse, HealthCheckResponse
+from src.gateway.models_request import GoogleChatWebhook
 
 __all__ = [
     "AgentCoreInterface",
@@ -10,3 +12,12 @@ __all__ = [
     "GoogleChatResponse",
     "HealthCheckResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Load outbound models on first access to keep them off the startup path."""
+    if name in ("GoogleChatResponse", "HealthCheckResponse"):
+        from src.gateway import models_response
+
+        return getattr(models_response, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,162 @@
+"""
+Async micro-batching for Gateway → Agent Core calls.
+
+Concurrent webhook requests are coalesced into a single batched call
+(e.g. LangGraph's ``Runnable.abatch``) and each result is scattered back to
+the request that submitted it. A batch is flushed when it reaches
+``max_batch_size`` items or ``max_latency_ms`` has passed since its first
+item arrived, whichever comes first.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+BatchFn = Callable[[list[Any]], Awaitable[Sequence[Any]]]
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent submissions into batched calls.
+
+    The consumer task is started lazily on the first submit() and is
+    restarted if the running event loop changes (e.g. between TestClient
+    instances), so no startup/shutdown hooks are needed.
+
+    Each flushed batch runs as its own task, so several batches can be in
+    flight at once and a slow batch never delays the next one.
+
+    Submitters cancelled before their batch is dispatched are dropped from
+    it. Once a batch is running it can't be cancelled: a cancelled
+    submitter stops waiting, but its item still runs to completion.
+
+    Results from batch_fn that are exceptions are raised in the matching
+    submitter only; an exception raised by batch_fn itself fails every
+    request in that batch.
+
+    Example:
+        >>> batcher = MicroBatcher(lambda items: agent.abatch(items), max_batch_size=8)
+        >>> result = await batcher.submit(item)
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFn,
+        max_batch_size: int = 8,
+        max_latency_ms: float = 5.0,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_fn: Async callable mapping a list of items to a list of
+                      results (same length and order). Results may be
+                      exception instances.
+            max_batch_size: Maximum items per batch
+            max_latency_ms: Maximum time to wait for more items after the
+                            first one arrives
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._queue: asyncio.Queue[tuple[Any, asyncio.Future[Any]]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result from the next batch.
+
+        Args:
+            item: Input passed to batch_fn as part of a list
+
+        Returns:
+            The result batch_fn produced for this item
+
+        Raises:
+            Exception: Whatever batch_fn raised or returned for this item
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._consume(self._queue))
+
+        future: asyncio.Future[Any] = loop.create_future()
+        self._queue.put_nowait((item, future))  # type: ignore[union-attr]
+        return await future
+
+    async def _consume(self, queue: asyncio.Queue[tuple[Any, asyncio.Future[Any]]]) -> None:
+        """Drain the queue into batches forever."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_latency
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            # Run each batch as its own task so a slow batch doesn't hold
+            # back the next one; keep a reference until it finishes.
+            task = loop.create_task(self._run_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task[None]) -> None:
+        """Drop a finished batch task and log anything it failed to handle."""
+        self._inflight.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error(
+                "Batch task failed: %s",
+                error,
+                exc_info=error,
+                extra={"component": "gateway"},
+            )
+
+    async def _run_batch(self, batch: list[tuple[Any, asyncio.Future[Any]]]) -> None:
+        """Call batch_fn once and scatter results to the waiting futures."""
+        # Submitters cancelled while the batch was collecting
+        batch = [entry for entry in batch if not entry[1].done()]
+        if not batch:
+            return
+        items = [item for item, _ in batch]
+        try:
+            results = await self.batch_fn(items)
+        except Exception as e:
+            logger.error(
+                "Batched call failed for %d items: %s",
+                len(items),
+                e,
+                extra={"component": "gateway"},
+            )
+            results = [e] * len(items)
+        else:
+            if len(results) != len(items):
+                error = RuntimeError(
+                    f"Batched call returned {len(results)} results for {len(items)} items"
+                )
+                results = [error] * len(items)
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():  # Submitter was cancelled
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -8,6 +8,7 @@ Or with uvicorn:
     uvicorn src.gateway.server:app --reload --port 8080
 """
 
+import logging
 import os
 
 from dotenv import load_dotenv
@@ -19,6 +20,8 @@ load_dotenv()
 # Import app after loading env vars
 from src.gateway.server import app  # noqa: E402
 
+logger = logging.getLogger(__name__)
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -28,15 +31,19 @@ if __name__ == "__main__":
     # Get log level from env var
     log_level = os.getenv("LOG_LEVEL", "info").lower()
 
-    print(f"Starting Emonk Gateway on port {port}...")
-    print(f"Log level: {log_level}")
-    print(f"Allowed users: {os.getenv('ALLOWED_USERS', 'NOT SET - REQUIRED!')}")
-    print()
+    logger.info(
+        "Starting Emonk Gateway: port=%s, log_level=%s, allowed_users=%s",
+        port,
+        log_level,
+        os.getenv("ALLOWED_USERS", "NOT SET - REQUIRED!"),
+    )
 
     uvicorn.run(
         app,
         host="0.0.0.0",  # Listen on all interfaces
         port=port,
         log_level=log_level,
+        loop="uvloop",
+        http="httptools",
         access_log=True,
     )
@@ -0,0 +1,119 @@
+"""
+Inbound Pydantic models for Gateway module.
+
+This module defines the Google Chat webhook payload (incoming) and the
+single-pass parser used on the /webhook hot path. It is imported eagerly at
+startup; outbound models live in models_response and load on first use.
+"""
+
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+
+# Inbound models are read-only once validated. Unknown Google Chat fields
+# (space, thread, annotations, ...) are dropped rather than stored, and
+# nested instances are not revalidated when passed into parent models.
+_INBOUND_CONFIG = ConfigDict(frozen=True, extra="ignore", revalidate_instances="never")
+
+
+class GoogleChatSender(BaseModel):
+    """
+    Google Chat message sender.
+
+    Represents the user who sent the message. We only care about the email
+    for authorization checking. Display name and other metadata are ignored
+    for privacy (not sent to LLM).
+    """
+
+    email: str = Field(
+        ...,
+        description="Sender's email address (used for allowlist validation)",
+        examples=["user@example.com"],
+    )
+    display_name: str | None = Field(
+        None,
+        alias="displayName",
+        description="Sender's display name (optional, not used)",
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,  # Allow both snake_case and camelCase
+        **_INBOUND_CONFIG,
+    )
+
+
+class GoogleChatMessage(BaseModel):
+    """
+    Google Chat message structure.
+
+    Represents the core message data from Google Chat webhook.
+    """
+
+    model_config = _INBOUND_CONFIG
+
+    sender: GoogleChatSender = Field(
+        ...,
+        description="Message sender information",
+    )
+    # Must contain at least one non-whitespace character (checked in pydantic-core)
+    text: Annotated[str, StringConstraints(min_length=1, pattern=r"\S")] = Field(
+        ...,
+        description="Message text content",
+        examples=["Remember that I prefer Python"],
+    )
+
+
+class GoogleChatWebhook(BaseModel):
+    """
+    Google Chat webhook payload.
+
+    This is the full payload received from Google Chat when a user sends a message.
+    We only extract and validate the fields we need (message.sender.email and
+    message.text). All other metadata (space, thread, etc.) is ignored for privacy.
+
+    Example payload:
+        {
+            "message": {
+                "sender": {"email": "user@example.com"},
+                "text": "Remember that I prefer Python",
+                "space": {"name": "spaces/xxx"},  # ← Ignored
+                "thread": {"name": "spaces/xxx/threads/yyy"}  # ← Ignored
+            }
+        }
+    """
+
+    model_config = _INBOUND_CONFIG
+
+    message: GoogleChatMessage = Field(
+        ...,
+        description="Message content and sender",
+    )
+
+    # Note: We intentionally do NOT define space, thread, or other Google Chat
+    # metadata fields. Pydantic will accept them in the payload but won't
+    # include them in our model. This is a privacy feature - we never pass
+    # Google Chat metadata to the LLM.
+
+
+# Validator is built once at import so every request reuses the compiled
+# pydantic-core schema instead of going through the BaseModel class path.
+_WEBHOOK_ADAPTER = TypeAdapter(GoogleChatWebhook)
+
+
+def parse_webhook(raw: bytes | str) -> GoogleChatWebhook:
+    """
+    Parse and validate a raw Google Chat webhook body in a single pass.
+
+    pydantic-core parses the JSON and validates it in one step, so no
+    intermediate dict is built.
+
+    Args:
+        raw: Request body as received from Google Chat
+
+    Returns:
+        Validated GoogleChatWebhook
+
+    Raises:
+        ValidationError: If the body is not valid JSON or fails validation
+    """
+    return _WEBHOOK_ADAPTER.validate_json(raw)
@@ -0,0 +1,247 @@
+"""
+Outbound Pydantic models for Gateway module.
+
+This module defines response models for:
+- Google Chat response (outgoing, legacy and Workspace Add-on formats)
+- Health check response
+- Cron tick response
+
+Route handlers import it lazily, and every model sets defer_build=True, so
+pydantic-core schemas are only built when an endpoint first responds - not
+during Cloud Run cold start.
+"""
+
+from datetime import datetime
+from typing import Annotated, Any, Literal, TypedDict
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+
+# Deferred: schemas are built when a model is first validated or serialized.
+_OUTBOUND_CONFIG = ConfigDict(defer_build=True)
+
+
+class GoogleChatResponse(BaseModel):
+    """
+    Google Chat response (Cards V2 format) - Legacy format.
+
+    This is the legacy response format for Google Chat. The simplest Cards V2
+    format is just {"text": "response"}. More complex cards (buttons, images)
+    can be added in future phases.
+
+    Google Chat has a 4096 character limit for Cards V2 text.
+    Gateway truncates at 4000 to leave room for formatting.
+    
+    Note: For new deployments, use build_workspace_response() instead.
+    """
+
+    model_config = _OUTBOUND_CONFIG
+
+    # Gateway truncates at 4000 chars before creating this model; the
+    # constraint is defense in depth.
+    text: Annotated[str, StringConstraints(max_length=4000)] = Field(
+        ...,
+        description="Response text to display in Google Chat",
+        examples=["✅ I'll remember that. Stored: code_language_preference = Python"],
+    )
+
+
+class WorkspaceMessage(TypedDict):
+    """Message to create."""
+
+    text: str
+
+
+class CreateMessageAction(TypedDict):
+    """Message creation action."""
+
+    message: WorkspaceMessage
+
+
+class ChatDataAction(TypedDict):
+    """Chat data action wrapper."""
+
+    createMessageAction: CreateMessageAction
+
+
+class HostAppDataAction(TypedDict):
+    """Host app data action wrapper."""
+
+    chatDataAction: ChatDataAction
+
+
+class GoogleChatWorkspaceResponse(TypedDict):
+    """
+    Google Chat Workspace Add-on response format (modern format).
+
+    This is the modern format required for Google Workspace Add-ons.
+    It uses a nested structure for better integration with Workspace apps.
+
+    The server controls every field, so this is a plain TypedDict rather than
+    a validated model.
+
+    Example JSON:
+        {
+            "hostAppDataAction": {
+                "chatDataAction": {
+                    "createMessageAction": {
+                        "message": {"text": "Response text"}
+                    }
+                }
+            }
+        }
+    """
+
+    hostAppDataAction: HostAppDataAction
+
+
+def build_workspace_response(text: str) -> GoogleChatWorkspaceResponse:
+    """
+    Build a Workspace Add-on response from plain text.
+
+    Args:
+        text: Response text to send
+
+    Returns:
+        GoogleChatWorkspaceResponse dict
+
+    Raises:
+        ValueError: If text exceeds 4000 characters
+
+    Example:
+        >>> build_workspace_response("Hello!")["hostAppDataAction"]["chatDataAction"]
+        {'createMessageAction': {'message': {'text': 'Hello!'}}}
+    """
+    if len(text) > 4000:
+        raise ValueError("Response text exceeds 4000 character limit for Google Chat")
+
+    return {"hostAppDataAction": {"chatDataAction": {"createMessageAction": {"message": {"text": text}}}}}
+
+
+# Only the text varies, so the envelope around it is encoded once.
+_WORKSPACE_PREFIX, _WORKSPACE_SUFFIX = orjson.dumps(
+    {"hostAppDataAction": {"chatDataAction": {"createMessageAction": {"message": {"text": None}}}}}
+).split(b"null")
+
+
+def build_workspace_response_json(text: str) -> bytes:
+    """
+    Build a Workspace Add-on response body as JSON bytes.
+
+    Splices the JSON-escaped text between a pre-encoded prefix and suffix
+    instead of serializing the nested dicts on every call.
+
+    Args:
+        text: Response text to send
+
+    Returns:
+        UTF-8 encoded JSON body
+
+    Raises:
+        ValueError: If text exceeds 4000 characters
+    """
+    if len(text) > 4000:
+        raise ValueError("Response text exceeds 4000 character limit for Google Chat")
+
+    return _WORKSPACE_PREFIX + orjson.dumps(text) + _WORKSPACE_SUFFIX
+
+
+class HealthCheckResponse(BaseModel):
+    """
+    Health check response.
+
+    Used by Cloud Run to determine if the service is healthy.
+    Returns 200 OK if healthy, 503 Service Unavailable if unhealthy.
+    """
+
+    model_config = _OUTBOUND_CONFIG
+
+    status: Literal["healthy", "unhealthy"] = Field(
+        ...,
+        description="Overall health status: 'healthy' or 'unhealthy'",
+        examples=["healthy", "unhealthy"],
+    )
+    timestamp: datetime = Field(
+        ...,
+        description="Current timestamp (serialized as ISO8601)",
+        examples=["2026-02-11T22:00:00Z"],
+    )
+    version: str = Field(
+        default="1.0.0",
+        description="Application version",
+    )
+    checks: dict[str, str] = Field(
+        default_factory=dict,
+        description="Component health checks (component_name -> status)",
+        examples=[{"agent_core": "ok", "llm": "ok", "gcs": "ok"}],
+    )
+
+
+class CronTickResponse(BaseModel):
+    """
+    Response from /cron/tick endpoint.
+    
+    Returns summary metrics about the scheduler tick execution.
+    Used by Cloud Scheduler to verify successful execution.
+    """
+
+    model_config = _OUTBOUND_CONFIG
+
+    status: Literal["success", "error"] = Field(
+        ...,
+        description="Execution status: 'success' or 'error'",
+        examples=["success", "error"],
+    )
+    timestamp: datetime = Field(
+        ...,
+        description="Tick execution timestamp (serialized as ISO8601)",
+        examples=["2026-02-11T22:00:00Z"],
+    )
+    trace_id: str = Field(
+        ...,
+        description="Trace ID for this tick execution",
+        examples=["abc-123-def-456"],
+    )
+    metrics: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Execution metrics",
+        examples=[{
+            "jobs_checked": 10,
+            "jobs_due": 2,
+            "jobs_executed": 2,
+            "jobs_succeeded": 1,
+            "jobs_failed": 1,
+            "execution_time_ms": 1234
+        }],
+    )
+
+
+# Serializers are built on first use per model and then reused for every
+# response, instead of going through the BaseModel class path.
+_RESPONSE_MODELS: frozenset[type[BaseModel]] = frozenset(
+    {GoogleChatResponse, HealthCheckResponse, CronTickResponse}
+)
+_RESPONSE_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {}
+
+
+def dump_response(obj: BaseModel) -> bytes:
+    """
+    Serialize a Gateway response model to JSON bytes.
+
+    Args:
+        obj: GoogleChatResponse, HealthCheckResponse or CronTickResponse
+             instance
+
+    Returns:
+        UTF-8 encoded JSON body
+
+    Raises:
+        KeyError: If obj is not one of the Gateway response models
+    """
+    cls = type(obj)
+    adapter = _RESPONSE_ADAPTERS.get(cls)
+    if adapter is None:
+        if cls not in _RESPONSE_MODELS:
+            raise KeyError(cls)
+        adapter = _RESPONSE_ADAPTERS[cls] = TypeAdapter(cls)
+    return adapter.dump_json(obj)
@@ -13,11 +13,16 @@ Key security properties:
 This code has 100% test coverage requirement.
 """
 
+import functools
 import hashlib
-from typing import Any, TypedDict
+import operator
+from collections.abc import Iterable
+from typing import Any, NamedTuple
 
+from src.gateway.models_request import GoogleChatWebhook, parse_webhook
 
-class FilteredMessage(TypedDict):
+
+class FilteredMessage(NamedTuple):
     """
     Filtered message with all PII removed.
 
@@ -35,6 +40,12 @@ class FilteredMessage(TypedDict):
     content: str
 
 
+# Prebuilt getters: "message" is looked up once and each step runs in C
+_get_message = operator.itemgetter("message")
+_get_sender_and_text = operator.itemgetter("sender", "text")
+_get_email = operator.itemgetter("email")
+
+
 def filter_google_chat_pii(webhook_payload: dict[str, Any]) -> FilteredMessage:
     """
     Extract only safe fields from Google Chat webhook and hash the email.
@@ -74,22 +85,92 @@ def filter_google_chat_pii(webhook_payload: dict[str, Any]) -> FilteredMessage:
         ...     }
         ... }
         >>> result = filter_google_chat_pii(webhook)
-        >>> result["user_id"]  # Hashed, not email
+        >>> result.user_id  # Hashed, not email
         'a1b2c3d4e5f6g7h8'
-        >>> result["content"]
+        >>> result.content
         'Remember that I prefer Python'
     """
     # Extract required fields from nested structure
     # Will raise KeyError if fields are missing (intentional - fail fast)
-    sender_email = webhook_payload["message"]["sender"]["email"]
-    message_text = webhook_payload["message"]["text"]
-
-    # Hash email to create anonymous, stable user_id
-    # SHA-256 produces 64-char hex string, we take first 16 for brevity
-    # 16 hex chars = 64 bits = 2^64 possible values (no collision risk at our scale)
-    hash_object = hashlib.sha256(sender_email.encode("utf-8"))
-    user_id = hash_object.hexdigest()[:16]
-
-    # Return ONLY safe fields - everything else is discarded
-    # No sender name, no display name, no space, no thread, no timestamps
-    return FilteredMessage(user_id=user_id, content=message_text)
+    sender, message_text = _get_sender_and_text(_get_message(webhook_payload))
+    sender_email = _get_email(sender)
+
+    # Hash email to create anonymous, stable user_id, and return ONLY safe
+    # fields - everything else is discarded (no sender name, no display name,
+    # no space, no thread, no timestamps). Built inline to keep this
+    # per-request path to a single Python frame.
+    return FilteredMessage(_hash_email(sender_email), message_text)
+
+
+def filter_google_chat_webhook(webhook: GoogleChatWebhook) -> FilteredMessage:
+    """
+    Filter PII from an already validated webhook model.
+
+    Reads the sender email and text straight off the model, so callers that
+    have parsed the request don't need to dump it back to a dict.
+
+    Args:
+        webhook: Validated Google Chat webhook
+
+    Returns:
+        FilteredMessage with only user_id (hashed) and content.
+    """
+    message = webhook.message
+    return FilteredMessage(_hash_email(message.sender.email), message.text)
+
+
+def filter_google_chat_pii_json(raw: bytes | str) -> FilteredMessage:
+    """
+    Filter PII directly from a raw webhook body.
+
+    The body is parsed and validated in one pass by pydantic-core; no
+    intermediate dict is built.
+
+    Args:
+        raw: Raw Google Chat webhook JSON
+
+    Returns:
+        FilteredMessage with only user_id (hashed) and content.
+
+    Raises:
+        ValidationError: If the body is not valid JSON or is missing
+                        message.sender.email / message.text.
+    """
+    message = parse_webhook(raw).message
+    return FilteredMessage(_hash_email(message.sender.email), message.text)
+
+
+def hash_emails(emails: Iterable[str]) -> list[str]:
+    """
+    Hash many emails to user_ids in one call.
+
+    Batch entry point for replay/offline paths (e.g. scheduler jobs keyed by
+    user). Goes through the same memoized hash as the per-message filters, so
+    repeated emails in a batch are hashed once, and a vectorized backend can
+    later be dropped in here without touching callers.
+
+    Args:
+        emails: Sender emails
+
+    Returns:
+        user_ids in the same order as emails
+    """
+    return list(map(_hash_email, emails))
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_email(email: str) -> str:
+    """
+    Hash an email to a 16-char user_id.
+
+    Senders repeat constantly, so results are memoized. The cache is bounded
+    so adversarial input can't grow it without limit.
+    """
+    # The utf-8 encode only runs on cache misses; repeat senders never reach it.
+    # First 8 bytes of SHA-256 = 16 hex chars = 64 bits = 2^64 possible values
+    # (no collision risk at our scale). Identical to hexdigest()[:16] without
+    # building the full 64-char hex string first.
+    # hashlib.sha256 is already OpenSSL's EVP implementation (SHA-NI/ARMv8 SHA
+    # where the CPU has it). usedforsecurity stays at its default: this hash
+    # anonymizes PII, so FIPS builds must keep treating it as a security use.
+    return hashlib.sha256(email.encode("utf-8")).digest()[:8].hex()
@@ -3,6 +3,7 @@ FastAPI server for Gateway module.
 
 This module implements the HTTP interface for Emonk:
 - POST /webhook: Handle Google Chat messages
+- POST /webhook/stream: Same, streaming the reply as it's generated
 - GET /health: Health check for Cloud Run
 
 Security layers:
@@ -11,48 +12,123 @@ Security layers:
 3. Agent Core processing (LLM + skills)
 """
 
-import json
+import functools
+import hmac
 import logging
 import os
-import uuid
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
 from datetime import UTC, datetime
+from typing import Any
 
+import orjson
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile, status
-from fastapi.responses import JSONResponse, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import ValidationError
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from src.gateway.batching import MicroBatcher
 from src.gateway.interfaces import AgentCoreInterface, AgentError
 from src.gateway.mocks import MockAgentCore
-from src.gateway.models import (
-    CronTickResponse,
-    GoogleChatResponse,
-    GoogleChatWebhook,
-    GoogleChatWorkspaceResponse,
-    HealthCheckResponse,
-)
-from src.gateway.pii_filter import filter_google_chat_pii
+from src.gateway.models_request import parse_webhook
+from src.gateway.pii_filter import FilteredMessage, filter_google_chat_webhook
 
 # Configure structured JSON logging
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s")
 logger = logging.getLogger(__name__)
 
 
+# Fields shared by every gateway log line
+_LOG_BASE = {"component": "gateway"}
+
+# Severity name → logging level number ("INFO" → 20, ...)
+_LOG_LEVELS = logging.getLevelNamesMapping()
+
+# Trace id of the request being handled; set once at handler entry and
+# added to every log_structured() line logged while handling it
+trace_id_var: ContextVar[str | None] = ContextVar("trace_id", default=None)
+
+
 def log_structured(level: str, message: str, **extra: str | int) -> None:
     """
     Log structured JSON for Cloud Logging.
 
+    The timestamp is passed to orjson as a datetime and serialized in C
+    (RFC 3339 with a "Z" suffix) rather than through datetime.isoformat().
+    The current request's trace_id is taken from trace_id_var, so call
+    sites only pass the fields specific to the line.
+
     Args:
         level: Log level (INFO, WARNING, ERROR, etc.)
         message: Log message
         **extra: Additional fields to include in log entry
     """
+    levelno = _LOG_LEVELS[level]
+    if not logger.isEnabledFor(levelno):
+        # Skip building and serializing lines the logger would drop
+        return
+
     log_entry = {
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": datetime.now(UTC),
         "severity": level,
         "message": message,
-        "component": "gateway",
-        **extra,
+        **_LOG_BASE,
     }
-    getattr(logger, level.lower())(json.dumps(log_entry))
+    trace_id = trace_id_var.get()
+    if trace_id is not None:
+        log_entry["trace_id"] = trace_id
+    log_entry.update(extra)
+    logger.log(levelno, orjson.dumps(log_entry, option=orjson.OPT_UTC_Z).decode())
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Used as the app's default_response_class so plain data returned from
+    endpoints skips the stdlib json.dumps pass. Datetimes are emitted as
+    ISO8601 with a "Z" suffix for UTC, matching the Pydantic models.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes with orjson."""
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+# Longest caller-supplied X-Trace-Id accepted; anything else gets a fresh id
+_MAX_TRACE_ID_LEN = 64
+
+
+class TraceIdMiddleware:
+    """
+    Assign each HTTP request a trace_id once, at entry.
+
+    Reuses the caller's X-Trace-Id header when present (so traces correlate
+    across services), otherwise generates a 128-bit hex id. The id is stored
+    on request.state.trace_id and bound to trace_id_var, so handlers and the
+    global exception handler share it instead of generating their own.
+
+    Plain ASGI rather than @app.middleware("http"), which would wrap every
+    request in BaseHTTPMiddleware's extra task and stream plumbing.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            trace_id = None
+            for name, value in scope["headers"]:
+                if name == b"x-trace-id":
+                    if 0 < len(value) <= _MAX_TRACE_ID_LEN:
+                        trace_id = value.decode("latin-1")
+                    break
+            if trace_id is None:
+                trace_id = os.urandom(16).hex()
+            scope.setdefault("state", {})["trace_id"] = trace_id
+            trace_id_var.set(trace_id)
+        await self.app(scope, receive, send)
 
 
 # Create FastAPI application
@@ -60,17 +136,106 @@ app = FastAPI(
     title="Emonk Gateway",
     version="1.0.0",
     description="HTTP interface for Emonk AI agent framework",
+    default_response_class=OrjsonResponse,
 )
+app.add_middleware(TraceIdMiddleware)
 
 # For Sprint 1: Use mock Agent Core
 # Story 4 (Integration) will wire real Agent Core implementation
 agent_core: AgentCoreInterface = MockAgentCore()
 
+# Micro-batching of concurrent webhook → agent calls (agents exposing abatch()).
+# Off by default (BATCH_MAX_SIZE=1): LangGraph's abatch() only gathers
+# ainvoke() calls, and a batched call keeps running when its request is
+# cancelled. Raise it for agents with real batched inference.
+_BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "1"))
+_BATCH_MAX_LATENCY_MS = float(os.getenv("BATCH_MAX_LATENCY_MS", "5"))
+
+
+async def _abatch_agent(requests: list[tuple[dict, dict]]) -> list[Any]:
+    """Run queued (input, config) pairs through agent_core.abatch()."""
+    inputs = [agent_input for agent_input, _ in requests]
+    configs = [agent_config for _, agent_config in requests]
+    # Looked up at call time: create_app() swaps in the real agent after import
+    return await agent_core.abatch(inputs, config=configs, return_exceptions=True)
+
+
+_agent_batcher = MicroBatcher(
+    _abatch_agent,
+    max_batch_size=max(_BATCH_MAX_SIZE, 1),
+    max_latency_ms=_BATCH_MAX_LATENCY_MS,
+)
+
+# (agent, api) for the last agent_core seen by _agent_api()
+_agent_api_cache: tuple[object, str] | None = None
+
+
+def _agent_api(agent: object) -> str:
+    """
+    Resolve which call API an agent exposes.
+
+    The hasattr probes run once per agent object instead of on every
+    request. The cache is keyed on identity because create_app() (and
+    tests) replace agent_core after import.
+
+    Args:
+        agent: The current agent_core
+
+    Returns:
+        "abatch" (ainvoke via the micro-batcher), "ainvoke", "invoke",
+        or "process_message" for the legacy AgentCoreInterface
+    """
+    global _agent_api_cache
+    cached = _agent_api_cache
+    if cached is not None and cached[0] is agent:
+        return cached[1]
+
+    if hasattr(agent, "ainvoke"):
+        api = "abatch" if _BATCH_MAX_SIZE > 1 and hasattr(agent, "abatch") else "ainvoke"
+    elif hasattr(agent, "invoke"):
+        api = "invoke"
+    else:
+        api = "process_message"
+
+    _agent_api_cache = (agent, api)
+    return api
+
+
 SUPPORTED_VOICE_MIME_TYPES = {"audio/ogg", "audio/webm", "audio/mp4"}
 _VOICE_MAX_AUDIO_BYTES = int(os.getenv("VOICE_MAX_AUDIO_BYTES", str(10 * 1024 * 1024)))
 
 
-def truncate_response(text: str, max_length: int = 4000) -> str:
+@functools.lru_cache(maxsize=8)
+def _parse_allowed_users(allowed_users_str: str) -> frozenset[str]:
+    """
+    Parse the ALLOWED_USERS env value into a set of emails.
+
+    Cached on the raw string, so the split/strip work happens once per
+    distinct value while env changes (hot-toggles, tests) still apply on
+    the next request. Blank entries are dropped so a trailing comma can't
+    allow an empty sender email.
+    """
+    return frozenset(email for email in map(str.strip, allowed_users_str.split(",")) if email)
+
+
+# /health is hit by every Cloud Run liveness probe and only the timestamp
+# varies, so the rest of the HealthCheckResponse body is encoded once.
+_HEALTHY_PREFIX, _HEALTHY_SUFFIX = orjson.dumps(
+    {
+        "status": "healthy",
+        "timestamp": None,
+        "version": "1.0.0",
+        "checks": {"agent_core": "ok"},
+    }
+).split(b"null")
+
+
+_TRUNCATION_MSG = "\n\n... (response truncated)"
+_MAX_RESPONSE_LEN = 4000
+_TRUNCATE_AT = _MAX_RESPONSE_LEN - len(_TRUNCATION_MSG)
+
+
+def truncate_response(text: str, max_length: int = _MAX_RESPONSE_LEN) -> str:
     """
     Truncate response text for Google Chat.
 
@@ -87,43 +252,37 @@ def truncate_response(text: str, max_length: int = 4000) -> str:
     if len(text) <= max_length:
         return text
 
-    # Truncation message length: "\n\n... (response truncated)" = 28 chars
-    truncation_message = "\n\n... (response truncated)"
-    truncate_at = max_length - len(truncation_message)
-
-    return text[:truncate_at] + truncation_message
+    truncate_at = _TRUNCATE_AT if max_length == _MAX_RESPONSE_LEN else max_length - len(_TRUNCATION_MSG)
+    return f"{text[:truncate_at]}{_TRUNCATION_MSG}"
 
 
-@app.post("/webhook", status_code=status.HTTP_200_OK)
-async def webhook(payload: GoogleChatWebhook):
+async def _authorize_webhook(request: Request) -> FilteredMessage:
     """
-    Handle Google Chat webhook.
+    Parse a Google Chat webhook, check the sender and strip PII.
 
-    Process flow:
-    1. Validate sender email against ALLOWED_USERS allowlist
-    2. Filter PII (hash email to user_id, strip Google Chat metadata)
-    3. Generate trace_id for request tracking
-    4. Call Agent Core to process message
-    5. Truncate response if needed (Google Chat limit: 4000 chars)
-    6. Format response for Google Chat Cards V2
+    Shared by /webhook and /webhook/stream (steps 0-2 of the webhook flow).
 
     Args:
-        payload: Google Chat webhook payload (validated by Pydantic)
+        request: Raw request carrying the Google Chat webhook payload
 
     Returns:
-        GoogleChatResponse with agent's response text
+        FilteredMessage with the hashed user_id and message content
 
     Raises:
+        RequestValidationError(422): If the payload fails validation
         HTTPException(401): If sender email not in ALLOWED_USERS
-        HTTPException(500): If Agent Core processing fails
+        HTTPException(500): If ALLOWED_USERS is not configured
     """
-    trace_id = str(uuid.uuid4())
+    raw = await request.body()
+    try:
+        payload = parse_webhook(raw)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False), body=raw) from e
 
     # Log incoming webhook (before PII filtering, so we have email for debugging)
     log_structured(
         "INFO",
         "Webhook received",
-        trace_id=trace_id,
         sender=payload.message.sender.email,
     )
 
@@ -134,19 +293,16 @@ async def webhook(payload: GoogleChatWebhook):
         log_structured(
             "ERROR",
             "ALLOWED_USERS env var not set",
-            trace_id=trace_id,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Server configuration error: ALLOWED_USERS not set",
         )
 
-    allowed_users = [email.strip() for email in allowed_users_str.split(",")]
-    if payload.message.sender.email not in allowed_users:
+    if payload.message.sender.email not in _parse_allowed_users(allowed_users_str):
         log_structured(
             "WARNING",
             "Unauthorized user attempted access",
-            trace_id=trace_id,
             sender=payload.message.sender.email,
         )
         raise HTTPException(
@@ -155,59 +311,83 @@ async def webhook(payload: GoogleChatWebhook):
         )
 
     # Security Layer 2: PII filtering
-    # Hash email to user_id, strip all Google Chat metadata
-    filtered = filter_google_chat_pii(payload.model_dump())
+    # Hash email to user_id, strip all Google Chat metadata.
+    # Runs inline on purpose: it's two attribute reads and an lru-cached
+    # SHA-256 of a short string (~1µs), far below the ~40µs thread hop that
+    # asyncio.to_thread() would add, so it never meaningfully blocks the loop.
+    filtered = filter_google_chat_webhook(payload)
 
     log_structured(
         "INFO",
         "PII filtered",
-        trace_id=trace_id,
-        user_id=filtered["user_id"],
-        content_length=len(filtered["content"]),
+        user_id=filtered.user_id,
+        content_length=len(filtered.content),
     )
 
+    return filtered
+
+
+@app.post("/webhook", status_code=status.HTTP_200_OK)
+async def webhook(request: Request):
+    """
+    Handle Google Chat webhook.
+
+    Process flow:
+    0. Parse and validate the raw body in one pass (422 on invalid payload)
+    1. Validate sender email against ALLOWED_USERS allowlist
+    2. Filter PII (hash email to user_id, strip Google Chat metadata)
+    3. Use the request's trace_id (assigned by TraceIdMiddleware)
+    4. Call Agent Core to process message
+    5. Truncate response if needed (Google Chat limit: 4000 chars)
+    6. Format response for Google Chat Cards V2
+
+    Args:
+        request: Raw request carrying the Google Chat webhook payload
+
+    Returns:
+        GoogleChatResponse with agent's response text
+
+    Raises:
+        RequestValidationError(422): If the payload fails validation
+        HTTPException(401): If sender email not in ALLOWED_USERS
+        HTTPException(500): If Agent Core processing fails
+    """
+    filtered = await _authorize_webhook(request)
+    trace_id = request.state.trace_id
+
     # Call Agent Core to process message
     try:
-        # Try new agent.ainvoke() API first (LangGraph)
-        if hasattr(agent_core, 'ainvoke'):
-            result = await agent_core.ainvoke(
-                {"messages": [{"role": "user", "content": filtered["content"]}]},
-                config={
-                    "configurable": {
-                        "thread_id": filtered["user_id"],
-                        "user_id": filtered["user_id"],
-                    }
-                },
-            )
-            # Extract response from result
-            response_message = result["messages"][-1]
-            response_text = response_message.content if hasattr(response_message, "content") else str(response_message)
-        elif hasattr(agent_core, 'invoke'):
-            # Try sync invoke
-            result = await agent_core.invoke(
-                {"messages": [{"role": "user", "content": filtered["content"]}]},
-                config={
-                    "configurable": {
-                        "thread_id": filtered["user_id"],
-                        "user_id": filtered["user_id"],
-                    }
-                },
+        api = _agent_api(agent_core)
+        if api == "process_message":
+            # Old process_message() API (AgentCoreInterface)
+            response_text = await agent_core.process_message(
+                user_id=filtered.user_id,
+                content=filtered.content,
+                trace_id=trace_id,
             )
+        else:
+            # LangGraph agent.ainvoke() / invoke() API
+            agent_input = {"messages": [{"role": "user", "content": filtered.content}]}
+            agent_config = {
+                "configurable": {
+                    "thread_id": filtered.user_id,
+                    "user_id": filtered.user_id,
+                }
+            }
+            if api == "abatch":
+                # Coalesce with concurrent webhooks into one abatch() call
+                result = await _agent_batcher.submit((agent_input, agent_config))
+            elif api == "ainvoke":
+                result = await agent_core.ainvoke(agent_input, config=agent_config)
+            else:
+                result = await agent_core.invoke(agent_input, config=agent_config)
             # Extract response from result
             response_message = result["messages"][-1]
             response_text = response_message.content if hasattr(response_message, "content") else str(response_message)
-        else:
-            # Fall back to old process_message() API
-            response_text = await agent_core.process_message(
-                user_id=filtered["user_id"],
-                content=filtered["content"],
-                trace_id=trace_id,
-            )
     except AgentError as e:
         log_structured(
             "ERROR",
             f"Agent Core processing failed: {e.message}",
-            trace_id=trace_id,
             error=str(e),
         )
         raise HTTPException(
@@ -218,7 +398,6 @@ async def webhook(payload: GoogleChatWebhook):
         log_structured(
             "ERROR",
             f"Unexpected error during Agent Core processing: {str(e)}",
-            trace_id=trace_id,
             error_type=type(e).__name__,
         )
         raise HTTPException(
@@ -232,22 +411,121 @@ async def webhook(payload: GoogleChatWebhook):
     log_structured(
         "INFO",
         "Webhook processed successfully",
-        trace_id=trace_id,
         response_length=len(response_text),
     )
 
+    # Outbound models load on first reply rather than at cold start
+    from src.gateway.models_response import build_workspace_response_json
+
     # Return response in appropriate format based on GOOGLE_CHAT_FORMAT env var
     chat_format = os.getenv("GOOGLE_CHAT_FORMAT", "workspace_addon")
 
     if chat_format == "workspace_addon":
-        return GoogleChatWorkspaceResponse.from_text(response_text)
+        return Response(
+            content=build_workspace_response_json(response_text),
+            media_type="application/json",
+        )
     else:
         # Legacy format for backward compatibility
-        return GoogleChatResponse(text=response_text)
+        # (GoogleChatResponse shape; text is already truncated to 4000 chars)
+        return OrjsonResponse({"text": response_text})
+
+
+@app.post("/webhook/stream", status_code=status.HTTP_200_OK)
+async def webhook_stream(request: Request) -> StreamingResponse:
+    """
+    Handle a Google Chat-shaped message and stream the reply as plain text.
+
+    Same validation, allowlist and PII filtering as /webhook, but the
+    agent's reply is sent token by token as the model generates it, so
+    clients that can render partial output see the first words after
+    first-token latency instead of full-generation latency. The reply is
+    not truncated or wrapped in a Chat card.
+
+    Args:
+        request: Raw request carrying the Google Chat webhook payload
+
+    Returns:
+        StreamingResponse of UTF-8 text chunks
+
+    Raises:
+        RequestValidationError(422): If the payload fails validation
+        HTTPException(401): If sender email not in ALLOWED_USERS
+    """
+    filtered = await _authorize_webhook(request)
+    return StreamingResponse(
+        _stream_agent_reply(filtered, request.state.trace_id),
+        media_type="text/plain; charset=utf-8",
+    )
+
+
+# Message types forwarded by /webhook/stream: streamed chunks, and whole
+# replies from models that don't stream (LangGraph emits each only once)
+_AI_MESSAGE_TYPES = frozenset({"AIMessageChunk", "ai"})
+
+
+async def _stream_agent_reply(filtered: FilteredMessage, trace_id: str) -> AsyncIterator[str]:
+    """
+    Yield the agent's reply to a filtered message as text chunks.
+
+    LangGraph agents are streamed with stream_mode="messages" and only the
+    model's AI messages are forwarded (tool output is not): token chunks
+    from streaming models, or one whole message from models that don't
+    stream. Agents without astream() yield their whole reply as one chunk.
+
+    Headers have already been sent when this runs, so an agent failure is
+    logged and ends the stream rather than becoming a 500.
+
+    Args:
+        filtered: PII-filtered message from _authorize_webhook()
+        trace_id: The request's trace_id
+
+    Yields:
+        Reply text chunks
+    """
+    response_length = 0
+    try:
+        if hasattr(agent_core, "astream"):
+            agent_input = {"messages": [{"role": "user", "content": filtered.content}]}
+            agent_config = {
+                "configurable": {
+                    "thread_id": filtered.user_id,
+                    "user_id": filtered.user_id,
+                }
+            }
+            async for message, _metadata in agent_core.astream(
+                agent_input, config=agent_config, stream_mode="messages"
+            ):
+                content = getattr(message, "content", None)
+                if getattr(message, "type", None) in _AI_MESSAGE_TYPES and isinstance(content, str) and content:
+                    response_length += len(content)
+                    yield content
+        else:
+            response_text = await agent_core.process_message(
+                user_id=filtered.user_id,
+                content=filtered.content,
+                trace_id=trace_id,
+            )
+            response_length = len(response_text)
+            yield response_text
+    except Exception as e:
+        log_structured(
+            "ERROR",
+            f"Agent Core streaming failed: {str(e)}",
+            error_type=type(e).__name__,
+        )
+        return
+
+    log_structured(
+        "INFO",
+        "Webhook stream completed",
+        response_length=response_length,
+    )
 
 
 @app.post("/voice", status_code=status.HTTP_200_OK)
 async def voice(
+    request: Request,
     audio: UploadFile = File(...),  # noqa: B008
     mime_type: str = Form(default="audio/ogg"),  # noqa: B008
     user_email: str = Form(...),  # noqa: B008
@@ -276,7 +554,7 @@ async def voice(
         503: STT/TTS API unavailable
         500: Agent processing failed
     """
-    trace_id = str(uuid.uuid4())
+    trace_id = request.state.trace_id
 
     # Check VOICE_ENABLED at request time (allows hot-toggle without redeploy)
     if os.getenv("VOICE_ENABLED", "false").lower() != "true":
@@ -286,10 +564,8 @@ async def voice(
         )
 
     # Allowlist check
-    allowed_users_str = os.getenv("ALLOWED_USERS", "")
-    allowed_users = [e.strip() for e in allowed_users_str.split(",") if e.strip()]
-    if user_email not in allowed_users:
-        log_structured("WARNING", "Unauthorized voice attempt", trace_id=trace_id)
+    if user_email not in _parse_allowed_users(os.getenv("ALLOWED_USERS", "")):
+        log_structured("WARNING", "Unauthorized voice attempt")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Unauthorized user",
@@ -324,7 +600,6 @@ async def voice(
     log_structured(
         "INFO",
         "Voice audio received",
-        trace_id=trace_id,
         audio_length_bytes=len(audio_bytes),
         mime_type=mime_type,
     )
@@ -355,7 +630,7 @@ async def voice(
 
     # Agent invocation
     try:
-        if hasattr(agent_core, "ainvoke"):
+        if _agent_api(agent_core) in ("abatch", "ainvoke"):
             result = await agent_core.ainvoke(
                 {"messages": [{"role": "user", "content": transcript_in}]},
                 config={"configurable": {"thread_id": user_email}},
@@ -376,7 +651,6 @@ async def voice(
         log_structured(
             "ERROR",
             f"Agent failed during voice processing: {e}",
-            trace_id=trace_id,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -387,7 +661,7 @@ async def voice(
     try:
         audio_out = await voice_handler.synthesize(response_text)
     except Exception as e:
-        log_structured("ERROR", f"TTS synthesis failed: {e}", trace_id=trace_id)
+        log_structured("ERROR", f"TTS synthesis failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Text-to-speech service unavailable",
@@ -396,7 +670,6 @@ async def voice(
     log_structured(
         "INFO",
         "Voice request completed",
-        trace_id=trace_id,
         response_length=len(response_text),
     )
 
@@ -411,8 +684,8 @@ async def voice(
     )
 
 
-@app.post("/cron/tick", response_model=CronTickResponse, status_code=status.HTTP_200_OK)
-async def cron_tick(request: Request) -> CronTickResponse:
+@app.post("/cron/tick", status_code=status.HTTP_200_OK)
+async def cron_tick(request: Request) -> Response:
     """
     Handle Cloud Scheduler tick for background job execution.
 
@@ -437,13 +710,12 @@ async def cron_tick(request: Request) -> CronTickResponse:
         HTTPException(401): If authentication fails
         HTTPException(500): If scheduler execution fails
     """
-    trace_id = str(uuid.uuid4())
+    trace_id = request.state.trace_id
     start_time = datetime.now(UTC)
 
     log_structured(
         "INFO",
         "Cron tick received",
-        trace_id=trace_id,
     )
 
     # Authentication: Check for Cloud Scheduler headers or OIDC token
@@ -460,19 +732,18 @@ async def cron_tick(request: Request) -> CronTickResponse:
             log_structured(
                 "WARNING",
                 "Unauthorized cron tick attempt - missing auth",
-                trace_id=trace_id,
             )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Unauthorized: Missing authentication",
             )
 
-        token = auth_header.split(" ")[1]
-        if token != cron_secret:
+        # Constant-time compare (bytes, since str requires ASCII-only input)
+        token = auth_header.removeprefix("Bearer ")
+        if not hmac.compare_digest(token.encode(), cron_secret.encode()):
             log_structured(
                 "WARNING",
                 "Unauthorized cron tick attempt - invalid token",
-                trace_id=trace_id,
             )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -486,18 +757,25 @@ async def cron_tick(request: Request) -> CronTickResponse:
             log_structured(
                 "ERROR",
                 "Scheduler not initialized in agent core",
-                trace_id=trace_id,
             )
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Scheduler not initialized",
             )
 
-        # Run single tick (will add this method to scheduler)
+        # Run single tick; expected failures come back as ok=False, not raised
         tick_result = await agent_core.scheduler.run_tick()
 
         execution_time_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
 
+        if not tick_result.get("ok", True):
+            return _cron_tick_error(
+                trace_id,
+                tick_result.get("error", "Scheduler tick failed"),
+                tick_result.get("error_type", "SchedulerError"),
+                execution_time_ms,
+            )
+
         metrics = {
             "jobs_checked": tick_result.get("jobs_checked", 0),
             "jobs_due": tick_result.get("jobs_due", 0),
@@ -510,42 +788,63 @@ async def cron_tick(request: Request) -> CronTickResponse:
         log_structured(
             "INFO",
             "Cron tick completed successfully",
-            trace_id=trace_id,
             **metrics,
         )
 
-        return CronTickResponse(
-            status="success",
-            timestamp=datetime.now(UTC).isoformat(),
-            trace_id=trace_id,
-            metrics=metrics,
+        # CronTickResponse shape, built as a plain dict
+        return OrjsonResponse(
+            {
+                "status": "success",
+                "timestamp": datetime.now(UTC),
+                "trace_id": trace_id,
+                "metrics": metrics,
+            }
         )
 
     except Exception as e:
+        # Last resort for unexpected failures (e.g. a scheduler that raises)
         execution_time_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
+        return _cron_tick_error(trace_id, str(e), type(e).__name__, execution_time_ms)
 
-        log_structured(
-            "ERROR",
-            f"Cron tick failed: {str(e)}",
-            trace_id=trace_id,
-            error_type=type(e).__name__,
-            execution_time_ms=execution_time_ms,
-        )
 
-        return CronTickResponse(
-            status="error",
-            timestamp=datetime.now(UTC).isoformat(),
-            trace_id=trace_id,
-            metrics={
-                "error": str(e),
-                "error_type": type(e).__name__,
+def _cron_tick_error(
+    trace_id: str, error: str, error_type: str, execution_time_ms: int
+) -> Response:
+    """
+    Log a failed cron tick and build its CronTickResponse-shaped body.
+
+    Args:
+        trace_id: Request trace ID
+        error: Error message
+        error_type: Exception class name (or scheduler-reported type)
+        execution_time_ms: Time spent before the failure
+
+    Returns:
+        JSON response with status "error"
+    """
+    log_structured(
+        "ERROR",
+        f"Cron tick failed: {error}",
+        error_type=error_type,
+        execution_time_ms=execution_time_ms,
+    )
+
+    return OrjsonResponse(
+        {
+            "status": "error",
+            "timestamp": datetime.now(UTC),
+            "trace_id": trace_id,
+            "metrics": {
+                "error": error,
+                "error_type": error_type,
                 "execution_time_ms": execution_time_ms,
             },
-        )
+        }
+    )
 
 
-@app.get("/health", response_model=HealthCheckResponse)
-async def health() -> HealthCheckResponse:
+@app.get("/health")
+async def health() -> Response:
     """
     Health check endpoint for Cloud Run.
 
@@ -564,19 +863,19 @@ async def health() -> HealthCheckResponse:
     Returns:
         HealthCheckResponse with status and component checks
     """
-    # For Sprint 1: MockAgentCore is always available
+    # For Sprint 1: MockAgentCore is always available, so the body is the
+    # pre-encoded healthy response with only the timestamp spliced in.
     # Story 4 will add real health checks for Agent Core, LLM, GCS
-    checks = {"agent_core": "ok"}
+    timestamp = orjson.dumps(datetime.now(UTC), option=orjson.OPT_UTC_Z)
 
-    return HealthCheckResponse(
-        status="healthy",
-        timestamp=datetime.now(UTC).isoformat(),
-        checks=checks,
+    return Response(
+        content=_HEALTHY_PREFIX + timestamp + _HEALTHY_SUFFIX,
+        media_type="application/json",
     )
 
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Global exception handler for unhandled errors.
 
@@ -588,22 +887,23 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
         exc: Unhandled exception
 
     Returns:
-        JSONResponse with error details
+        JSON Response with error details
     """
-    trace_id = str(uuid.uuid4())
+    # Same id the failing handler logged with; generated only if the
+    # error happened before TraceIdMiddleware ran
+    trace_id = getattr(request.state, "trace_id", None) or os.urandom(16).hex()
 
     log_structured(
         "ERROR",
         f"Unhandled exception: {str(exc)}",
-        trace_id=trace_id,
         error_type=type(exc).__name__,
         path=str(request.url),
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
+    return OrjsonResponse(
+        {
             "error": "Internal server error",
             "trace_id": trace_id,
         },
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
     )
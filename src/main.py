@@ -13,49 +13,66 @@ Run with uvicorn:
     uvicorn src.main:app --reload --port 8080
 """
 
+from __future__ import annotations
+
+import asyncio
 import logging
 import os
+import threading
+from collections.abc import AsyncIterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from dotenv import load_dotenv
 
 # Load .env FIRST (before any imports that read env vars)
 load_dotenv()
 
-from google.cloud import aiplatform  # noqa: E402
-from langchain_google_vertexai import ChatVertexAI  # noqa: E402
-from langchain_core.tools import StructuredTool  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from pydantic import BaseModel, ConfigDict, Field  # noqa: E402
 
-from src.core.agent import build_agent  # noqa: E402
-from src.core.deepagent import build_deep_agent  # noqa: E402
-from src.core.config import load_bot_config  # noqa: E402
-from src.core.store import GCSStore, create_search_memory_tool  # noqa: E402
-from src.core.scheduler import create_storage  # noqa: E402
-from src.core.terminal import TerminalExecutor  # noqa: E402
 from src.gateway import server  # noqa: E402
-from src.skills.executor import SkillsEngine  # noqa: E402
-from src.skills.loader import SkillLoader  # noqa: E402
+
+# Vertex AI, LangChain and the agent/skills modules take seconds to import,
+# so they're imported inside the functions that use them rather than here.
+if TYPE_CHECKING:
+    from langchain_core.tools import StructuredTool
+
+    from src.core.interfaces import SkillResult
+    from src.core.terminal import TerminalExecutor
+    from src.skills.executor import SkillsEngine
 
 logger = logging.getLogger(__name__)
 
 
-def validate_env_vars() -> None:
+def validate_env_vars(env: Mapping[str, str] | None = None) -> None:
     """Validate required environment variables.
     
+    Also exports GOOGLE_APPLICATION_CREDENTIALS to os.environ as an
+    absolute path once the file is found.
+
+    Args:
+        env: Environment snapshot to validate (defaults to os.environ)
+
     Raises:
         RuntimeError: If any required env var is missing
     """
+    if env is None:
+        env = os.environ
+
     # Always required
     required_vars = ["ALLOWED_USERS"]
     
     # Check if using GCP-specific features
-    memory_backend = os.getenv("MEMORY_BACKEND", "local")
-    model_provider = os.getenv("MODEL_PROVIDER", "google_vertexai")
-    secrets_provider = os.getenv("SECRETS_PROVIDER", "env")
+    memory_backend = env.get("MEMORY_BACKEND", "local")
+    model_provider = env.get("MODEL_PROVIDER", "google_vertexai")
+    secrets_provider = env.get("SECRETS_PROVIDER", "env")
     
     # GOOGLE_APPLICATION_CREDENTIALS only required in development when using GCP features
     # In production (Cloud Run), the service account is automatically available
-    environment = os.getenv("ENVIRONMENT", "development")
+    environment = env.get("ENVIRONMENT", "development")
     uses_gcp = memory_backend == "gcs" or model_provider == "google_vertexai" or secrets_provider == "gcp_secret_manager"
     
     if environment == "development" and uses_gcp:
@@ -65,7 +82,7 @@ def validate_env_vars() -> None:
     if model_provider == "google_vertexai":
         required_vars.append("VERTEX_AI_PROJECT_ID")
     
-    missing = [var for var in required_vars if not os.getenv(var)]
+    missing = [var for var in required_vars if not env.get(var)]
     
     if missing:
         raise RuntimeError(
@@ -74,16 +91,144 @@ def validate_env_vars() -> None:
         )
     
     # Validate GOOGLE_APPLICATION_CREDENTIALS file exists (if required and set)
-    creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-    if creds_path and not Path(creds_path).exists():
-        raise RuntimeError(
-            f"GOOGLE_APPLICATION_CREDENTIALS file not found: {creds_path}\n"
-            f"Download from: https://console.cloud.google.com/iam-admin/serviceaccounts"
-        )
+    creds_path = env.get("GOOGLE_APPLICATION_CREDENTIALS")
+    if creds_path:
+        if not os.path.isfile(creds_path):
+            raise RuntimeError(
+                f"GOOGLE_APPLICATION_CREDENTIALS file not found: {creds_path}\n"
+                f"Download from: https://console.cloud.google.com/iam-admin/serviceaccounts"
+            )
+        # Export the absolute path so the Google SDKs (which read it lazily,
+        # possibly from other threads) don't depend on the working directory
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.path.abspath(creds_path)
     
     logger.info("✅ Environment variables validated")
 
 
+# Event loop on a daemon thread for sync skill tool calls; see _get_skill_loop()
+_skill_loop: asyncio.AbstractEventLoop | None = None
+_skill_loop_lock = threading.Lock()
+
+
+def _get_skill_loop() -> asyncio.AbstractEventLoop:
+    """Return the long-lived skill event loop, starting it on first use.
+
+    Sync tool calls submit skill coroutines here with
+    asyncio.run_coroutine_threadsafe() instead of paying asyncio.run()'s
+    loop setup and teardown on every call.
+
+    Uses uvloop (shipped with uvicorn[standard]) when it's installed, like
+    the server's own loop.
+
+    Returns:
+        Running event loop owned by the "skill-loop" daemon thread
+    """
+    global _skill_loop
+    with _skill_loop_lock:
+        if _skill_loop is None:
+            try:
+                import uvloop
+
+                loop = uvloop.new_event_loop()
+            except ImportError:
+                loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="skill-loop", daemon=True).start()
+            _skill_loop = loop
+    return _skill_loop
+
+
+# Skills take free-form CLI flags (documented in each SKILL.md), so every
+# skill tool shares this one schema instead of LangChain generating a model
+# class per tool. Flags can arrive nested under "arguments" or, since extra
+# keys are allowed, at the top level. The docstring is sent to the model.
+class SkillArgs(BaseModel):
+    """Command-line flags for the skill."""
+
+    model_config = ConfigDict(extra="allow")
+
+    arguments: dict[str, Any] = Field(
+        default_factory=dict,
+        description='Skill flags without the leading "--", e.g. {"query": "AI news"}',
+    )
+
+
+def _format_skill_result(result: SkillResult) -> str:
+    """Render a SkillResult as tool output text."""
+    if result.success:
+        return result.output
+    return f"Error: {result.error}"
+
+
+def _make_skill_tool(skills_engine: SkillsEngine, name: str, desc: str) -> StructuredTool:
+    """Wrap one skill as a LangChain tool with sync and async entry points.
+
+    Args:
+        skills_engine: Engine that executes the skill
+        name: Skill name (also the tool name)
+        desc: Tool description shown to the model
+
+    Returns:
+        StructuredTool bound to the skill
+    """
+    from langchain_core.tools import StructuredTool
+
+    def skill_tool(arguments: dict[str, Any] | None = None, **kwargs) -> str:
+        """Execute skill."""
+        # Sync path (agent.invoke): run on the shared skill loop
+        # rather than creating a new event loop per call
+        future = asyncio.run_coroutine_threadsafe(
+            skills_engine.execute_skill(name, {**(arguments or {}), **kwargs}),
+            _get_skill_loop(),
+        )
+        return _format_skill_result(future.result())
+
+    async def askill_tool(arguments: dict[str, Any] | None = None, **kwargs) -> str:
+        """Execute skill."""
+        # Async path (agent.ainvoke): awaited directly, so sibling
+        # tool calls in one turn run concurrently
+        result = await skills_engine.execute_skill(name, {**(arguments or {}), **kwargs})
+        return _format_skill_result(result)
+
+    # Use StructuredTool.from_function to explicitly set name and description
+    return StructuredTool.from_function(
+        func=skill_tool,
+        coroutine=askill_tool,
+        name=name,
+        description=desc,
+        args_schema=SkillArgs,
+    )
+
+
+def _warm_up_clients(model: Any, store: Any | None) -> None:
+    """Make a first call on the lazily connected clients.
+
+    ChatVertexAI resolves credentials and endpoints on its first request,
+    which otherwise lands on the first user turn. A one-token completion
+    pays that cost at startup instead, and a bucket lookup opens the GCS
+    connection pool. Failures are only logged; real requests retry.
+
+    Args:
+        model: Chat model to warm up
+        store: Optional GCSStore whose bucket to touch
+    """
+    try:
+        model.invoke(".", max_output_tokens=1)
+        logger.info("✅ Chat model warmed up")
+    except Exception as e:
+        logger.warning(f"⚠️  Chat model warm-up failed: {e}")
+
+    if store is not None:
+        try:
+            store.bucket.exists()
+            logger.info("✅ GCS Store warmed up")
+        except Exception as e:
+            logger.warning(f"⚠️  GCS Store warm-up failed: {e}")
+
+
+# Set by load_skills_as_tools(); its worker processes are stopped on shutdown
+_skills_engine: SkillsEngine | None = None
+
+
 def load_skills_as_tools(skills_dir: str, terminal_executor: TerminalExecutor) -> list:
     """Load skills as LangChain tools.
     
@@ -98,43 +243,43 @@ def load_skills_as_tools(skills_dir: str, terminal_executor: TerminalExecutor) -
     Returns:
         List of LangChain tool objects
     """
-    # Create skills engine
+    from src.skills.executor import SkillsEngine
+
+    global _skills_engine
+
+    # Create skills engine (skills_dir is scanned on first access below)
     skills_engine = SkillsEngine(terminal_executor, skills_dir=skills_dir)
+    _skills_engine = skills_engine
     
-    # Load skill metadata
-    loader = SkillLoader(skills_dir)
-    skill_metadata = loader.load_skills()
+    # Reuse the engine's metadata rather than scanning the directory again
+    skill_metadata = skills_engine.skills
     
-    # Convert each skill to a LangChain tool
-    tools = []
-    for skill_name, metadata in skill_metadata.items():
-        # Create a closure to capture skill_name for each tool
-        def make_tool(name: str, desc: str):
-            def skill_tool(**kwargs) -> str:
-                """Execute skill."""
-                # Execute skill via the engine
-                import asyncio
-                result = asyncio.run(skills_engine.execute_skill(name, kwargs))
-                if result.success:
-                    return result.output
-                else:
-                    return f"Error: {result.error}"
-            
-            # Use StructuredTool.from_function to explicitly set name and description
-            return StructuredTool.from_function(
-                func=skill_tool,
-                name=name,
-                description=desc,
-            )
-        
-        tools.append(make_tool(skill_name, metadata.get("description", "No description")))
+    # Convert each skill to a LangChain tool. Sorted by name so the tool
+    # declarations (the bulk of the request prefix) are byte-identical across
+    # restarts and instances, which lets Gemini's implicit prefix cache hit.
+    tools = [
+        _make_skill_tool(skills_engine, skill_name, metadata.get("description", "No description"))
+        for skill_name, metadata in sorted(skill_metadata.items())
+    ]
     
     logger.info(f"✅ Loaded {len(tools)} skills as LangChain tools")
     return tools
 
 
-def create_app():
+# Set by the first successful create_app(); later calls return it as-is
+_app: FastAPI | None = None
+_app_lock = threading.Lock()
+
+
+def create_app() -> FastAPI:
     """Create FastAPI app with LangChain v1 agent.
+
+    Blocking; run by lifespan() at server startup. Tests call it directly
+    to get an initialized app without starting a server.
+
+    Only the first call builds anything: the model, GCS clients, scheduler
+    and agent are created once and later calls return the same app, so a
+    second caller can't double startup cost or replace server.agent_core.
     
     Returns:
         FastAPI app ready to run
@@ -142,96 +287,158 @@ def create_app():
     Raises:
         RuntimeError: If configuration is invalid
     """
+    global _app
+    with _app_lock:
+        if _app is None:
+            _app = _build_app()
+        return _app
+
+
+def reset_app_for_tests() -> None:
+    """Forget the app built by create_app() so the next call rebuilds it."""
+    global _app
+    with _app_lock:
+        _app = None
+
+
+def _build_app() -> FastAPI:
+    """Build the agent, inject it into the gateway and return the app."""
+    from google.cloud import aiplatform
+    from langchain_google_vertexai import ChatVertexAI
+
+    from src.core.agent import build_agent
+    from src.core.config import load_bot_config
+    from src.core.scheduler import CronScheduler, create_storage
+    from src.core.store import GCSStore, create_search_memory_tool
+    from src.core.terminal import TerminalExecutor
+
     # Load bot configuration from bot.yaml (with defaults)
     load_bot_config()
+
+    # Snapshot the environment once bot.yaml has filled in defaults; the
+    # startup threads below then read an immutable copy
+    env = dict(os.environ)
     
     # Validate configuration
-    validate_env_vars()
-    
-    # Initialize Vertex AI (must happen before creating ChatVertexAI)
-    project_id = os.getenv("VERTEX_AI_PROJECT_ID")
-    location = os.getenv("VERTEX_AI_LOCATION", "us-central1")
-    
-    logger.info(f"Initializing Vertex AI: project={project_id}, location={location}")
-    aiplatform.init(project=project_id, location=location)
-    
-    # Create Vertex AI chat model (Gemini 2.5 Flash)
-    model = ChatVertexAI(
-        model_name="gemini-2.5-flash",
-        temperature=0.7,
-        max_output_tokens=8192,
-    )
-    logger.info("✅ Chat model created (Gemini 2.5 Flash)")
-    
-    # Create Terminal Executor (for legacy subprocess-based skills)
-    terminal_executor = TerminalExecutor()
-    logger.info("✅ Terminal Executor created")
-    
-    # Load skills as LangChain tools
-    skills_dir = os.getenv("SKILLS_DIR", "./skills")
-    tools = load_skills_as_tools(skills_dir, terminal_executor)
-    
-    # Create memory store based on configured backend
-    memory_backend = os.getenv("MEMORY_BACKEND", "local")
-    
-    store = None
-    if memory_backend == "gcs":
-        gcs_bucket = os.getenv("GCS_MEMORY_BUCKET")
+    validate_env_vars(env)
+    
+    project_id = env.get("VERTEX_AI_PROJECT_ID")
+    location = env.get("VERTEX_AI_LOCATION", "us-central1")
+    memory_backend = env.get("MEMORY_BACKEND", "local")
+    gcs_bucket = env.get("GCS_MEMORY_BUCKET")
+    memory_dir = env.get("MEMORY_DIR", "./data/memory")
+    scheduler_storage_type = env.get("SCHEDULER_STORAGE", "json")  # json or firestore
+    agent_impl = env.get("EMONK_AGENT_IMPL", "v1")  # v1 or legacy
+
+    def create_model():
+        # Initialize Vertex AI (must happen before creating ChatVertexAI)
+        logger.info(f"Initializing Vertex AI: project={project_id}, location={location}")
+        aiplatform.init(project=project_id, location=location)
+
+        # Create Vertex AI chat model (Gemini 2.5 Flash)
+        model = ChatVertexAI(
+            model_name="gemini-2.5-flash",
+            temperature=0.7,
+            max_output_tokens=8192,
+            streaming=True,  # Token chunks for /webhook/stream; invoke() still aggregates
+        )
+        logger.info("✅ Chat model created (Gemini 2.5 Flash)")
+        return model
+
+    def create_memory_store():
+        # Create memory store based on configured backend
+        if memory_backend != "gcs":
+            logger.info(f"Memory backend set to '{memory_backend}' - no persistent memory store")
+            return None
         if not gcs_bucket:
             logger.warning("⚠️  MEMORY_BACKEND is 'gcs' but GCS_MEMORY_BUCKET not set, falling back to no memory store")
+            return None
+        store = GCSStore(bucket_name=gcs_bucket, project_id=project_id)
+        logger.info(f"✅ GCS Store created (bucket={gcs_bucket})")
+        return store
+
+    def create_scheduler_storage():
+        # Create Scheduler Storage Backend
+        if scheduler_storage_type == "firestore":
+            scheduler_storage = create_storage("firestore", project_id=project_id)
+            logger.info("✅ Scheduler storage: Firestore")
         else:
-            store = GCSStore(bucket_name=gcs_bucket, project_id=project_id)
-            logger.info(f"✅ GCS Store created (bucket={gcs_bucket})")
-            
-            # Add search_memory tool
-            search_tool = create_search_memory_tool(store)
-            tools.append(search_tool)
-            logger.info("✅ search_memory tool added")
-    else:
-        logger.info(f"Memory backend set to '{memory_backend}' - no persistent memory store")
-    
-    # Create Scheduler Storage Backend
-    memory_dir = os.getenv("MEMORY_DIR", "./data/memory")
-    scheduler_storage_type = os.getenv("SCHEDULER_STORAGE", "json")  # json or firestore
-    scheduler_storage = None
+            scheduler_storage = create_storage("json", memory_dir=Path(memory_dir))
+            logger.info("✅ Scheduler storage: JSON files")
+        return scheduler_storage
+
+    # The Vertex AI, GCS and Firestore clients are independent and mostly
+    # wait on credential/network handshakes, so build them concurrently
+    # while this thread loads skills. Their modules are already imported
+    # above, on this thread; concurrent first imports can deadlock.
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="startup") as pool:
+        model_future = pool.submit(create_model)
+        store_future = pool.submit(create_memory_store)
+        scheduler_storage_future = pool.submit(create_scheduler_storage)
+
+        # Create Terminal Executor (for legacy subprocess-based skills)
+        terminal_executor = TerminalExecutor()
+        logger.info("✅ Terminal Executor created")
+
+        # Load skills as LangChain tools
+        skills_dir = env.get("SKILLS_DIR", "./skills")
+        tools = load_skills_as_tools(skills_dir, terminal_executor)
+
+        model = model_future.result()
+        store = store_future.result()
+        scheduler_storage = scheduler_storage_future.result()
+
+    if env.get("VERTEX_WARMUP", "true").lower() == "true":
+        # Off the startup path: the app can take traffic while this runs
+        threading.Thread(
+            target=_warm_up_clients, args=(model, store), name="warm-up", daemon=True
+        ).start()
+
+    if store is not None:
+        # Add search_memory tool
+        search_tool = create_search_memory_tool(store)
+        tools.append(search_tool)
+        logger.info("✅ search_memory tool added")
+
     scheduler = None
-    
-    if scheduler_storage_type == "firestore":
-        scheduler_storage = create_storage("firestore", project_id=project_id)
-        logger.info("✅ Scheduler storage: Firestore")
-    else:
-        scheduler_storage = create_storage("json", memory_dir=Path(memory_dir))
-        logger.info("✅ Scheduler storage: JSON files")
-    
+
     # Create scheduler instance if storage is available
     if scheduler_storage:
-        from src.core.scheduler import CronScheduler
         scheduler = CronScheduler(
             agent_state=store,
             check_interval_seconds=10,
             storage=scheduler_storage,
+            max_concurrent_jobs=int(env.get("CRON_WORKERS", "8")),
         )
     
-    # Try to build agent with build_deep_agent(), fall back to build_agent()
-    try:
-        # Check if skills directory exists
-        skills_list = None
-        if Path(skills_dir).exists():
-            skills_list = [skills_dir]
-            logger.info(f"✅ Skills directory found: {skills_dir}")
-        
-        agent = build_deep_agent(
-            model=model,
-            tools=tools,
-            system_prompt="",  # Default, can be customized per-deployment
-            skills=skills_list,
-            store=store,
-            scheduler=scheduler,
-        )
-        logger.info("✅ Agent built with build_deep_agent()")
-    except Exception as e:
-        logger.warning(f"⚠️  build_deep_agent() failed: {e}. Falling back to build_agent()")
-        # Fall back to old build_agent()
+    # Check if skills directory exists
+    skills_list = None
+    if Path(skills_dir).exists():
+        skills_list = [skills_dir]
+        logger.info(f"✅ Skills directory found: {skills_dir}")
+
+    # EMONK_AGENT_IMPL=legacy goes straight to build_agent(); the default
+    # ("v1") uses build_deep_agent() when its dependencies and config are
+    # present, falling back to build_agent() if it still fails
+    agent = None
+    if agent_impl != "legacy":
+        from src.core import deepagent
+
+        if deepagent.is_available():
+            try:
+                agent = deepagent.build_deep_agent(
+                    model=model,
+                    tools=tools,
+                    system_prompt="",  # Default, can be customized per-deployment
+                    skills=skills_list,
+                    store=store,
+                    scheduler=scheduler,
+                )
+                logger.info("✅ Agent built with build_deep_agent()")
+            except Exception as e:
+                logger.warning(f"⚠️  build_deep_agent() failed: {e}. Falling back to build_agent()")
+
+    if agent is None:
         agent = build_agent(
             model=model,
             tools=tools,
@@ -241,7 +448,7 @@ def create_app():
             store=store,
             scheduler_storage=scheduler_storage,
         )
-        logger.info("✅ Agent built with build_agent() (fallback)")
+        logger.info("✅ Agent built with build_agent()")
     
     # Note: Scheduler will be started by the application startup event
     # (see src/gateway/server.py for @app.on_event("startup"))
@@ -255,14 +462,43 @@ def create_app():
     return server.app
 
 
-# Create app instance (for uvicorn to import)
-# Only create if not in test environment
-if os.getenv("PYTEST_CURRENT_TEST"):
-    # In test environment - tests will call create_app() manually
-    app = None
-else:
-    # In production/development - create app immediately
-    app = create_app()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the agent when the server starts, not when this module is imported.
+
+    Importing src.main stays cheap, so uvicorn workers and --reload restarts
+    don't pay the Vertex AI / GCS / skills bring-up at import time. The
+    blocking create_app() runs on a worker thread; the GCS filesystem sync
+    attached by build_deep_agent() is pulled before the first request and
+    flushed on shutdown, when the heartbeat handler's HTTP client is closed
+    and the skill worker processes are stopped.
+
+    Args:
+        app: The gateway app being served
+    """
+    await asyncio.to_thread(create_app)
+
+    fs_sync = getattr(server.agent_core, "fs_sync", None)
+    heartbeat_handler = getattr(server.agent_core, "heartbeat_handler", None)
+    if fs_sync is not None:
+        await fs_sync.sync_from_gcs()
+        await fs_sync.start_periodic_sync()
+
+    try:
+        yield
+    finally:
+        if fs_sync is not None:
+            await fs_sync.close()
+        if heartbeat_handler is not None:
+            await heartbeat_handler.aclose()
+        if _skills_engine is not None:
+            await asyncio.to_thread(_skills_engine.close)
+
+
+# App instance for uvicorn to import. Serves the mock agent until the
+# lifespan startup above swaps in the real one.
+app = server.app
+app.router.lifespan_context = lifespan
 
 
 if __name__ == "__main__":
@@ -271,17 +507,17 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", "8080"))
     log_level = os.getenv("LOG_LEVEL", "INFO").lower()
     
-    print("=" * 60)
-    print("🚀 Starting Monkey-Bot with LangChain v1")
-    print("=" * 60)
-    print(f"Port: {port}")
-    print(f"Log level: {log_level}")
-    print(f"Allowed users: {os.getenv('ALLOWED_USERS', 'NOT SET')}")
-    print(f"Vertex AI Project: {os.getenv('VERTEX_AI_PROJECT_ID', 'NOT SET')}")
-    print(f"GCS Enabled: {os.getenv('GCS_ENABLED', 'false')}")
-    print(f"GCS Bucket: {os.getenv('GCS_MEMORY_BUCKET', 'NOT SET')}")
-    print("=" * 60)
-    print()
+    # Startup settings as one log record
+    logger.info(
+        "🚀 Starting Monkey-Bot with LangChain v1: port=%s, log_level=%s, "
+        "allowed_users=%s, vertex_ai_project=%s, gcs_enabled=%s, gcs_bucket=%s",
+        port,
+        log_level,
+        os.getenv("ALLOWED_USERS", "NOT SET"),
+        os.getenv("VERTEX_AI_PROJECT_ID", "NOT SET"),
+        os.getenv("GCS_ENABLED", "false"),
+        os.getenv("GCS_MEMORY_BUCKET", "NOT SET"),
+    )
     
     uvicorn.run(
         "src.main:app",
@@ -289,4 +525,10 @@ if __name__ == "__main__":
         port=port,
         log_level=log_level,
         reload=False,  # Disable reload for production
+        # Pinned rather than "auto" so a missing uvicorn[standard] extra fails
+        # at startup instead of silently falling back to asyncio/h11
+        loop="uvloop",
+        http="httptools",
+        # Requests are already logged as structured JSON by the gateway
+        access_log=False,
     )
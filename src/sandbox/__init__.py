@@ -13,47 +13,26 @@ Example:
 
 from __future__ import annotations
 
-# Try to import Modal backend
-try:
-    from .modal import (
-        ModalSandboxBackend,
-        SandboxError,
-        SandboxTimeoutError,
-        SandboxUnavailableError,
-    )
-
-    __all__ = [
-        "ModalSandboxBackend",
-        "SandboxError",
-        "SandboxTimeoutError",
-        "SandboxUnavailableError",
-    ]
-except ImportError:
-    # Modal not installed - provide helpful error message
-    class ModalSandboxBackend:  # type: ignore[no-redef]
-        """Placeholder for ModalSandboxBackend when modal is not installed."""
-
-        def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
-            raise ImportError(
-                "modal package required for sandbox execution. "
-                "Install with: pip install emonk[modal]"
-            )
-
-    class SandboxError(Exception):  # type: ignore[no-redef]
-        """Base sandbox error."""
-        pass
-
-    class SandboxTimeoutError(SandboxError):  # type: ignore[no-redef]
-        """Command exceeded timeout."""
-        pass
-
-    class SandboxUnavailableError(SandboxError):  # type: ignore[no-redef]
-        """Sandbox service unreachable."""
-        pass
-
-    __all__ = [
-        "ModalSandboxBackend",
-        "SandboxError",
-        "SandboxTimeoutError",
-        "SandboxUnavailableError",
-    ]
+from typing import Any
+
+__all__ = [
+    "ModalSandboxBackend",
+    "SandboxError",
+    "SandboxTimeoutError",
+    "SandboxUnavailableError",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exports on first access.
+
+    src.sandbox.modal imports the modal SDK (grpc, protobuf, ...), which
+    deployments without a sandbox shouldn't pay for. When modal isn't
+    installed, that module still defines the error classes and a
+    ModalSandboxBackend that raises ImportError on construction.
+    """
+    if name in __all__:
+        from . import modal
+
+        return getattr(modal, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
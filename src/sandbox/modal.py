@@ -23,16 +23,27 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import contextlib
+import io
 import logging
+import os
+import re
+import shlex
+import tarfile
+import uuid
 from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
-# Define fallback types (always available)
+# Define fallback types (always available). Slotted and frozen: grep_raw()
+# and ls_info() can return thousands of these small records
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecuteResponse:
     """Response from command execution."""
     output: str
@@ -40,7 +51,7 @@ class ExecuteResponse:
     truncated: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileInfo:
     """File metadata."""
     path: str
@@ -49,7 +60,7 @@ class FileInfo:
     modified_time: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WriteResult:
     """Result of write operation."""
     success: bool
@@ -57,7 +68,7 @@ class WriteResult:
     bytes_written: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EditResult:
     """Result of edit operation."""
     success: bool
@@ -65,7 +76,7 @@ class EditResult:
     changes_made: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GrepMatch:
     """Grep search result."""
     path: str
@@ -75,7 +86,7 @@ class GrepMatch:
     match_end: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileUploadResponse:
     """Response from file upload."""
     success: bool
@@ -83,7 +94,7 @@ class FileUploadResponse:
     bytes_uploaded: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileDownloadResponse:
     """Response from file download."""
     success: bool
@@ -134,11 +145,65 @@ class SandboxUnavailableError(SandboxError):
     pass
 
 
-DEFAULT_PIP_PACKAGES = [
+# In-flight file reads/writes per upload_files()/download_files() call, so a
+# large batch doesn't open more concurrent exec calls than a sandbox accepts
+MAX_CONCURRENT_TRANSFERS = 16
+
+# Python version of the auto-built sandbox image
+IMAGE_PYTHON_VERSION = "3.11"
+
+# Auto-built images, keyed on (pip packages, apt packages, Python version),
+# shared by every backend in the process
+_IMAGE_CACHE: dict[tuple, Any] = {}
+
+# Modal App handles, keyed on app name, so only the first backend per app
+# pays for the App.lookup() round trip
+_APP_CACHE: dict[str, Any] = {}
+
+# Live-sandbox limits, keyed on app name; created by the first backend that
+# sets max_sandboxes for that app
+_SANDBOX_SLOTS: dict[str, asyncio.Semaphore] = {}
+
+# Default cap on captured command output; anything past it is discarded
+MAX_OUTPUT_BYTES = 1024 * 1024
+
+# `find -printf` format for ls_info()/glob_info(): one NUL-terminated
+# "type<TAB>size<TAB>mtime<TAB>path" record per entry
+_FIND_RECORD_FORMAT = "'%y\\t%s\\t%T@\\t%p\\0'"
+
+# Characters with a special meaning in grep's default (basic) regex syntax
+_BRE_SPECIAL_CHARS = frozenset(".*[]^$\\")
+
+# `grep -Hn` output line: path:line_number:line. grep_raw() scans the whole
+# output once with finditer, skipping lines like "Binary file ... matches"
+_GREP_LINE_RE = re.compile(r"^([^:\n]+):(\d+):(.*)$", re.MULTILINE)
+
+# POSIX bracket classes and their Python equivalents, for _compile_bre()
+_BRE_CHAR_CLASSES = {
+    "alpha": "a-zA-Z",
+    "digit": "0-9",
+    "alnum": "a-zA-Z0-9",
+    "upper": "A-Z",
+    "lower": "a-z",
+    "xdigit": "0-9A-Fa-f",
+    "space": r"\s",
+    "blank": r" \t",
+    "punct": re.escape("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"),
+}
+
+# Upload scripts are split so no single exec command exceeds this many
+# characters (Linux caps one argv string at 128KB)
+MAX_UPLOAD_SCRIPT_CHARS = 96 * 1024
+
+# Heredoc terminator for base64 payloads; "_" isn't in the base64 alphabet,
+# so it can't appear as a line of file data
+_HEREDOC_END = "EMONK_EOF"
+
+DEFAULT_PIP_PACKAGES = (
     "requests",
     "beautifulsoup4",
     "pyyaml",
-]
+)
 
 
 class ModalSandboxBackend:
@@ -149,11 +214,14 @@ class ModalSandboxBackend:
     container environment.
 
     Features:
-        - Lazy initialization: Sandbox not started until first execute() call
+        - Early start: Sandbox boots in the background when created inside a
+          running event loop (eager_start), else on the first execute() call
         - Configurable resources: CPU, memory, timeout
         - Pre-installed packages: pip and apt packages
         - Environment variables: Custom env vars for sandbox
         - Custom image: Bring your own Modal image
+        - Shared app: Backends with the same app_name reuse one Modal App,
+          and max_sandboxes caps how many of their sandboxes run at once
 
     Requirements:
         - modal package: pip install emonk[modal]
@@ -169,7 +237,7 @@ class ModalSandboxBackend:
         ...     env_vars={"API_KEY": "secret"}
         ... )
         >>>
-        >>> # Sandbox starts on first execute() call
+        >>> # Sandbox boots in the background; execute() waits for it if needed
         >>> result = await sandbox.execute("python --version")
         >>> print(result.output)
         >>>
@@ -188,6 +256,9 @@ class ModalSandboxBackend:
         apt_packages: list[str] | None = None,
         env_vars: dict[str, str] | None = None,
         image: object | None = None,  # modal.Image
+        max_output_bytes: int = MAX_OUTPUT_BYTES,
+        eager_start: bool = True,
+        max_sandboxes: int | None = None,
     ):
         """Initialize Modal sandbox backend.
 
@@ -200,6 +271,13 @@ class ModalSandboxBackend:
             apt_packages: System packages to install (default: [])
             env_vars: Environment variables for sandbox (default: {})
             image: Custom Modal image (default: auto-built from packages)
+            max_output_bytes: Output kept per command before it is truncated
+                (default: 1 MiB)
+            eager_start: Start the sandbox in a background task right away
+                when called inside a running event loop (default: True)
+            max_sandboxes: Most sandboxes running at once across backends
+                with this app_name; start() waits for a free slot. The first
+                backend to set it for an app fixes the limit (default: no limit)
 
         Raises:
             ImportError: If modal package is not installed
@@ -214,14 +292,49 @@ class ModalSandboxBackend:
         self.timeout = timeout
         self.cpu = cpu
         self.memory_mb = memory_mb
-        self.pip_packages = pip_packages or DEFAULT_PIP_PACKAGES
-        self.apt_packages = apt_packages or []
+        # Tuples, so instances can't mutate the defaults (or each other's lists)
+        self.pip_packages = tuple(pip_packages) if pip_packages else DEFAULT_PIP_PACKAGES
+        self.apt_packages = tuple(apt_packages or ())
+        # _IMAGE_CACHE key, computed once rather than per start()
+        self._image_key = (
+            tuple(sorted(self.pip_packages)),
+            tuple(sorted(self.apt_packages)),
+            IMAGE_PYTHON_VERSION,
+        )
         self.env_vars = env_vars or {}
         self._custom_image = image
+        self.max_output_bytes = max_output_bytes
+        self.max_sandboxes = max_sandboxes
 
-        # Lazy initialization - sandbox not started until first execute()
         self._sandbox: Any = None
         self._sandbox_id: str | None = None
+        # The sandbox's terminate (or stop) method, bound by start()
+        self._terminate: Any = None
+        # The _SANDBOX_SLOTS semaphore this backend holds a slot in while
+        # its sandbox is running
+        self._slot: asyncio.Semaphore | None = None
+
+        # Persistent bash session for the filesystem helpers, opened on first
+        # use; False once the sandbox has refused to open one
+        self._shell: _ShellSession | None = None
+        self._shell_supported = True
+        # Held while opening the session, so concurrent first calls share one
+        self._shell_lock = asyncio.Lock()
+
+        # Boot in the background so it overlaps with the caller's own setup;
+        # without a running loop, the first execute() starts it instead
+        self._start_task: asyncio.Task[None] | None = None
+        if eager_start:
+            try:
+                self._start_task = asyncio.get_running_loop().create_task(self.start())
+            except RuntimeError:
+                pass
+            else:
+                # start() logs its own failures; don't warn about an
+                # unretrieved exception if nothing awaits the task
+                self._start_task.add_done_callback(
+                    lambda task: task.cancelled() or task.exception()
+                )
 
         logger.info(
             f"Initialized ModalSandboxBackend: {app_name}",
@@ -246,7 +359,10 @@ class ModalSandboxBackend:
         return self._sandbox_id
 
     async def execute(
-        self, command: str, timeout: int | None = None
+        self,
+        command: str,
+        timeout: int | None = None,
+        max_output_bytes: int | None = None,
     ) -> ExecuteResponse:
         """Execute a shell command in the sandbox.
 
@@ -256,6 +372,8 @@ class ModalSandboxBackend:
         Args:
             command: Shell command to execute
             timeout: Override default timeout for this command (seconds)
+            max_output_bytes: Override the output cap for this command, e.g.
+                to read only the head of a large output
 
         Returns:
             ExecuteResponse with output, exit_code, and truncated flag
@@ -276,15 +394,20 @@ class ModalSandboxBackend:
         # Use provided timeout or default
         cmd_timeout = timeout or self.timeout
 
-        logger.info(
-            f"Executing command in sandbox: {command[:100]}",
-            extra={
-                "component": "modal_sandbox",
-                "sandbox_id": self._sandbox_id,
-                "command_length": len(command),
-                "timeout": cmd_timeout,
-            },
-        )
+        # Hot path (file helpers can issue many commands): only build the
+        # log record and its extra dict when INFO is enabled
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "Executing command in sandbox: %.100s",
+                command,
+                extra={
+                    "component": "modal_sandbox",
+                    "sandbox_id": self._sandbox_id,
+                    "command_length": len(command),
+                    "timeout": cmd_timeout,
+                },
+            )
 
         try:
             # Execute command via Modal sandbox
@@ -293,24 +416,33 @@ class ModalSandboxBackend:
                 timeout=cmd_timeout,
             )
 
-            # Parse result
-            exit_code = result.returncode if hasattr(result, "returncode") else 0
-            output = result.stdout if hasattr(result, "stdout") else str(result)
-
-            # Check for truncation (Modal may truncate large outputs)
-            truncated = len(output) >= 1024 * 1024  # 1MB threshold
+            stdout = getattr(result, "stdout", None)
+            if stdout is None:
+                raise SandboxError(
+                    f"Unsupported Modal result type: {type(result).__name__}"
+                )
 
-            logger.info(
-                "Command executed successfully",
-                extra={
-                    "component": "modal_sandbox",
-                    "sandbox_id": self._sandbox_id,
-                    "exit_code": exit_code,
-                    "output_length": len(output),
-                    "truncated": truncated,
-                },
+            # Stop reading at max_output_bytes rather than buffering it all
+            output, truncated = await _read_capped(
+                stdout, max_output_bytes or self.max_output_bytes
             )
 
+            # A ContainerProcess only has a returncode once wait() returns
+            wait = getattr(result, "wait", None)
+            exit_code = await wait() if wait is not None else result.returncode
+
+            if log_info:
+                logger.info(
+                    "Command executed successfully",
+                    extra={
+                        "component": "modal_sandbox",
+                        "sandbox_id": self._sandbox_id,
+                        "exit_code": exit_code,
+                        "output_length": len(output),
+                        "truncated": truncated,
+                    },
+                )
+
             return ExecuteResponse(
                 output=output, exit_code=exit_code, truncated=truncated
             )
@@ -355,6 +487,12 @@ class ModalSandboxBackend:
         Raises:
             SandboxError: If sandbox fails to start
         """
+        # Wait out the background start rather than racing it for a slot
+        pending = self._start_task
+        if pending is not None and pending is not asyncio.current_task():
+            with contextlib.suppress(Exception):
+                await pending
+
         if self._sandbox is not None:
             logger.warning(
                 "Sandbox already started",
@@ -367,15 +505,31 @@ class ModalSandboxBackend:
             extra={"component": "modal_sandbox", "app_name": self.app_name},
         )
 
+        slot = None
+        if self.max_sandboxes is not None:
+            slot = _SANDBOX_SLOTS.get(self.app_name)
+            if slot is None:
+                slot = _SANDBOX_SLOTS[self.app_name] = asyncio.Semaphore(
+                    self.max_sandboxes
+                )
+            await slot.acquire()
+            # A concurrent start() may have finished while this one waited
+            if self._sandbox is not None:
+                slot.release()
+                return
+        self._slot = slot
+
         try:
             # Build image with dependencies
             image = self._custom_image or self._build_image()
+            app = self._lookup_app()
 
             # Create Modal sandbox
             # Note: Modal's Sandbox.create() API may vary by version
             # Try with environment parameter first, fall back to without
             try:
                 self._sandbox = modal.Sandbox.create(
+                    app=app,
                     image=image,
                     cpu=self.cpu,
                     memory=self.memory_mb,
@@ -385,6 +539,7 @@ class ModalSandboxBackend:
             except TypeError:
                 # Fallback for older Modal versions without environment parameter
                 self._sandbox = modal.Sandbox.create(
+                    app=app,
                     image=image,
                     cpu=self.cpu,
                     memory=self.memory_mb,
@@ -392,6 +547,10 @@ class ModalSandboxBackend:
                 )
 
             self._sandbox_id = getattr(self._sandbox, "object_id", "unknown")
+            # Resolved once: older Modal versions call it stop()
+            self._terminate = getattr(self._sandbox, "terminate", None) or getattr(
+                self._sandbox, "stop", None
+            )
 
             logger.info(
                 "Modal sandbox started",
@@ -403,6 +562,10 @@ class ModalSandboxBackend:
             )
 
         except Exception as e:
+            # No sandbox for stop() to clean up, so give the slot back here
+            if self._sandbox is None and self._slot is not None:
+                self._slot.release()
+                self._slot = None
             error_msg = f"Failed to start sandbox: {e}"
             logger.error(
                 error_msg,
@@ -427,6 +590,12 @@ class ModalSandboxBackend:
             ... finally:
             ...     await sandbox.stop()
         """
+        # Let a background start finish, so the sandbox it creates is stopped
+        if self._start_task is not None:
+            with contextlib.suppress(Exception):
+                await self._start_task
+            self._start_task = None
+
         if self._sandbox is None:
             logger.warning(
                 "Sandbox not started, nothing to stop",
@@ -444,10 +613,8 @@ class ModalSandboxBackend:
 
         try:
             # Terminate Modal sandbox
-            if hasattr(self._sandbox, "terminate"):
-                await self._sandbox.terminate()
-            elif hasattr(self._sandbox, "stop"):
-                await self._sandbox.stop()
+            if self._terminate is not None:
+                await self._terminate()
 
             logger.info(
                 "Modal sandbox stopped",
@@ -471,16 +638,113 @@ class ModalSandboxBackend:
         finally:
             self._sandbox = None
             self._sandbox_id = None
+            self._terminate = None
+            self._shell = None
+            if self._slot is not None:
+                self._slot.release()
+                self._slot = None
 
     async def _ensure_started(self) -> None:
         """Ensure sandbox is started (lazy initialization).
 
         This method is called before every execute() to ensure the sandbox
-        is running. It's a no-op if the sandbox is already started.
+        is running. It waits for a background start from the constructor if
+        one is pending, and is a no-op if the sandbox is already started.
         """
+        if self._start_task is not None:
+            try:
+                await self._start_task
+            finally:
+                self._start_task = None
         if self._sandbox is None:
             await self.start()
 
+    async def _shell_run(self, command: str) -> ExecuteResponse:
+        """Run a filesystem helper's command on the persistent shell.
+
+        Each exec() is a control-plane round-trip, so the helpers (read,
+        write, ls_info, ...) share one long-lived bash process per sandbox
+        instead and only pay a pipe write per command. Commands run one at a
+        time in a subshell, so they can't change the session's state. Until
+        the sandbox is started, or if it can't open a session, commands go
+        through execute().
+
+        Args:
+            command: Shell command to run
+
+        Returns:
+            ExecuteResponse with output, exit_code, and truncated flag
+
+        Raises:
+            SandboxTimeoutError: If the command exceeds self.timeout
+            SandboxUnavailableError: If the shell session died
+        """
+        if self._sandbox is None or not self._shell_supported:
+            return await self.execute(command)
+
+        if self._shell is None:
+            async with self._shell_lock:
+                # Another caller may have opened it (or given up) meanwhile
+                if self._shell is None and self._shell_supported:
+                    try:
+                        # setsid puts bash in its own process group, so close()
+                        # can kill it along with whatever command it is stuck on
+                        process = await self._sandbox.exec(
+                            "setsid", "-w", "bash", "--noprofile", "--norc"
+                        )
+                        shell = _ShellSession(process, self._sandbox)
+                        await asyncio.wait_for(shell.start(), timeout=self.timeout)
+                        self._shell = shell
+                    except Exception as e:
+                        logger.warning(
+                            f"Persistent shell unavailable, using exec per command: {e}",
+                            extra={"component": "modal_sandbox", "sandbox_id": self._sandbox_id},
+                        )
+                        self._shell_supported = False
+            if self._shell is None:
+                return await self.execute(command)
+
+        shell = self._shell
+        try:
+            return await asyncio.wait_for(
+                shell.run(command, self.max_output_bytes), timeout=self.timeout
+            )
+        except TimeoutError:
+            # The session is stuck mid-command; kill it and let the next call
+            # open a new one
+            self._shell = None
+            try:
+                await shell.close()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to kill timed-out shell session: {e}",
+                    extra={"component": "modal_sandbox", "sandbox_id": self._sandbox_id},
+                )
+            error_msg = f"Command exceeded {self.timeout}s timeout"
+            logger.error(
+                error_msg,
+                extra={"component": "modal_sandbox", "sandbox_id": self._sandbox_id},
+            )
+            raise SandboxTimeoutError(error_msg) from None
+        except SandboxUnavailableError:
+            self._shell = None
+            raise
+
+    def _lookup_app(self) -> Any:
+        """Return the Modal App for app_name, creating it if missing.
+
+        The handle is cached in _APP_CACHE, so later backends with the same
+        app_name skip the lookup.
+
+        Returns:
+            modal.App handle
+        """
+        app = _APP_CACHE.get(self.app_name)
+        if app is None:
+            app = modal.App.lookup(self.app_name, create_if_missing=True)
+            _APP_CACHE[self.app_name] = app
+        return app
+
     def _build_image(self) -> Any:
         """Build Modal image with dependencies.
 
@@ -489,9 +753,16 @@ class ModalSandboxBackend:
             - Pip packages from self.pip_packages
             - Apt packages from self.apt_packages
 
+        Images are cached per package set for the life of the process, so
+        restarts and other backends with the same packages reuse one.
+
         Returns:
             modal.Image configured with dependencies
         """
+        cached = _IMAGE_CACHE.get(self._image_key)
+        if cached is not None:
+            return cached
+
         logger.info(
             "Building Modal image",
             extra={
@@ -502,7 +773,7 @@ class ModalSandboxBackend:
         )
 
         # Start with Debian Slim base
-        image = modal.Image.debian_slim(python_version="3.11")
+        image = modal.Image.debian_slim(python_version=IMAGE_PYTHON_VERSION)
 
         # Install apt packages if any
         if self.apt_packages:
@@ -512,6 +783,7 @@ class ModalSandboxBackend:
         if self.pip_packages:
             image = image.pip_install(*self.pip_packages)
 
+        _IMAGE_CACHE[self._image_key] = image
         return image
 
     # ========================================================================
@@ -529,69 +801,64 @@ class ModalSandboxBackend:
             List of FileInfo objects with metadata
 
         Raises:
-            SandboxError: If ls command fails
+            SandboxError: If the listing command fails
         """
-        # Use ls with JSON output for easy parsing
-        command = f"ls -la --time-style=+%s '{path}' 2>&1"
-        result = await self.execute(command)
+        # One NUL-terminated "type<TAB>size<TAB>mtime<TAB>path" record per
+        # entry, so names with spaces or newlines need no parsing heuristics
+        command = (
+            f"find {shlex.quote(path)} -mindepth 1 -maxdepth 1 "
+            f"-printf {_FIND_RECORD_FORMAT} 2>&1"
+        )
+        result = await self._shell_run(command)
 
         if result.exit_code != 0:
             raise SandboxError(f"ls failed: {result.output}")
 
-        # Parse ls output into FileInfo objects
-        files = []
-        lines = result.output.strip().split("\n")
+        return _parse_find_records(result.output)
 
-        # Skip first line if it starts with "total"
-        start_idx = 1 if lines and lines[0].startswith("total") else 0
+    async def read(self, path: str) -> str:
+        """Read file contents.
 
-        for line in lines[start_idx:]:
-            if not line or not line.strip():
-                continue
+        Args:
+            path: File path to read
 
-            parts = line.split(None, 8)
-            if len(parts) < 9:
-                continue
+        Returns:
+            File contents as string
 
-            # Skip . and .. entries
-            name = parts[8]
-            if name in (".", ".."):
-                continue
+        Raises:
+            SandboxError: If read fails
+        """
+        result = await self._shell_run(f"cat {shlex.quote(path)} 2>&1")
 
-            is_dir = parts[0].startswith("d")
-            size = int(parts[4])
-            modified_time = float(parts[5])
+        if result.exit_code != 0:
+            raise SandboxError(f"read failed: {result.output}")
 
-            files.append(
-                FileInfo(
-                    path=f"{path}/{name}".replace("//", "/"),
-                    size=size,
-                    is_dir=is_dir,
-                    modified_time=modified_time,
-                )
-            )
+        return result.output
 
-        return files
-
-    async def read(self, path: str) -> str:
-        """Read file contents.
+    async def read_bytes(self, path: str) -> bytes:
+        """Read file contents exactly, including non-UTF-8 data.
 
         Args:
             path: File path to read
 
         Returns:
-            File contents as string
+            File contents as bytes
 
         Raises:
-            SandboxError: If read fails
+            SandboxError: If read fails or the file is too large to read
+                          within max_output_bytes
         """
-        command = f"cat '{path}' 2>&1"
-        result = await self.execute(command)
+        result = await self._shell_run(f"base64 -w0 {shlex.quote(path)} 2>&1")
 
         if result.exit_code != 0:
             raise SandboxError(f"read failed: {result.output}")
+        if result.truncated:
+            # A cut at a multiple of 4 still decodes, so check explicitly
+            raise SandboxError(
+                f"read failed: {path} exceeds the {self.max_output_bytes}-byte output limit"
+            )
 
-        return result.output
+        return base64.b64decode(result.output)
 
     async def write(self, path: str, content: str) -> WriteResult:
         """Write content to file.
@@ -606,17 +873,28 @@ class ModalSandboxBackend:
         Raises:
             SandboxError: If write fails
         """
-        # Escape content for shell
-        escaped_content = content.replace("'", "'\\''")
-        command = f"echo '{escaped_content}' > '{path}' 2>&1"
-        result = await self.execute(command)
+        return await self.write_bytes(path, content.encode("utf-8"))
+
+    async def write_bytes(self, path: str, data: bytes) -> WriteResult:
+        """Write bytes to file exactly.
+
+        Args:
+            path: File path to write
+            data: Content to write
+
+        Returns:
+            WriteResult with success status and bytes written
+
+        Raises:
+            SandboxError: If write fails
+        """
+        # Send content base64-encoded so it needs no shell escaping
+        result = await self._shell_run(_upload_script({path: data}))
 
         if result.exit_code != 0:
             raise SandboxError(f"write failed: {result.output}")
 
-        return WriteResult(
-            success=True, path=path, bytes_written=len(content.encode("utf-8"))
-        )
+        return WriteResult(success=True, path=path, bytes_written=len(data))
 
     async def edit(self, path: str, old_str: str, new_str: str) -> EditResult:
         """Edit file by replacing old_str with new_str.
@@ -632,19 +910,23 @@ class ModalSandboxBackend:
         Raises:
             SandboxError: If edit fails
         """
-        # Use sed for in-place editing
-        escaped_old = old_str.replace("/", "\\/").replace("'", "'\\''")
-        escaped_new = new_str.replace("/", "\\/").replace("'", "'\\''")
-        command = f"sed -i 's/{escaped_old}/{escaped_new}/g' '{path}' 2>&1"
-        result = await self.execute(command)
+        # Plain-string replace in Python: no sed regex or shell escaping of
+        # the strings, and the script reports how many occurrences it replaced
+        script = (
+            "import pathlib\n"
+            f"path, old, new = pathlib.Path({path!r}), {old_str!r}, {new_str!r}\n"
+            "text = path.read_text()\n"
+            "path.write_text(text.replace(old, new))\n"
+            "print(text.count(old))\n"
+        )
+        result = await self._shell_run(f"python3 -c {shlex.quote(script)} 2>&1")
 
         if result.exit_code != 0:
             raise SandboxError(f"edit failed: {result.output}")
 
-        # Count changes (approximate)
-        changes_made = 1  # sed doesn't report count easily
-
-        return EditResult(success=True, path=path, changes_made=changes_made)
+        return EditResult(
+            success=True, path=path, changes_made=int(result.output.strip())
+        )
 
     async def glob_info(self, pattern: str) -> list[FileInfo]:
         """Find files matching glob pattern.
@@ -658,36 +940,20 @@ class ModalSandboxBackend:
         Raises:
             SandboxError: If glob fails
         """
-        # Use find with pattern
-        command = f"find . -name '{pattern}' -ls 2>&1"
-        result = await self.execute(command)
+        # A bare name pattern matches file names at any depth (-name); one
+        # with a "/" matches the path from "." (-path), where find's "*"
+        # also crosses "/", so "**/" is folded into it
+        if "/" in pattern:
+            test = f"-path {shlex.quote('./' + pattern.replace('**/', '*'))}"
+        else:
+            test = f"-name {shlex.quote(pattern)}"
+        command = f"find . {test} -printf {_FIND_RECORD_FORMAT} 2>&1"
+        result = await self._shell_run(command)
 
         if result.exit_code != 0:
             raise SandboxError(f"glob failed: {result.output}")
 
-        # Parse find output
-        files = []
-        for line in result.output.strip().split("\n"):
-            if not line or not line.strip():
-                continue
-
-            parts = line.split(None, 10)
-            if len(parts) < 11:
-                continue
-
-            # find -ls format: inode blocks perms links owner group size date time name
-            is_dir = parts[2].startswith("d")
-            try:
-                size = int(parts[6])
-            except (ValueError, IndexError):
-                size = 0
-            name = parts[10]
-
-            files.append(
-                FileInfo(path=name, size=size, is_dir=is_dir, modified_time=0.0)
-            )
-
-        return files
+        return _parse_find_records(result.output)
 
     async def grep_raw(
         self, pattern: str, path: str = ".", recursive: bool = True
@@ -705,38 +971,35 @@ class ModalSandboxBackend:
         Raises:
             SandboxError: If grep fails
         """
-        # Use grep with line numbers
-        recursive_flag = "-r" if recursive else ""
-        command = f"grep -n {recursive_flag} '{pattern}' '{path}' 2>&1"
-        result = await self.execute(command)
+        # Use grep with file names (even for a single file) and line numbers;
+        # a pattern with no regex syntax is matched as a fixed string (-F),
+        # which skips the regex engine
+        flags = "-Hn"
+        if recursive:
+            flags += "r"
+        if _BRE_SPECIAL_CHARS.isdisjoint(pattern):
+            flags += "F"
+        command = f"grep {flags} -e {shlex.quote(pattern)} -- {shlex.quote(path)} 2>&1"
+        result = await self._shell_run(command)
 
         # grep returns 1 if no matches, which is not an error
         if result.exit_code not in (0, 1):
             raise SandboxError(f"grep failed: {result.output}")
 
-        # Parse grep output
+        # Parse grep output; match positions come from the same pattern,
+        # compiled once for the whole result
+        search = _compile_bre(pattern).search
         matches = []
-        for line in result.output.strip().split("\n"):
-            if not line:
-                continue
-
-            # Format: path:line_number:line_content
-            parts = line.split(":", 2)
-            if len(parts) < 3:
-                continue
-
-            file_path = parts[0]
-            line_number = int(parts[1])
-            line_content = parts[2]
-
-            # Find match position (approximate)
-            match_start = line_content.find(pattern)
-            match_end = match_start + len(pattern) if match_start >= 0 else 0
+        for file_path, line_number, line_content in (
+            match.groups() for match in _GREP_LINE_RE.finditer(result.output)
+        ):
+            found = search(line_content)
+            match_start, match_end = found.span() if found else (-1, 0)
 
             matches.append(
                 GrepMatch(
                     path=file_path,
-                    line_number=line_number,
+                    line_number=int(line_number),
                     line_content=line_content,
                     match_start=match_start,
                     match_end=match_end,
@@ -750,69 +1013,396 @@ class ModalSandboxBackend:
     ) -> list[FileUploadResponse]:
         """Upload multiple files to sandbox.
 
+        Files are sent base64-encoded in one shell script per
+        MAX_UPLOAD_SCRIPT_CHARS of data, so a batch of small files costs a
+        single exec round-trip. A script that fails is retried file by file
+        to find out which writes failed.
+
         Args:
             files: Dict mapping destination paths to file contents
 
         Returns:
-            List of FileUploadResponse objects
+            List of FileUploadResponse objects, in the order of `files`
 
         Raises:
             SandboxError: If upload fails
         """
-        responses = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSFERS)
+        batches = await asyncio.gather(
+            *(
+                self._upload_batch(batch, semaphore)
+                for batch in _split_upload_batches(files)
+            )
+        )
+        return [response for batch in batches for response in batch]
 
-        for path, content in files.items():
-            # Write file via execute
-            try:
-                result = await self.write(path, content.decode("utf-8"))
-                responses.append(
-                    FileUploadResponse(
-                        success=result.success,
-                        path=path,
-                        bytes_uploaded=result.bytes_written,
-                    )
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to upload {path}: {e}",
-                    extra={"component": "modal_sandbox", "path": path},
-                )
-                responses.append(
-                    FileUploadResponse(success=False, path=path, bytes_uploaded=0)
+    async def _upload_batch(
+        self, files: dict[str, bytes], semaphore: asyncio.Semaphore
+    ) -> list[FileUploadResponse]:
+        """Write `files` with one script, falling back to one write() each."""
+        try:
+            async with semaphore:
+                result = await self._shell_run(_upload_script(files))
+            if result.exit_code == 0:
+                return [
+                    FileUploadResponse(success=True, path=path, bytes_uploaded=len(content))
+                    for path, content in files.items()
+                ]
+            reason = result.output
+        except Exception as e:
+            reason = str(e)
+
+        logger.warning(
+            f"Batched upload failed, retrying per file: {reason[:200]}",
+            extra={"component": "modal_sandbox", "file_count": len(files)},
+        )
+        return list(
+            await asyncio.gather(
+                *(
+                    self._upload_file(path, content, semaphore)
+                    for path, content in files.items()
                 )
+            )
+        )
 
-        return responses
+    async def _upload_file(
+        self, path: str, content: bytes, semaphore: asyncio.Semaphore
+    ) -> FileUploadResponse:
+        """Write one file via write_bytes(), reporting failure instead of raising."""
+        try:
+            async with semaphore:
+                result = await self.write_bytes(path, content)
+        except Exception as e:
+            logger.error(
+                f"Failed to upload {path}: {e}",
+                extra={"component": "modal_sandbox", "path": path},
+            )
+            return FileUploadResponse(success=False, path=path, bytes_uploaded=0)
+        return FileUploadResponse(
+            success=result.success,
+            path=path,
+            bytes_uploaded=result.bytes_written,
+        )
 
     async def download_files(self, paths: list[str]) -> list[FileDownloadResponse]:
         """Download multiple files from sandbox.
 
+        All files are fetched as one base64-encoded tar archive in a single
+        exec round-trip. If any file is missing from the archive (or the
+        output was truncated), each path is read separately instead so the
+        failures are reported per file.
+
         Args:
             paths: List of file paths to download
 
         Returns:
-            List of FileDownloadResponse objects
+            List of FileDownloadResponse objects, in the order of `paths`
 
         Raises:
             SandboxError: If download fails
         """
-        responses = []
+        if not paths:
+            return []
 
-        for path in paths:
-            # Read file via execute
+        quoted = " ".join(shlex.quote(path) for path in paths)
+        contents: dict[str, bytes] | None = None
+        try:
+            result = await self._shell_run(
+                f"tar -czhPf - -- {quoted} 2>/dev/null | base64 -w0"
+            )
+            if not result.truncated:
+                contents = _read_tar_files(result.output, paths)
+        except Exception as e:
+            logger.warning(
+                f"Batched download failed: {e}",
+                extra={"component": "modal_sandbox", "file_count": len(paths)},
+            )
+
+        if contents is not None:
+            return [
+                FileDownloadResponse(success=True, path=path, content=contents[path])
+                for path in paths
+            ]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSFERS)
+
+        async def download(path: str) -> FileDownloadResponse:
             try:
-                content = await self.read(path)
-                responses.append(
-                    FileDownloadResponse(
-                        success=True, path=path, content=content.encode("utf-8")
-                    )
-                )
+                async with semaphore:
+                    content = await self.read_bytes(path)
             except Exception as e:
                 logger.error(
                     f"Failed to download {path}: {e}",
                     extra={"component": "modal_sandbox", "path": path},
                 )
-                responses.append(
-                    FileDownloadResponse(success=False, path=path, content=b"")
+                return FileDownloadResponse(success=False, path=path, content=b"")
+            return FileDownloadResponse(success=True, path=path, content=content)
+
+        return list(await asyncio.gather(*(download(path) for path in paths)))
+
+
+def _parse_find_records(output: str) -> list[FileInfo]:
+    """Parse _FIND_RECORD_FORMAT output into FileInfo objects sorted by path.
+
+    Splitting on NUL and at most three tabs keeps names with spaces, tabs or
+    newlines intact; find lists in traversal order, so results are sorted.
+    """
+    files = []
+    for record in output.split("\0"):
+        fields = record.split("\t", 3)
+        if len(fields) == 4:
+            file_type, size, modified_time, path = fields
+            files.append(
+                FileInfo(
+                    path=path,
+                    size=int(size),
+                    is_dir=file_type == "d",
+                    modified_time=float(modified_time),
                 )
+            )
+    files.sort(key=lambda info: info.path)
+    return files
+
+
+def _compile_bre(pattern: str) -> re.Pattern[str]:
+    """Compile a grep basic regular expression with Python's re module.
+
+    Translates the BRE spellings grep_raw() patterns use: escaped operators
+    (\\( \\) \\| \\+ \\? \\{ \\}), word boundaries (\\< \\>), bracket
+    expressions with POSIX classes, and ^/$/* where BRE treats them as
+    literals. A pattern that still doesn't compile is matched literally.
+    """
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        at_start = not out or out[-1] in ("(", "|")
+        if char == "\\" and i + 1 < n:
+            escaped = pattern[i + 1]
+            i += 2
+            if escaped in "()|+?{}":
+                out.append(escaped)
+            elif escaped in "<>":
+                out.append(r"\b")
+            elif escaped.isdigit() or escaped in "wWsSbB":
+                out.append("\\" + escaped)
+            else:
+                out.append(re.escape(escaped))
+            continue
+        if char == "[":
+            end = i + 1
+            if pattern.startswith("^", end):
+                end += 1
+            if pattern.startswith("]", end):
+                end += 1
+            while end < n and pattern[end] != "]":
+                if pattern.startswith("[:", end) and ":]" in pattern[end:]:
+                    end = pattern.index(":]", end) + 2
+                else:
+                    end += 1
+            if end < n:
+                out.append(_translate_bracket(pattern[i + 1 : end]))
+                i = end + 1
+                continue
+        if char == "^" and not at_start:
+            out.append(r"\^")
+        elif char == "$" and not (i + 1 == n or pattern.startswith(("\\)", "\\|"), i + 1)):
+            out.append(r"\$")
+        elif char == "*" and (at_start or out[-1] == "^"):
+            out.append(r"\*")
+        elif char in "()|+?{}":
+            out.append("\\" + char)
+        elif char in ".*^$":
+            out.append(char)
+        else:
+            out.append(re.escape(char))
+        i += 1
+    try:
+        return re.compile("".join(out))
+    except re.error:
+        return re.compile(re.escape(pattern))
+
+
+def _translate_bracket(body: str) -> str:
+    """Translate the inside of a BRE bracket expression to a Python class."""
+    out = ["["]
+    i = 0
+    if body.startswith("^"):
+        out.append("^")
+        i = 1
+    if body.startswith("]", i):
+        out.append(r"\]")
+        i += 1
+    while i < len(body):
+        end = body.find(":]", i)
+        if body.startswith("[:", i) and end >= 0:
+            name = body[i + 2 : end]
+            out.append(_BRE_CHAR_CLASSES.get(name, re.escape(body[i : end + 2])))
+            i = end + 2
+            continue
+        # Backslash and "[" are literals inside a BRE bracket expression
+        out.append(re.escape(body[i]) if body[i] in "\\[" else body[i])
+        i += 1
+    out.append("]")
+    return "".join(out)
+
+
+class _ShellSession:
+    """A bash process in the sandbox that runs commands one at a time.
+
+    Each command is followed by a printf of a per-session random token and
+    the command's exit code, which marks where its output ends on stdout.
+    bash is expected to lead its own process group (see start() and close()).
+    """
 
-        return responses
+    def __init__(self, process: Any, sandbox: Any) -> None:
+        self._process = process
+        self._sandbox = sandbox
+        # bash's pid, which is also its process group id; set by start()
+        self.pid: int | None = None
+        self._stdout = process.stdout.__aiter__()
+        self._token = f"__emonk_done_{uuid.uuid4().hex}__"
+        # Stdout read past the previous command's end marker
+        self._pending = ""
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Record bash's pid ($$ is the parent shell's pid inside a subshell)."""
+        result = await self.run("echo $$", 64)
+        self.pid = int(result.output)
+
+    async def close(self) -> None:
+        """Kill bash and every command it started, e.g. after a timeout."""
+        if self.pid is None:
+            return
+        # The session's own stdin is stuck behind the running command, so
+        # the kill goes through a separate exec (bash's builtin kill, as
+        # slim images may not ship procps)
+        process = await self._sandbox.exec("bash", "-c", f"kill -KILL -- -{self.pid}")
+        wait = getattr(process, "wait", None)
+        if wait is not None:
+            await wait()
+
+    async def run(self, command: str, max_output: int) -> ExecuteResponse:
+        """Run `command` and return its output, kept up to `max_output` characters.
+
+        Raises:
+            SandboxUnavailableError: If the bash process has exited
+        """
+        marker = f"{self._token} "
+        async with self._lock:
+            # The newline before ")" ends any trailing comment in `command`;
+            # stdin is closed so the command can't read the session's input
+            self._process.stdin.write(
+                f"( {command}\n) </dev/null 2>&1; printf '%s %d\\n' {self._token} $?\n"
+            )
+            await self._process.stdin.drain()
+
+            head: list[str] = []
+            kept = 0
+            truncated = False
+            buffer = self._pending
+            while (start := buffer.find(marker)) < 0 or (
+                end := buffer.find("\n", start)
+            ) < 0:
+                # Everything but a possibly partial marker at the end is output
+                spill = len(buffer) - len(marker) - 16
+                if spill > 0:
+                    room = max_output - kept
+                    if spill > room:
+                        truncated = True
+                    head.append(buffer[: min(spill, max(room, 0))])
+                    kept += len(head[-1])
+                    buffer = buffer[spill:]
+                try:
+                    buffer += await self._stdout.__anext__()
+                except StopAsyncIteration:
+                    raise SandboxUnavailableError("Sandbox shell session exited") from None
+
+            self._pending = buffer[end + 1 :]
+            exit_code = int(buffer[start + len(marker) : end])
+            output = "".join(head) + buffer[:start]
+            if len(output) > max_output:
+                output, truncated = output[:max_output], True
+            return ExecuteResponse(output=output, exit_code=exit_code, truncated=truncated)
+
+
+async def _read_capped(stdout: Any, limit: int) -> tuple[str, bool]:
+    """Read command output up to `limit` bytes.
+
+    Modal streams stdout as an async iterator of chunks; reading stops once
+    the limit is passed and the stream is closed, so the rest is never
+    buffered. Already-materialized output (a str) is just cut to `limit`.
+
+    Returns:
+        (output, truncated)
+    """
+    if isinstance(stdout, str):
+        if len(stdout) > limit:
+            return stdout[:limit], True
+        return stdout, False
+
+    buf = bytearray()
+    truncated = False
+    async for chunk in stdout:
+        buf += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        if len(buf) > limit:
+            truncated = True
+            del buf[limit:]
+            break
+    if truncated and hasattr(stdout, "aclose"):
+        await stdout.aclose()
+    return buf.decode("utf-8", errors="replace"), truncated
+
+
+def _upload_script(files: dict[str, bytes]) -> str:
+    """Build a shell script that writes each file from a base64 heredoc."""
+    blocks = ["set -e", "exec 2>&1"]
+    for path, content in files.items():
+        quoted = shlex.quote(path)
+        encoded = base64.b64encode(content).decode("ascii")
+        blocks.append(
+            f'mkdir -p "$(dirname {quoted})"\n'
+            f"base64 -d > {quoted} <<'{_HEREDOC_END}'\n{encoded}\n{_HEREDOC_END}"
+        )
+    return "\n".join(blocks) + "\n"
+
+
+def _split_upload_batches(files: dict[str, bytes]) -> list[dict[str, bytes]]:
+    """Group files, in order, so each batch's script stays under MAX_UPLOAD_SCRIPT_CHARS."""
+    batches: list[dict[str, bytes]] = []
+    batch: dict[str, bytes] = {}
+    size = 0
+    for path, content in files.items():
+        # base64 is 4/3 the size, plus the path twice and the shell around it
+        entry_size = (len(content) + 2) // 3 * 4 + 2 * len(path) + 64
+        if batch and size + entry_size > MAX_UPLOAD_SCRIPT_CHARS:
+            batches.append(batch)
+            batch, size = {}, 0
+        batch[path] = content
+        size += entry_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _read_tar_files(encoded: str, paths: list[str]) -> dict[str, bytes] | None:
+    """Extract `paths` from a base64 tar.gz; None unless every one is a regular file in it."""
+    try:
+        with tarfile.open(
+            fileobj=io.BytesIO(base64.b64decode(encoded)), mode="r:gz"
+        ) as archive:
+            members = {
+                os.path.normpath(member.name): member
+                for member in archive.getmembers()
+                if member.isfile()
+            }
+            contents = {}
+            for path in paths:
+                member = members.get(os.path.normpath(path))
+                if member is None:
+                    return None
+                contents[path] = archive.extractfile(member).read()
+            return contents
+    except (binascii.Error, tarfile.TarError, EOFError, OSError):
+        return None
@@ -1,9 +1,25 @@
 """Skills module for Emonk agent framework."""
 
-from .loader import SkillLoader
-from .executor import SkillsEngine
+from typing import Any
 
 __all__ = [
     "SkillLoader",
     "SkillsEngine",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exports on first access.
+
+    SkillsEngine pulls in src.core (and its LLM SDKs); skill worker
+    processes import src.skills.worker_pool and must not pay for that.
+    """
+    if name == "SkillLoader":
+        from .loader import SkillLoader
+
+        return SkillLoader
+    if name == "SkillsEngine":
+        from .executor import SkillsEngine
+
+        return SkillsEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
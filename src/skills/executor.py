@@ -6,11 +6,13 @@ Terminal Executor with proper security validation.
 """
 
 import logging
-from typing import Dict, Any, List
+import os
+from typing import Dict, Any, List, Optional
 
 from src.core.interfaces import SkillsEngineInterface, SkillResult
 from src.core.terminal import TerminalExecutor, SecurityError
 from src.skills.loader import SkillLoader
+from src.skills.worker_pool import DEFAULT_SKILL_WORKERS, SkillWorkerPool
 
 logger = logging.getLogger(__name__)
 
@@ -23,10 +25,18 @@ class SkillsEngine(SkillsEngineInterface):
     by converting skill arguments to command-line arguments and running
     them through the Terminal Executor for security validation.
     
+    Skills are scanned from skills_dir on first use (execute_skill(),
+    list_skills() or the skills attribute), not in the constructor.
+    
+    With a worker pool (SKILL_WORKERS > 0, the default), the validated
+    command runs on a warm Python worker instead of a new `python3`
+    process, skipping interpreter startup on every call.
+    
     Attributes:
         terminal: Terminal executor for running commands
         loader: Skill loader for discovering skills
-        skills: Dictionary of loaded skills
+        skills: Dictionary of loaded skills (loaded on first access)
+        worker_pool: Warm skill workers, or None to spawn a process per call
     
     Example:
         >>> terminal = TerminalExecutor()
@@ -38,23 +48,47 @@ class SkillsEngine(SkillsEngineInterface):
         >>> print(result.output)
     """
     
-    def __init__(self, terminal_executor: TerminalExecutor, skills_dir: str = "./skills"):
+    def __init__(
+        self,
+        terminal_executor: TerminalExecutor,
+        skills_dir: str = "./skills",
+        workers: Optional[int] = None,
+    ):
         """
         Initialize skills engine.
         
         Args:
             terminal_executor: Terminal executor instance for running commands
             skills_dir: Path to skills directory (default: ./skills)
+            workers: Warm worker processes for skills (default: SKILL_WORKERS
+                env var, else min(8, CPU count)); 0 spawns a process per call
         """
         self.terminal = terminal_executor
         self.loader = SkillLoader(skills_dir)
-        self.skills = self.loader.load_skills()
+        # Scanned by the skills property on first access
+        self._skills: Optional[Dict[str, dict]] = None
+        
+        if workers is None:
+            workers = int(os.getenv("SKILL_WORKERS", str(DEFAULT_SKILL_WORKERS)))
+        # Workers start on the first skill call, not here
+        self.worker_pool = SkillWorkerPool(workers) if workers > 0 else None
         
         logger.info(
-            f"Skills engine initialized with {len(self.skills)} skills",
-            extra={"component": "skills_engine", "count": len(self.skills)}
+            f"Skills engine initialized for {skills_dir}",
+            extra={"component": "skills_engine", "skills_dir": skills_dir}
         )
     
+    @property
+    def skills(self) -> Dict[str, dict]:
+        """Loaded skills by name, scanned from skills_dir on first access."""
+        if self._skills is None:
+            self._skills = self.loader.load_skills()
+        return self._skills
+    
+    @skills.setter
+    def skills(self, skills: Dict[str, dict]) -> None:
+        self._skills = skills
+    
     async def execute_skill(
         self, 
         skill_name: str, 
@@ -106,8 +140,13 @@ class SkillsEngine(SkillsEngineInterface):
         )
         
         try:
-            # Execute via Terminal Executor
-            result = await self.terminal.execute("python3", cmd_args)
+            if self.worker_pool is not None:
+                # Same allowlist checks as terminal.execute(), then a warm worker
+                self.terminal.validate("python3", cmd_args)
+                result = await self.worker_pool.run(entry_point, cmd_args[1:])
+            else:
+                # Execute via Terminal Executor
+                result = await self.terminal.execute("python3", cmd_args)
             
             if result.exit_code == 0:
                 return SkillResult(
@@ -154,6 +193,11 @@ class SkillsEngine(SkillsEngineInterface):
                 error=f"Unexpected error: {str(e)}"
             )
     
+    def close(self) -> None:
+        """Stop the skill worker processes, if any."""
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+    
     def list_skills(self) -> List[str]:
         """
         Return list of available skill names.
@@ -12,6 +12,7 @@ Example:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -77,7 +78,10 @@ class SkillLoader:
             }
 
         Notes:
-            - Duplicate skill names: First one wins, others logged as warnings
+            - SKILL.md files are read and parsed on a thread pool, then merged
+              in directory-name order
+            - Duplicate skill names: First one (by directory name) wins,
+              others logged as warnings
             - Missing SKILL.md: Directory skipped with warning
             - Invalid YAML: Skill skipped with error log
             - Missing entry point: Metadata loaded but warning logged
@@ -88,22 +92,19 @@ class SkillLoader:
             logger.warning(f"Skills directory not found: {self.skills_dir}")
             return {}
 
-        for skill_path in self.skills_dir.iterdir():
-            if not skill_path.is_dir():
-                continue
-
-            skill_md = skill_path / "SKILL.md"
-            if not skill_md.exists():
-                logger.debug(
-                    f"Skipping {skill_path.name} - no SKILL.md found",
-                    extra={"component": "skill_loader", "path": str(skill_path)},
-                )
-                continue
+        # Sorted so the merge below (and which duplicate wins) doesn't depend
+        # on the filesystem's listing order
+        skill_paths = sorted(self.skills_dir.iterdir())
+        parsed: List[Optional[dict]] = []
+        if skill_paths:
+            # Overlaps the stat/open/read of each SKILL.md; map() keeps order
+            with ThreadPoolExecutor(max_workers=min(32, len(skill_paths))) as pool:
+                parsed = list(pool.map(self._load_one, skill_paths))
 
-            # Parse SKILL.md
-            skill_metadata = self._parse_skill_md(skill_md)
+        for skill_path, skill_metadata in zip(skill_paths, parsed, strict=True):
             if not skill_metadata:
                 continue
+            skill_md = skill_path / "SKILL.md"
 
             skill_name = skill_metadata.get("name")
             if not skill_name:
@@ -148,6 +149,30 @@ class SkillLoader:
 
         return self.skills
 
+    def _load_one(self, skill_path: Path) -> Optional[dict]:
+        """
+        Parse one skill directory's SKILL.md (run on load_skills()'s pool).
+
+        Args:
+            skill_path: Candidate skill directory
+
+        Returns:
+            Parsed metadata, or None if skill_path isn't a skill directory or
+            its SKILL.md can't be parsed
+        """
+        if not skill_path.is_dir():
+            return None
+
+        skill_md = skill_path / "SKILL.md"
+        if not skill_md.exists():
+            logger.debug(
+                f"Skipping {skill_path.name} - no SKILL.md found",
+                extra={"component": "skill_loader", "path": str(skill_path)},
+            )
+            return None
+
+        return self._parse_skill_md(skill_md)
+
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
         """
         Convert loaded skills to LangGraph tool schema format.
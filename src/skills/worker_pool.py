@@ -0,0 +1,296 @@
+"""
+Warm worker processes for skill execution.
+
+This module provides the SkillWorkerPool class, which runs skill entry points
+in a pool of long-lived Python worker processes instead of spawning a fresh
+`python3` interpreter per call. Each worker pre-imports the modules skills
+commonly use, then runs the skill script as `__main__` with the given argv,
+capturing stdout/stderr and the exit code like a subprocess would.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import io
+import itertools
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import runpy
+import signal
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+# Workers import this module, so it sticks to the stdlib at import time:
+# src.core pulls in the LLM SDKs, which would cost seconds per worker
+if TYPE_CHECKING:
+    from src.core.terminal import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+# Imported once per worker so skill runs don't pay for them
+PREIMPORT_MODULES = ("argparse", "json", "datetime", "pathlib", "urllib.request")
+
+# Pool size when SKILL_WORKERS isn't set
+DEFAULT_SKILL_WORKERS = min(8, os.cpu_count() or 1)
+
+_TRUNCATION_SUFFIX = "\n[Output truncated at 1MB limit]"
+
+# In a worker: where _run_skill reports (call_id, pid) as it starts a call
+_started: Any = None
+
+
+def _init_worker(started: Any) -> None:
+    """Worker initializer: keep the start queue and import PREIMPORT_MODULES."""
+    global _started
+    _started = started
+    for name in PREIMPORT_MODULES:
+        importlib.import_module(name)
+
+
+class _CappedWriter(io.StringIO):
+    """StringIO that keeps at most `limit` characters."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__()
+        self.limit = limit
+        self.truncated = False
+
+    def write(self, text: str) -> int:
+        room = self.limit - self.tell()
+        if len(text) > room:
+            self.truncated = True
+            if room > 0:
+                super().write(text[:room])
+            return len(text)
+        return super().write(text)
+
+    def result(self) -> str:
+        value = self.getvalue()
+        return value + _TRUNCATION_SUFFIX if self.truncated else value
+
+
+def _run_skill(
+    call_id: int, entry_point: str, args: List[str], env: dict, cwd: str, max_output: int
+) -> Tuple[str, str, int]:
+    """
+    Run one skill script in this worker, the way `python3 entry_point *args` would.
+
+    The caller's environment and working directory are applied first, so a
+    warm worker sees the same settings a freshly spawned process would. The
+    script's directory is put first on sys.path for the run, and modules
+    imported from it are dropped afterwards, so helper modules next to the
+    script import as they would in a fresh process.
+
+    Args:
+        call_id: Reported with this worker's pid so the caller can kill it
+        entry_point: Path to the skill's Python file
+        args: Command-line arguments for the skill
+        env: Environment to run with
+        cwd: Working directory to run in
+        max_output: Characters kept per stream (the rest is dropped)
+
+    Returns:
+        (stdout, stderr, exit_code)
+    """
+    if _started is not None:
+        _started.put((call_id, os.getpid()))
+
+    os.environ.clear()
+    os.environ.update(env)
+    os.chdir(cwd)
+
+    stdout = _CappedWriter(max_output)
+    stderr = _CappedWriter(max_output)
+    exit_code = 0
+    script_dir = os.path.dirname(os.path.abspath(entry_point))
+    saved_argv = sys.argv
+    saved_path = list(sys.path)
+    saved_modules = set(sys.modules)
+    sys.argv = [entry_point, *args]
+    sys.path.insert(0, script_dir)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(entry_point, run_name="__main__")
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    exit_code = e.code
+                elif e.code is not None:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except BaseException as e:  # noqa: BLE001 - report like an uncaught exception would
+                print(f"{type(e).__name__}: {e}", file=sys.stderr)
+                exit_code = 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        _forget_modules(set(sys.modules) - saved_modules, script_dir)
+
+    return stdout.result(), stderr.result(), exit_code
+
+
+def _forget_modules(names: Set[str], directory: str) -> None:
+    """Remove the modules in `names` that were loaded from under `directory`."""
+    prefix = os.path.join(directory, "")
+    for name in names:
+        path = getattr(sys.modules.get(name), "__file__", None) or ""
+        if os.path.abspath(path).startswith(prefix):
+            del sys.modules[name]
+
+
+class SkillWorkerPool:
+    """
+    Pool of warm Python processes that run skill entry points.
+
+    Workers are spawned (not forked, since the server process has running
+    threads and event loops) on first use and reused across calls. As with
+    any spawned multiprocessing worker, the launching script's top level
+    must be guarded by `if __name__ == "__main__":`. Each worker reports
+    which call it has started, so a call that exceeds its timeout kills
+    only the worker running it, and the pool starts a replacement; calls
+    on other workers keep running. A call that timed out before any worker
+    picked it up terminates the whole pool instead.
+
+    Example:
+        >>> pool = SkillWorkerPool(processes=4)
+        >>> result = await pool.run("./skills/memory/memory.py", ["--action", "recall", "--key", "k"])
+        >>> print(result.exit_code, result.stdout)
+        >>> await pool.aclose()
+    """
+
+    def __init__(self, processes: int) -> None:
+        """
+        Initialize the pool (workers start on the first run()).
+
+        Args:
+            processes: Number of worker processes
+        """
+        self.processes = processes
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+        self._started: Any = None
+        # pid -> id of the call that worker started last
+        self._running: Dict[int, int] = {}
+        self._call_ids = itertools.count()
+        self._lock = threading.Lock()
+        # Fails one in-flight run(); called for each if the pool is terminated
+        self._pending: Set[Callable[[BaseException], None]] = set()
+
+    def _get_pool(self) -> multiprocessing.pool.Pool:
+        """Return the worker pool, starting it on first use."""
+        with self._lock:
+            if self._pool is None:
+                ctx = multiprocessing.get_context("spawn")
+                self._started = ctx.SimpleQueue()
+                self._running = {}
+                self._pool = ctx.Pool(
+                    processes=self.processes,
+                    initializer=_init_worker,
+                    initargs=(self._started,),
+                )
+                logger.info(
+                    f"Skill worker pool started with {self.processes} workers",
+                    extra={"component": "skill_worker_pool", "workers": self.processes}
+                )
+            return self._pool
+
+    def _worker_for(self, call_id: int) -> Optional[int]:
+        """Return the pid of the worker running `call_id`, if one started it."""
+        with self._lock:
+            started = self._started
+            if started is None:
+                return None
+            while not started.empty():
+                started_id, pid = started.get()
+                self._running[pid] = started_id
+            for pid, running_id in self._running.items():
+                if running_id == call_id:
+                    return pid
+            return None
+
+    async def run(self, entry_point: str, args: List[str], timeout: int = 60) -> "ExecutionResult":
+        """
+        Run a skill entry point on a warm worker.
+
+        Args:
+            entry_point: Path to the skill's Python file
+            args: Command-line arguments for the skill
+            timeout: Maximum execution time in seconds (default: 60)
+
+        Returns:
+            ExecutionResult with captured stdout, stderr and exit code
+
+        Raises:
+            TimeoutError: If the skill exceeds timeout duration
+        """
+        from src.core.terminal import MAX_OUTPUT_SIZE, ExecutionResult
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _resolve(value: object) -> None:
+            if not future.done():
+                if isinstance(value, BaseException):
+                    future.set_exception(value)
+                else:
+                    future.set_result(value)
+
+        def _fail(exc: BaseException) -> None:
+            loop.call_soon_threadsafe(_resolve, exc)
+
+        call_id = next(self._call_ids)
+        self._pending.add(_fail)
+        self._get_pool().apply_async(
+            _run_skill,
+            (call_id, entry_point, args, dict(os.environ), os.getcwd(), MAX_OUTPUT_SIZE),
+            callback=lambda value: loop.call_soon_threadsafe(_resolve, value),
+            error_callback=_fail,
+        )
+
+        try:
+            stdout, stderr, exit_code = await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            # CRITICAL: Kill the stuck worker so it can't keep running
+            await self._kill(call_id)
+            error_msg = f"Skill exceeded {timeout}s timeout"
+            logger.error(
+                error_msg,
+                extra={"component": "skill_worker_pool", "entry_point": entry_point, "timeout": timeout}
+            )
+            raise TimeoutError(error_msg) from None
+        finally:
+            self._pending.discard(_fail)
+            # Also drains the start queue, so workers never block on it
+            self._worker_for(call_id)
+
+        return ExecutionResult(stdout=stdout, stderr=stderr, exit_code=exit_code)
+
+    async def _kill(self, call_id: int) -> None:
+        """Kill the worker running `call_id`; the pool replaces it."""
+        pid = self._worker_for(call_id)
+        if pid is None:
+            # Still queued: terminating the pool is the only way to drop it
+            await self.aclose()
+            return
+        with self._lock:
+            self._running.pop(pid, None)
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(pid, signal.SIGKILL)
+
+    async def aclose(self) -> None:
+        """Terminate the worker processes without blocking the event loop."""
+        await asyncio.to_thread(self.close)
+
+    def close(self) -> None:
+        """Terminate the worker processes (a later run() starts new ones)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._started = None
+            pending, self._pending = self._pending, set()
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        for fail in pending:
+            fail(RuntimeError("Skill worker pool was terminated"))
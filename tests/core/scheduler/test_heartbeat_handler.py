@@ -133,6 +133,46 @@ class TestHeartbeatHandlerHandle:
             await handler._notify(result)
 
 
+    @pytest.mark.asyncio
+    async def test_notify_reuses_http_client(self):
+        handler = make_handler(webhook_url="https://example.com/webhook")
+        result = HeartbeatResult(
+            urgent=True, summary="Alert", raw_response="", checked_at=""
+        )
+        with patch("httpx.AsyncClient") as mock_cls:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=MagicMock(status_code=200))
+            mock_cls.return_value = mock_client
+
+            await handler._notify(result)
+            await handler._notify(result)
+            await handler.aclose()
+
+            mock_cls.assert_called_once()
+            assert mock_client.post.await_count == 2
+            mock_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_notify_uses_injected_http_client(self):
+        client = AsyncMock()
+        client.post = AsyncMock(return_value=MagicMock(status_code=200))
+        handler = HeartbeatHandler(
+            agent=make_agent(),
+            config=make_config(),
+            google_chat_webhook_url="https://example.com/webhook",
+            http_client=client,
+        )
+        result = HeartbeatResult(
+            urgent=True, summary="Alert", raw_response="", checked_at=""
+        )
+
+        await handler._notify(result)
+        await handler.aclose()
+
+        client.post.assert_awaited_once()
+        client.aclose.assert_not_called()
+
+
 class TestActiveHours:
     def test_always_within_range_00_to_2359_utc(self):
         config = make_config(
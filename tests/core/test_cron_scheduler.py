@@ -273,3 +273,98 @@ class TestCronScheduler:
         # Verify job marked as failed
         assert job["status"] == "failed"
         assert "No handler registered for job type" in job["error"]
+
+    @pytest.mark.asyncio
+    async def test_run_tick_executes_due_jobs_concurrently(self, scheduler):
+        """Test: Due jobs in one tick run on concurrent workers."""
+        started = 0
+        all_started = asyncio.Event()
+
+        async def handler(job):
+            nonlocal started
+            started += 1
+            if started == 3:
+                all_started.set()
+            # Deadlocks (and times out) if jobs run one at a time
+            await asyncio.wait_for(all_started.wait(), timeout=2)
+
+        scheduler.register_handler("post_content", handler)
+        for _ in range(3):
+            await scheduler.schedule_job(
+                job_type="post_content",
+                schedule_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+                payload={},
+            )
+
+        metrics = await scheduler.run_tick()
+
+        assert metrics["jobs_due"] == 3
+        assert metrics["jobs_executed"] == 3
+        assert metrics["jobs_succeeded"] == 3
+
+    @pytest.mark.asyncio
+    async def test_run_tick_respects_max_concurrent_jobs(self, mock_agent_state):
+        """Test: No more than max_concurrent_jobs run at once."""
+        scheduler = CronScheduler(mock_agent_state, max_concurrent_jobs=2)
+        running = 0
+        peak = 0
+
+        async def handler(job):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        scheduler.register_handler("post_content", handler)
+        for _ in range(5):
+            await scheduler.schedule_job(
+                job_type="post_content",
+                schedule_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+                payload={},
+            )
+
+        metrics = await scheduler.run_tick()
+
+        assert metrics["jobs_succeeded"] == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_run_tick_reports_load_failure(self, scheduler):
+        """Test: A storage load error comes back as ok=False instead of raising."""
+        scheduler.storage.load_jobs = AsyncMock(side_effect=OSError("bucket unavailable"))
+
+        metrics = await scheduler.run_tick()
+
+        assert metrics["ok"] is False
+        assert metrics["error"] == "bucket unavailable"
+        assert metrics["error_type"] == "OSError"
+        assert metrics["jobs_executed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_run_tick_counts_claim_failure(self, scheduler):
+        """Test: A failed claim is counted without aborting the other jobs."""
+        scheduler.register_handler("post_content", AsyncMock())
+        for _ in range(2):
+            await scheduler.schedule_job(
+                job_type="post_content",
+                schedule_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+                payload={},
+            )
+        claim = scheduler.storage.claim_job
+        calls = 0
+
+        async def flaky_claim(job_id):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise OSError("lock backend down")
+            return await claim(job_id)
+
+        scheduler.storage.claim_job = flaky_claim
+
+        metrics = await scheduler.run_tick()
+
+        assert metrics["ok"] is True
+        assert metrics["jobs_failed"] == 1
+        assert metrics["jobs_succeeded"] == 1
@@ -10,12 +10,38 @@ from datetime import datetime, timedelta
 
 from src.core.deepagent import (
     build_deep_agent,
+    is_available,
     _generate_skills_manifest,
     _parse_skill_frontmatter,
     _create_schedule_task_tool,
 )
 
 
+class TestIsAvailable:
+    """Tests for the is_available() capability probe."""
+
+    @patch("src.core.deepagent._DEEPAGENTS_AVAILABLE", False)
+    def test_unavailable_without_deepagents(self):
+        """Test that a missing deepagents package is reported."""
+        assert is_available() is False
+
+    @patch("src.core.deepagent._DEEPAGENTS_AVAILABLE", True)
+    def test_unavailable_with_incomplete_firestore_config(self, monkeypatch):
+        """Test that firestore checkpoints without a project are reported."""
+        monkeypatch.setenv("CHECKPOINT_BACKEND", "firestore")
+        monkeypatch.delenv("GCP_PROJECT_ID", raising=False)
+        monkeypatch.delenv("VERTEX_AI_PROJECT_ID", raising=False)
+
+        assert is_available() is False
+
+    @patch("src.core.deepagent._DEEPAGENTS_AVAILABLE", True)
+    def test_available(self, monkeypatch):
+        """Test that installed deepagents with default config is available."""
+        monkeypatch.delenv("CHECKPOINT_BACKEND", raising=False)
+
+        assert is_available() is True
+
+
 class TestBuildDeepAgent:
     """Tests for build_deep_agent factory function."""
     
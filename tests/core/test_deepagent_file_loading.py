@@ -124,6 +124,25 @@ class TestBuildDeepAgentFileLoading:
         agent = build_deep_agent(model="gemini-2.5-flash", heartbeat=hb_cfg, scheduler=None)
         assert agent is not None
 
+    @patch("src.core.deepagent._DEEPAGENTS_AVAILABLE", True)
+    @patch("src.core.deepagent.create_deep_agent")
+    @patch("src.core.deepagent.compose_system_prompt")
+    def test_heartbeat_handler_attached_to_agent(self, mock_compose, mock_create, tmp_path, monkeypatch):
+        """The registered HeartbeatHandler is exposed so shutdown can aclose() it."""
+        mock_agent = MagicMock()
+        mock_create.return_value = mock_agent
+        mock_compose.return_value = "composed"
+        monkeypatch.chdir(tmp_path)
+
+        from src.core.config import HeartbeatConfig
+        from src.core.scheduler.handlers import HeartbeatHandler
+        scheduler = MagicMock()
+
+        build_deep_agent(model="gemini-2.5-flash", heartbeat=HeartbeatConfig(), scheduler=scheduler)
+
+        assert isinstance(mock_agent.heartbeat_handler, HeartbeatHandler)
+        scheduler.register_handler.assert_called_once_with("heartbeat", mock_agent.heartbeat_handler)
+
     @patch("src.core.deepagent._DEEPAGENTS_AVAILABLE", True)
     @patch("src.core.deepagent.create_deep_agent")
     @patch("src.core.deepagent.compose_system_prompt")
@@ -0,0 +1,432 @@
+"""Unit tests for GCSStore.
+
+Tests GCSStore with a mocked google.cloud.storage.Client:
+- Shared client reuse across instances
+- list() delimiter listing, concurrent downloads on a shared pool, caching
+- get() single round-trip for missing keys
+- delete_many() batch deletes
+- search_memory tool output formatting, result caching and invalidation
+- QueryCache LRU, TTL and semantic matching
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.core import store as store_module
+from src.core.store import GCSStore
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Reset the process-wide client cache between tests."""
+    store_module._CLIENT_CACHE.clear()
+    yield
+    store_module._CLIENT_CACHE.clear()
+
+
+@pytest.fixture
+def mock_storage():
+    """Patch google.cloud.storage in the store module."""
+    with patch("src.core.store.storage") as mock:
+        mock.Client.side_effect = lambda project=None: Mock(name=f"client-{project}")
+        yield mock
+
+
+# ============================================================================
+# Test Client Reuse
+# ============================================================================
+
+
+def test_client_shared_across_instances(mock_storage):
+    """Test that stores for the same project share one storage client."""
+    store_a = GCSStore(bucket_name="bucket-a", project_id="test-project")
+    store_b = GCSStore(bucket_name="bucket-b", project_id="test-project")
+
+    assert store_a.client is store_b.client
+    mock_storage.Client.assert_called_once_with(project="test-project")
+
+
+def test_client_per_project(mock_storage):
+    """Test that different projects get different clients."""
+    store_a = GCSStore(bucket_name="bucket", project_id="project-a")
+    store_b = GCSStore(bucket_name="bucket", project_id="project-b")
+
+    assert store_a.client is not store_b.client
+    assert mock_storage.Client.call_count == 2
+
+
+def test_client_http_pool_configured(mock_storage):
+    """Test that the shared client's HTTP session gets a larger connection pool."""
+    store = GCSStore(bucket_name="bucket", project_id="test-project")
+
+    store.client._http.mount.assert_called_once()
+    prefix, adapter = store.client._http.mount.call_args.args
+    assert prefix == "https://"
+    assert adapter._pool_maxsize == store_module.GCS_POOL_SIZE
+
+
+# ============================================================================
+# Test list() Caching
+# ============================================================================
+
+
+def _mock_blob(name: str, content: str = "{}") -> Mock:
+    """Create a mock blob with JSON content and no timestamps."""
+    blob = Mock()
+    blob.name = name
+    blob.download_as_bytes.return_value = content.encode()
+    blob.time_created = None
+    blob.updated = None
+    return blob
+
+
+def test_list_uses_delimiter(mock_storage):
+    """Test that list() stops at the namespace level."""
+    store = GCSStore(bucket_name="bucket")
+    store.client.list_blobs.return_value = [_mock_blob("user/notes/a.json", '{"x": 1}')]
+
+    items = store.list(("user", "notes"))
+
+    assert [item.key for item in items] == ["a"]
+    assert items[0].value == {"x": 1}
+    store.client.list_blobs.assert_called_once_with(
+        "bucket", prefix="user/notes/", delimiter="/", max_results=None
+    )
+
+
+def test_list_reuses_recent_listing(mock_storage):
+    """Test that back-to-back list() calls on a namespace hit the cache."""
+    store = GCSStore(bucket_name="bucket")
+    store.client.list_blobs.return_value = [_mock_blob("user/notes/a.json")]
+
+    store.list(("user", "notes"))
+    store.list(("user", "notes"))
+
+    store.client.list_blobs.assert_called_once()
+
+
+def test_list_cache_invalidated_on_put(mock_storage):
+    """Test that writing to a namespace drops its cached listing."""
+    store = GCSStore(bucket_name="bucket")
+    store.client.list_blobs.return_value = [_mock_blob("user/notes/a.json")]
+
+    store.list(("user", "notes"))
+    store.put(("user", "notes"), "b", {"y": 2})
+    store.list(("user", "notes"))
+
+    assert store.client.list_blobs.call_count == 2
+
+
+def test_list_cache_expires(mock_storage):
+    """Test that cached listings expire after list_cache_ttl."""
+    store = GCSStore(bucket_name="bucket", list_cache_ttl=5.0)
+    store.client.list_blobs.return_value = []
+
+    with patch("src.core.store.time.monotonic", return_value=100.0):
+        store.list(("user", "notes"))
+    with patch("src.core.store.time.monotonic", return_value=106.0):
+        store.list(("user", "notes"))
+
+    assert store.client.list_blobs.call_count == 2
+
+
+def test_list_downloads_many_blobs_in_order(mock_storage):
+    """Test that concurrent downloads keep listing order and skip bad blobs."""
+    store = GCSStore(bucket_name="bucket")
+    blobs = [_mock_blob(f"u/s/k{i}.json", f'{{"i": {i}}}') for i in range(5)]
+    blobs[2].download_as_bytes.side_effect = RuntimeError("transient")
+    store.client.list_blobs.return_value = blobs
+
+    items = store.list(("u", "s"))
+
+    assert [item.key for item in items] == ["k0", "k1", "k3", "k4"]
+    assert [item.value["i"] for item in items] == [0, 1, 3, 4]
+
+
+def test_list_downloads_share_one_bounded_pool(mock_storage):
+    """Test that list() calls reuse one executor capped at the HTTP pool size."""
+    import threading
+
+    store = GCSStore(bucket_name="bucket")
+    threads = set()
+
+    def download():
+        threads.add(threading.current_thread().name)
+        return b"{}"
+
+    blobs = [_mock_blob(f"u/s/k{i}.json") for i in range(3)]
+    for blob in blobs:
+        blob.download_as_bytes.side_effect = download
+    store.client.list_blobs.return_value = blobs
+    store.list_cache_ttl = 0
+
+    store.list(("u", "s"))
+    store.list(("u", "s"))
+
+    pool = store_module._get_download_pool()
+    assert pool is store_module._get_download_pool()
+    assert pool._max_workers == store_module.GCS_DOWNLOAD_WORKERS
+    assert all(name.startswith("gcs-download") for name in threads)
+
+
+def test_get_missing_is_one_request(mock_storage):
+    """Test that get() of a missing key makes a single download attempt."""
+    from google.api_core.exceptions import NotFound
+
+    store = GCSStore(bucket_name="bucket")
+    blob = store.bucket.blob.return_value
+    blob.download_as_bytes.side_effect = NotFound("gone")
+
+    assert store.get(("u", "s"), "missing") is None
+    blob.exists.assert_not_called()
+
+
+def test_search_filter_and_query(mock_storage):
+    """Test that search() applies dict filters before keyword ranking."""
+    store = GCSStore(bucket_name="bucket")
+    store.client.list_blobs.return_value = [
+        _mock_blob("u/s/a.json", '{"kind": "note", "summary": "ai ai", "key_topics": []}'),
+        _mock_blob("u/s/b.json", '{"kind": "note", "summary": "ai", "key_topics": ["ai"]}'),
+        _mock_blob("u/s/c.json", '{"kind": "todo", "summary": "ai ai ai"}'),
+    ]
+
+    results = store.search(("u", "s"), query="ai", filter={"kind": "note"})
+
+    assert [item.key for item in results] == ["b", "a"]
+
+
+# ============================================================================
+# Test delete_many()
+# ============================================================================
+
+
+def test_delete_many_batches_requests(mock_storage):
+    """Test that deletes are grouped into batches of GCS_BATCH_SIZE."""
+    store = GCSStore(bucket_name="bucket")
+    store.client.batch = MagicMock()
+    keys = [f"k{i}" for i in range(store_module.GCS_BATCH_SIZE + 1)]
+
+    store.delete_many(("user", "notes"), keys)
+
+    assert store.client.batch.call_count == 2
+    assert store.bucket.blob.return_value.delete.call_count == len(keys)
+    store.bucket.blob.assert_any_call("user/notes/k0.json")
+
+
+def test_delete_many_ignores_missing(mock_storage):
+    """Test that NotFound from a batch doesn't propagate."""
+    from google.api_core.exceptions import NotFound
+
+    store = GCSStore(bucket_name="bucket")
+    store.client.batch = MagicMock()
+    store.client.batch.return_value.__exit__.side_effect = NotFound("gone")
+
+    store.delete_many(("user", "notes"), ["missing"])
+
+
+def test_delete_many_invalidates_list_cache(mock_storage):
+    """Test that batch deletes drop the cached namespace listing."""
+    store = GCSStore(bucket_name="bucket")
+    store.client.batch = MagicMock()
+    store.client.list_blobs.return_value = []
+
+    store.list(("user", "notes"))
+    store.delete_many(("user", "notes"), ["a"])
+    store.list(("user", "notes"))
+
+    assert store.client.list_blobs.call_count == 2
+
+
+# ============================================================================
+# Test search_memory Tool
+# ============================================================================
+
+
+def test_search_memory_tool_formats_results():
+    """Test that the search_memory tool renders each result block."""
+    from langgraph.store.base import Item
+
+    from src.core.store import create_search_memory_tool
+
+    store = Mock()
+    store.search.return_value = [
+        Item(
+            value={"summary": "Discussed AI", "key_topics": ["ai", "ml"], "timestamp": "t1"},
+            key="k1",
+            namespace=("shared", "session_summaries"),
+            created_at=None,
+            updated_at=None,
+        ),
+        Item(
+            value={},
+            key="k2",
+            namespace=("shared", "session_summaries"),
+            created_at=None,
+            updated_at=None,
+        ),
+    ]
+
+    tool = create_search_memory_tool(store)
+    output = tool.invoke({"query": "ai"})
+
+    assert output == (
+        "Found 2 relevant memories:\n\n"
+        "1. Discussed AI\n   Topics: ai, ml\n   Time: t1\n\n"
+        "2. No summary\n   Topics: \n   Time: Unknown time\n\n"
+    )
+
+
+def test_search_memory_tool_no_results():
+    """Test the search_memory tool message when nothing matches."""
+    from src.core.store import create_search_memory_tool
+
+    store = Mock()
+    store.search.return_value = []
+
+    tool = create_search_memory_tool(store)
+
+    assert tool.invoke({"query": "nothing"}) == "No relevant memories found for query: nothing"
+
+
+def test_search_memory_tool_caches_repeat_queries():
+    """Test that repeated queries differing only in case skip the store search."""
+    from src.core.store import create_search_memory_tool
+
+    store = Mock()
+    store.search.return_value = []
+
+    tool = create_search_memory_tool(store)
+    first = tool.invoke({"query": "AI trends"})
+    second = tool.invoke({"query": "ai TRENDS"})
+
+    assert first == second == "No relevant memories found for query: ai trends"
+    store.search.assert_called_once()
+
+
+def test_search_memory_tool_whitespace_variants_not_shared():
+    """Test that queries search() treats differently get their own cache entries."""
+    from langgraph.store.base import Item
+
+    from src.core.store import create_search_memory_tool
+
+    item = Item(
+        value={"summary": "Discussed AI trends"},
+        key="k1",
+        namespace=("shared", "session_summaries"),
+        created_at=None,
+        updated_at=None,
+    )
+    store = Mock()
+    # Substring match on the lowercased query, like GCSStore.search()
+    store.search.side_effect = lambda namespace, query, limit: (
+        [item] if query.lower() in "discussed ai trends" else []
+    )
+
+    tool = create_search_memory_tool(store)
+    spaced = tool.invoke({"query": "AI  Trends"})
+    single = tool.invoke({"query": "ai trends"})
+
+    assert spaced == "No relevant memories found for query: ai  trends"
+    assert single.startswith("Found 1 relevant memories:")
+
+
+def test_search_memory_tool_cache_cleared_on_write(mock_storage):
+    """Test that a memory saved after a search isn't hidden by the cache."""
+    from src.core.store import create_search_memory_tool
+
+    store = GCSStore(bucket_name="bucket")
+    namespace = ("shared", "session_summaries")
+
+    with patch.object(store, "search", return_value=[]) as search:
+        tool = create_search_memory_tool(store, namespace=namespace)
+        tool.invoke({"query": "ai"})
+        tool.invoke({"query": "ai"})
+        store.put(namespace, "thread-1", {"summary": "Discussed AI"})
+        tool.invoke({"query": "ai"})
+        store.put(("other", "notes"), "k", {"x": 1})
+        tool.invoke({"query": "ai"})
+
+    assert search.call_count == 2
+
+
+def test_search_memory_tool_cache_disabled():
+    """Test that cache_ttl=0 searches the store on every call."""
+    from src.core.store import create_search_memory_tool
+
+    store = Mock()
+    store.search.return_value = []
+
+    tool = create_search_memory_tool(store, cache_ttl=0)
+    tool.invoke({"query": "ai"})
+    tool.invoke({"query": "ai"})
+
+    assert store.search.call_count == 2
+
+
+# ============================================================================
+# Test QueryCache
+# ============================================================================
+
+
+def test_query_cache_ttl_expiry():
+    """Test that expired entries are recomputed."""
+    from src.core.store import QueryCache
+
+    cache = QueryCache(ttl=10)
+    compute = Mock(side_effect=["first", "second"])
+
+    with patch("src.core.store.time.monotonic", return_value=100.0):
+        assert cache.get_or_compute("q", compute) == "first"
+        assert cache.get_or_compute("q", compute) == "first"
+    with patch("src.core.store.time.monotonic", return_value=111.0):
+        assert cache.get_or_compute("q", compute) == "second"
+
+    assert compute.call_count == 2
+
+
+def test_query_cache_lru_eviction():
+    """Test that the least recently used entry is evicted at capacity."""
+    from src.core.store import QueryCache
+
+    cache = QueryCache(maxsize=2)
+    cache.get_or_compute("a", lambda: "A")
+    cache.get_or_compute("b", lambda: "B")
+    cache.get_or_compute("a", lambda: "unused")  # refresh "a"
+    cache.get_or_compute("c", lambda: "C")  # evicts "b"
+
+    assert cache.get_or_compute("a", lambda: "new-a") == "A"
+    assert cache.get_or_compute("b", lambda: "new-b") == "new-b"
+
+
+def test_query_cache_semantic_hit():
+    """Test that a similar query embedding reuses the cached result."""
+    from src.core.store import QueryCache
+
+    vectors = {
+        "ai trends": [1.0, 0.0, 0.0],
+        "trends in ai": [0.99, 0.05, 0.0],
+        "cooking": [0.0, 0.0, 1.0],
+    }
+
+    def embed(texts):
+        return [vectors[texts[0]]]
+
+    cache = QueryCache(embed=embed, threshold=0.95)
+
+    assert cache.get_or_compute("ai trends", lambda: "AI") == "AI"
+    assert cache.get_or_compute("trends in ai", lambda: "unused") == "AI"
+    assert cache.get_or_compute("cooking", lambda: "FOOD") == "FOOD"
+
+
+def test_query_cache_quantizes_embeddings():
+    """Test that cached embeddings are stored as unit-scaled int8 arrays."""
+    from array import array
+
+    from src.core.store import QueryCache
+
+    cache = QueryCache(embed=lambda texts: [[3.0, 4.0]])
+    cache.get_or_compute("q", lambda: "result")
+
+    _, _, vector = cache._entries["q"]
+    assert vector == array("b", [76, 102])
@@ -291,6 +291,16 @@ class TestTerminalExecutorOutputTruncation:
         assert len(result.stderr) <= 1024 * 1024 + 200  # Small buffer for message
         assert "[Output truncated" in result.stderr
     
+    @pytest.mark.asyncio
+    async def test_truncated_output_keeps_exact_prefix(self, executor):
+        """Test that truncation keeps exactly the first 1MB plus the marker."""
+        result = await executor.execute(
+            "python3",
+            ["-c", "import sys; sys.stdout.write('ab' * (1024 * 1024))"]
+        )
+        
+        assert result.stdout == "ab" * (512 * 1024) + "\n[Output truncated at 1MB limit]"
+    
     @pytest.mark.asyncio
     async def test_small_output_not_truncated(self, executor):
         """Test that small outputs are not truncated."""
@@ -0,0 +1,140 @@
+"""
+Tests for Gateway micro-batching.
+
+Tests MicroBatcher:
+- Concurrent submissions coalesce into one batch
+- max_batch_size splits batches
+- Per-item exceptions only fail their own submitter
+- A failing batch_fn fails every submitter in the batch
+- Full batches run concurrently
+- Cancelled submitters are dropped before dispatch
+"""
+
+import asyncio
+
+import pytest
+
+from src.gateway.batching import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_one_batch() -> None:
+    """Test that concurrent submissions are sent as a single batch."""
+    calls: list[list[int]] = []
+
+    async def batch_fn(items: list[int]) -> list[int]:
+        calls.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_latency_ms=20)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert calls == [[0, 1, 2, 3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_batches() -> None:
+    """Test that batches never exceed max_batch_size."""
+    calls: list[list[int]] = []
+
+    async def batch_fn(items: list[int]) -> list[int]:
+        calls.append(items)
+        return items
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=2, max_latency_ms=20)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [0, 1, 2, 3, 4]
+    assert [len(c) for c in calls] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_item_exception_only_fails_its_submitter() -> None:
+    """Test that an exception result is raised only for the matching item."""
+
+    async def batch_fn(items: list[int]) -> list[object]:
+        return [ValueError("bad") if item == 1 else item for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_latency_ms=20)
+
+    results = await asyncio.gather(
+        *(batcher.submit(i) for i in range(3)), return_exceptions=True
+    )
+
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_fn_error_fails_whole_batch() -> None:
+    """Test that a raising batch_fn propagates to every submitter."""
+
+    async def batch_fn(items: list[int]) -> list[int]:
+        raise RuntimeError("backend down")
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_latency_ms=20)
+
+    results = await asyncio.gather(
+        *(batcher.submit(i) for i in range(2)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_full_batches_run_concurrently() -> None:
+    """Test that a second full batch starts while the first is still running."""
+    active = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def batch_fn(items: list[int]) -> list[int]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        if peak >= 2:
+            release.set()
+        await asyncio.wait_for(release.wait(), timeout=1)
+        active -= 1
+        return items
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=2, max_latency_ms=20)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+
+    assert results == [0, 1, 2, 3]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_submit_dropped_before_dispatch() -> None:
+    """Test that an item cancelled while its batch collects is never sent."""
+    calls: list[list[int]] = []
+
+    async def batch_fn(items: list[int]) -> list[int]:
+        calls.append(items)
+        return items
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_latency_ms=50)
+
+    cancelled = asyncio.ensure_future(batcher.submit(0))
+    kept = asyncio.ensure_future(batcher.submit(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == 1
+    assert calls == [[1]]
+
+
+def test_invalid_batch_size() -> None:
+    """Test that max_batch_size must be positive."""
+
+    async def batch_fn(items: list[int]) -> list[int]:
+        return items
+
+    with pytest.raises(ValueError):
+        MicroBatcher(batch_fn, max_batch_size=0)
@@ -4,6 +4,8 @@ Tests for Gateway Pydantic models.
 Tests validation logic for Google Chat webhook/response models and health check.
 """
 
+from datetime import UTC, datetime
+
 import pytest
 from pydantic import ValidationError
 
@@ -13,6 +15,10 @@ from src.gateway.models import (
     GoogleChatSender,
     GoogleChatWebhook,
     HealthCheckResponse,
+    build_workspace_response,
+    build_workspace_response_json,
+    dump_response,
+    parse_webhook,
 )
 
 
@@ -61,7 +67,7 @@ class TestGoogleChatMessage:
             )
         
         errors = exc_info.value.errors()
-        assert any("empty" in str(e["msg"]).lower() for e in errors)
+        assert any(e["type"] == "string_too_short" for e in errors)
 
     def test_message_whitespace_only_text(self) -> None:
         """Test that whitespace-only text is rejected."""
@@ -72,7 +78,15 @@ class TestGoogleChatMessage:
             )
         
         errors = exc_info.value.errors()
-        assert any("empty" in str(e["msg"]).lower() for e in errors)
+        assert any(e["type"] == "string_pattern_mismatch" for e in errors)
+
+    def test_message_text_with_surrounding_whitespace(self) -> None:
+        """Test that text with surrounding whitespace is accepted unchanged."""
+        message = GoogleChatMessage(
+            sender={"email": "user@example.com"},  # type: ignore
+            text="  hi\n",
+        )
+        assert message.text == "  hi\n"
 
     def test_message_missing_sender(self) -> None:
         """Test that sender is required."""
@@ -120,6 +134,15 @@ class TestGoogleChatWebhook:
         assert "space" not in message_dict
         assert "thread" not in message_dict
 
+    def test_webhook_is_frozen(self) -> None:
+        """Test that validated webhooks can't be mutated."""
+        webhook = GoogleChatWebhook(
+            message={"sender": {"email": "user@example.com"}, "text": "Hello"}  # type: ignore
+        )
+
+        with pytest.raises(ValidationError):
+            webhook.message.text = "Tampered"  # type: ignore[misc]
+
     def test_webhook_missing_message(self) -> None:
         """Test that message is required."""
         with pytest.raises(ValidationError) as exc_info:
@@ -184,7 +207,7 @@ class TestHealthCheckResponse:
             checks={"agent_core": "ok"},
         )
         assert response.status == "healthy"
-        assert response.timestamp == "2026-02-11T22:00:00Z"
+        assert response.timestamp == datetime(2026, 2, 11, 22, 0, tzinfo=UTC)
         assert response.version == "1.0.0"
         assert response.checks == {"agent_core": "ok"}
 
@@ -234,7 +257,7 @@ class TestHealthCheckResponse:
             )
         
         errors = exc_info.value.errors()
-        assert any("iso8601" in str(e["msg"]).lower() for e in errors)
+        assert any(e["type"] == "datetime_from_date_parsing" for e in errors)
 
     def test_valid_timestamp_without_z(self) -> None:
         """Test that timestamp without Z suffix is accepted."""
@@ -242,4 +265,86 @@ class TestHealthCheckResponse:
             status="healthy",
             timestamp="2026-02-11T22:00:00+00:00",
         )
-        assert response.timestamp == "2026-02-11T22:00:00+00:00"
+        assert response.timestamp == datetime(2026, 2, 11, 22, 0, tzinfo=UTC)
+
+    def test_timestamp_serialized_as_iso8601(self) -> None:
+        """Test that datetime timestamps serialize to ISO8601 strings."""
+        response = HealthCheckResponse(
+            status="healthy",
+            timestamp=datetime(2026, 2, 11, 22, 0, tzinfo=UTC),
+        )
+        assert response.model_dump(mode="json")["timestamp"] == "2026-02-11T22:00:00Z"
+
+
+class TestAdapters:
+    """Tests for the precompiled parse_webhook / dump_response helpers."""
+
+    def test_models_need_no_forward_ref_rebuild(self) -> None:
+        """Test that no gateway model is left waiting on a forward-ref rebuild."""
+        import src.gateway.models_response as models_response
+
+        for cls in (GoogleChatSender, GoogleChatMessage, GoogleChatWebhook):
+            assert cls.__pydantic_complete__, cls.__name__
+        for cls in (GoogleChatResponse, HealthCheckResponse, models_response.CronTickResponse):
+            # Deferred models resolve every annotation on their first build
+            cls.model_rebuild(raise_errors=True)
+            assert cls.__pydantic_complete__, cls.__name__
+
+    def test_parse_webhook_bytes(self) -> None:
+        """Test parsing a raw webhook body straight from bytes."""
+        raw = b'{"message": {"sender": {"email": "user@example.com"}, "text": "Hi"}}'
+
+        webhook = parse_webhook(raw)
+
+        assert isinstance(webhook, GoogleChatWebhook)
+        assert webhook.message.sender.email == "user@example.com"
+        assert webhook.message.text == "Hi"
+
+    def test_parse_webhook_invalid(self) -> None:
+        """Test that parse_webhook raises ValidationError on bad payloads."""
+        with pytest.raises(ValidationError):
+            parse_webhook(b'{"message": {"sender": {"email": "user@example.com"}}}')
+
+    def test_dump_response(self) -> None:
+        """Test that dump_response emits the model's JSON bytes."""
+        response = GoogleChatResponse(text="Hello")
+
+        assert dump_response(response) == response.model_dump_json().encode()
+
+    def test_dump_response_unknown_model(self) -> None:
+        """Test that dump_response rejects non-response models."""
+        with pytest.raises(KeyError):
+            dump_response(GoogleChatSender(email="user@example.com"))
+
+    def test_build_workspace_response(self) -> None:
+        """Test the Workspace Add-on response envelope."""
+        response = build_workspace_response("Hello!")
+
+        assert response == {
+            "hostAppDataAction": {
+                "chatDataAction": {"createMessageAction": {"message": {"text": "Hello!"}}}
+            }
+        }
+
+    def test_build_workspace_response_json_escapes_text(self) -> None:
+        """Test that the JSON builder round-trips quotes and unicode."""
+        import json
+
+        text = 'Quote " and emoji 🎉'
+
+        raw = build_workspace_response_json(text)
+
+        assert json.loads(raw) == build_workspace_response(text)
+
+    def test_build_workspace_response_json_matches_dict_encoding(self) -> None:
+        """Test that the spliced template equals encoding the full dict."""
+        import orjson
+
+        text = "Line 1\nLine 2 \\ \"quoted\""
+
+        assert build_workspace_response_json(text) == orjson.dumps(build_workspace_response(text))
+
+    def test_build_workspace_response_json_too_long(self) -> None:
+        """Test that the direct builder enforces the 4000 char limit."""
+        with pytest.raises(ValueError, match="4000"):
+            build_workspace_response_json("x" * 4001)
@@ -13,8 +13,14 @@ Tests verify that:
 import hashlib
 
 import pytest
+from pydantic import ValidationError
 
-from src.gateway.pii_filter import FilteredMessage, filter_google_chat_pii
+from src.gateway.pii_filter import (
+    FilteredMessage,
+    filter_google_chat_pii,
+    filter_google_chat_pii_json,
+    hash_emails,
+)
 
 
 class TestFilterGoogleChatPII:
@@ -32,16 +38,16 @@ class TestFilterGoogleChatPII:
         result = filter_google_chat_pii(webhook)
 
         # Verify structure
-        assert isinstance(result, dict)
-        assert set(result.keys()) == {"user_id", "content"}
+        assert isinstance(result, FilteredMessage)
+        assert result._fields == ("user_id", "content")
 
         # Verify user_id is hashed (not email)
-        assert result["user_id"] != "user@example.com"
-        assert "@" not in result["user_id"]
-        assert len(result["user_id"]) == 16  # First 16 chars of SHA-256 hex
+        assert result.user_id != "user@example.com"
+        assert "@" not in result.user_id
+        assert len(result.user_id) == 16  # First 16 chars of SHA-256 hex
 
         # Verify content is preserved
-        assert result["content"] == "Remember that I prefer Python"
+        assert result.content == "Remember that I prefer Python"
 
     def test_filter_pii_strips_metadata(self) -> None:
         """Test that Google Chat metadata is stripped from output."""
@@ -61,7 +67,7 @@ class TestFilterGoogleChatPII:
         result = filter_google_chat_pii(webhook)
 
         # Only user_id and content should be in result
-        assert set(result.keys()) == {"user_id", "content"}
+        assert result._fields == ("user_id", "content")
 
         # Verify no metadata leaked into result values
         assert "space" not in str(result)
@@ -89,10 +95,10 @@ class TestFilterGoogleChatPII:
         result2 = filter_google_chat_pii(webhook2)
 
         # Same email should produce same user_id (enables conversation continuity)
-        assert result1["user_id"] == result2["user_id"]
+        assert result1.user_id == result2.user_id
 
         # But content should be different
-        assert result1["content"] != result2["content"]
+        assert result1.content != result2.content
 
     def test_filter_pii_different_emails(self) -> None:
         """Test that different emails produce different user_ids (uniqueness)."""
@@ -113,10 +119,10 @@ class TestFilterGoogleChatPII:
         result2 = filter_google_chat_pii(webhook2)
 
         # Different emails should produce different user_ids
-        assert result1["user_id"] != result2["user_id"]
+        assert result1.user_id != result2.user_id
 
         # Content should be same (not email-dependent)
-        assert result1["content"] == result2["content"]
+        assert result1.content == result2.content
 
     def test_filter_pii_hashing_algorithm(self) -> None:
         """Test that hashing uses SHA-256 and produces expected format."""
@@ -134,10 +140,10 @@ class TestFilterGoogleChatPII:
         expected_hash = hashlib.sha256(email.encode("utf-8")).hexdigest()[:16]
 
         # Verify result matches expected hash
-        assert result["user_id"] == expected_hash
+        assert result.user_id == expected_hash
 
         # Verify hash is hex string (0-9, a-f)
-        assert all(c in "0123456789abcdef" for c in result["user_id"])
+        assert all(c in "0123456789abcdef" for c in result.user_id)
 
     def test_filter_pii_unicode_email(self) -> None:
         """Test that unicode characters in email are handled correctly."""
@@ -151,8 +157,8 @@ class TestFilterGoogleChatPII:
         result = filter_google_chat_pii(webhook)
 
         # Should not raise exception
-        assert len(result["user_id"]) == 16
-        assert result["content"] == "Test with unicode: 🎉"
+        assert len(result.user_id) == 16
+        assert result.content == "Test with unicode: 🎉"
 
     def test_filter_pii_missing_email(self) -> None:
         """Test error handling when email is missing."""
@@ -222,8 +228,8 @@ class TestFilterGoogleChatPII:
 
         # Empty string should still produce a hash
         expected_hash = hashlib.sha256("".encode("utf-8")).hexdigest()[:16]
-        assert result["user_id"] == expected_hash
-        assert len(result["user_id"]) == 16
+        assert result.user_id == expected_hash
+        assert len(result.user_id) == 16
 
     def test_filter_pii_empty_text(self) -> None:
         """Test behavior with empty string text (should preserve empty string)."""
@@ -237,8 +243,8 @@ class TestFilterGoogleChatPII:
         result = filter_google_chat_pii(webhook)
 
         # Empty text should be preserved (validation happens in Pydantic models)
-        assert result["content"] == ""
-        assert len(result["user_id"]) == 16
+        assert result.content == ""
+        assert len(result.user_id) == 16
 
     def test_filter_pii_case_sensitivity(self) -> None:
         """Test that email case affects hashing (SHA-256 is case-sensitive)."""
@@ -260,15 +266,85 @@ class TestFilterGoogleChatPII:
 
         # Different case should produce different hashes
         # (This is expected SHA-256 behavior)
-        assert result1["user_id"] != result2["user_id"]
+        assert result1.user_id != result2.user_id
 
     def test_filtered_message_type(self) -> None:
-        """Test that FilteredMessage TypedDict has correct structure."""
-        # This test ensures the TypedDict definition matches usage
-        filtered: FilteredMessage = {
-            "user_id": "a1b2c3d4e5f6g7h8",
-            "content": "Test message",
+        """Test that FilteredMessage NamedTuple has correct structure."""
+        # This test ensures the NamedTuple definition matches usage
+        filtered = FilteredMessage(user_id="a1b2c3d4e5f6g7h8", content="Test message")
+
+        assert filtered.user_id == "a1b2c3d4e5f6g7h8"
+        assert filtered.content == "Test message"
+        assert filtered._asdict() == {"user_id": "a1b2c3d4e5f6g7h8", "content": "Test message"}
+
+    def test_filter_pii_hash_cached(self) -> None:
+        """Test that repeat senders reuse the memoized hash."""
+        from src.gateway.pii_filter import _hash_email
+
+        _hash_email.cache_clear()
+        webhook = {
+            "message": {
+                "sender": {"email": "repeat@example.com"},
+                "text": "Hello",
+            }
         }
 
-        assert filtered["user_id"] == "a1b2c3d4e5f6g7h8"
-        assert filtered["content"] == "Test message"
+        first = filter_google_chat_pii(webhook)
+        second = filter_google_chat_pii(webhook)
+
+        assert first.user_id == second.user_id
+        info = _hash_email.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestFilterGoogleChatPIIJson:
+    """Tests for filter_google_chat_pii_json (raw bytes entry point)."""
+
+    def test_filter_pii_json_matches_dict_path(self) -> None:
+        """Test that raw bytes filter to the same result as the dict path."""
+        raw = (
+            b'{"message": {"sender": {"email": "user@example.com", "displayName": "U"},'
+            b' "text": "Hello", "space": {"name": "spaces/xxx"}}}'
+        )
+        webhook = {
+            "message": {
+                "sender": {"email": "user@example.com"},
+                "text": "Hello",
+            }
+        }
+
+        result = filter_google_chat_pii_json(raw)
+
+        assert result == filter_google_chat_pii(webhook)
+        assert result._fields == ("user_id", "content")
+
+    def test_filter_pii_json_missing_email(self) -> None:
+        """Test that a body without sender email fails validation."""
+        with pytest.raises(ValidationError):
+            filter_google_chat_pii_json(b'{"message": {"sender": {}, "text": "Hello"}}')
+
+    def test_filter_pii_json_invalid_json(self) -> None:
+        """Test that malformed JSON fails validation."""
+        with pytest.raises(ValidationError):
+            filter_google_chat_pii_json(b'{"message": ')
+
+
+class TestHashEmails:
+    """Tests for the batch hash_emails entry point."""
+
+    def test_hash_emails_matches_single_filter(self) -> None:
+        """Test that batch hashing matches per-message user_ids in order."""
+        emails = ["a@example.com", "b@example.com", "a@example.com"]
+
+        user_ids = hash_emails(emails)
+
+        expected = [
+            filter_google_chat_pii({"message": {"sender": {"email": e}, "text": "x"}}).user_id
+            for e in emails
+        ]
+        assert user_ids == expected
+        assert user_ids[0] == user_ids[2]
+
+    def test_hash_emails_empty(self) -> None:
+        """Test that an empty batch returns an empty list."""
+        assert hash_emails([]) == []
@@ -3,10 +3,13 @@ Tests for Gateway FastAPI server.
 
 Tests both endpoints:
 - POST /webhook: Google Chat message handling
+- POST /webhook/stream: Streamed agent replies
 - GET /health: Health check
 """
 
 import os
+import subprocess
+import sys
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -103,6 +106,18 @@ class TestWebhookEndpoint:
         # Pydantic validation should reject empty text
         assert response.status_code == 422
 
+    def test_webhook_malformed_json(self, allowed_users_env: None) -> None:
+        """Test that a body that isn't valid JSON is rejected with 422."""
+        client = TestClient(app)
+        response = client.post(
+            "/webhook",
+            content=b'{"message": ',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+        assert "detail" in response.json()
+
     def test_webhook_missing_allowed_users_env(self) -> None:
         """Test webhook when ALLOWED_USERS env var is not set."""
         # Clear ALLOWED_USERS env var
@@ -207,6 +222,169 @@ class TestWebhookEndpoint:
             assert response.status_code == 200, f"Failed for {email}"
 
 
+    def test_webhook_trailing_comma_does_not_allow_empty_email(self) -> None:
+        """Test that a blank ALLOWED_USERS entry doesn't authorize an empty sender."""
+        os.environ["ALLOWED_USERS"] = "user@example.com,"
+        payload = {
+            "message": {
+                "sender": {"email": ""},
+                "text": "Hello",
+            }
+        }
+
+        client = TestClient(app)
+        response = client.post("/webhook", json=payload)
+
+        assert response.status_code == 401
+
+
+    def test_webhook_skips_model_dump(self, allowed_users_env: None) -> None:
+        """Test that the validated payload is PII-filtered without a model_dump() copy."""
+        from src.gateway.models_request import GoogleChatMessage, GoogleChatWebhook
+
+        payload = {
+            "message": {
+                "sender": {"email": "user@example.com"},
+                "text": "Hello",
+            }
+        }
+
+        with (
+            patch.object(GoogleChatWebhook, "model_dump", side_effect=AssertionError),
+            patch.object(GoogleChatMessage, "model_dump", side_effect=AssertionError),
+        ):
+            client = TestClient(app)
+            response = client.post("/webhook", json=payload)
+
+        assert response.status_code == 200
+
+
+    def test_webhook_batches_abatch_agents(self, allowed_users_env: None) -> None:
+        """Test that agents exposing abatch() are called through the batcher."""
+        from types import SimpleNamespace
+
+        class BatchingAgent:
+            async def ainvoke(self, agent_input, config=None):  # pragma: no cover
+                raise AssertionError("ainvoke should not be called directly")
+
+            async def abatch(self, inputs, config=None, return_exceptions=False):
+                return [
+                    {"messages": [SimpleNamespace(content=f"Batched: {i['messages'][0]['content']}")]}
+                    for i in inputs
+                ]
+
+        payload = {
+            "message": {
+                "sender": {"email": "user@example.com"},
+                "text": "Hello",
+            }
+        }
+
+        with (
+            patch("src.gateway.server.agent_core", BatchingAgent()),
+            patch("src.gateway.server._BATCH_MAX_SIZE", 8),
+        ):
+            client = TestClient(app)
+            response = client.post("/webhook", json=payload)
+
+        assert response.status_code == 200
+        assert response.json()["text"] == "Batched: Hello"
+
+    def test_webhook_batching_off_by_default(self, allowed_users_env: None) -> None:
+        """Test that abatch() agents are called with ainvoke() unless BATCH_MAX_SIZE > 1."""
+        from types import SimpleNamespace
+
+        class BatchingAgent:
+            async def ainvoke(self, agent_input, config=None):
+                return {"messages": [SimpleNamespace(content="Direct")]}
+
+            async def abatch(self, inputs, config=None, return_exceptions=False):  # pragma: no cover
+                raise AssertionError("abatch should not be used by default")
+
+        payload = {
+            "message": {
+                "sender": {"email": "user@example.com"},
+                "text": "Hello",
+            }
+        }
+
+        with patch("src.gateway.server.agent_core", BatchingAgent()):
+            client = TestClient(app)
+            response = client.post("/webhook", json=payload)
+
+        assert response.status_code == 200
+        assert response.json()["text"] == "Direct"
+
+
+class TestWebhookStreamEndpoint:
+    """Tests for POST /webhook/stream endpoint."""
+
+    payload = {
+        "message": {
+            "sender": {"email": "user@example.com"},
+            "text": "Hello",
+        }
+    }
+
+    @pytest.fixture(autouse=True)
+    def allowed_users_env(self, monkeypatch) -> None:
+        """Set ALLOWED_USERS env var for tests."""
+        monkeypatch.setenv("ALLOWED_USERS", "user@example.com")
+
+    def test_stream_forwards_ai_chunks_only(self) -> None:
+        """Test that only the model's text chunks are streamed, in order."""
+        from types import SimpleNamespace
+
+        class StreamingAgent:
+            async def astream(self, agent_input, config=None, stream_mode=None):
+                assert stream_mode == "messages"
+                yield SimpleNamespace(type="AIMessageChunk", content="Hel"), {}
+                yield SimpleNamespace(type="tool", content="tool output"), {}
+                yield SimpleNamespace(type="AIMessageChunk", content=""), {}
+                yield SimpleNamespace(type="AIMessageChunk", content="lo!"), {}
+
+        with patch("src.gateway.server.agent_core", StreamingAgent()):
+            client = TestClient(app)
+            response = client.post("/webhook/stream", json=self.payload)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text == "Hello!"
+
+    def test_stream_falls_back_to_process_message(self) -> None:
+        """Test that agents without astream() send their reply as one chunk."""
+        client = TestClient(app)
+        response = client.post("/webhook/stream", json=self.payload)
+
+        assert response.status_code == 200
+        assert response.text.startswith("Echo: Hello")
+
+    def test_stream_unauthorized_user(self) -> None:
+        """Test that the allowlist is checked before streaming starts."""
+        payload = {"message": {"sender": {"email": "hacker@evil.com"}, "text": "Hi"}}
+
+        client = TestClient(app)
+        response = client.post("/webhook/stream", json=payload)
+
+        assert response.status_code == 401
+
+    def test_stream_agent_failure_ends_stream(self) -> None:
+        """Test that an agent error mid-stream ends the body instead of raising."""
+        from types import SimpleNamespace
+
+        class FailingAgent:
+            async def astream(self, agent_input, config=None, stream_mode=None):
+                yield SimpleNamespace(type="AIMessageChunk", content="Partial"), {}
+                raise RuntimeError("model went away")
+
+        with patch("src.gateway.server.agent_core", FailingAgent()):
+            client = TestClient(app)
+            response = client.post("/webhook/stream", json=self.payload)
+
+        assert response.status_code == 200
+        assert response.text == "Partial"
+
+
 class TestHealthEndpoint:
     """Tests for GET /health endpoint."""
 
@@ -239,6 +417,19 @@ class TestHealthEndpoint:
 
         datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
 
+    def test_health_matches_response_model(self) -> None:
+        """Test that the pre-encoded health body validates as HealthCheckResponse."""
+        from src.gateway.models import HealthCheckResponse
+
+        client = TestClient(app)
+        response = client.get("/health")
+
+        assert response.headers["content-type"] == "application/json"
+        health = HealthCheckResponse.model_validate_json(response.content)
+        assert health.status == "healthy"
+        assert health.timestamp.utcoffset() is not None
+        assert response.json()["timestamp"].endswith("Z")
+
     def test_health_multiple_calls(self) -> None:
         """Test that health check can be called multiple times."""
         client = TestClient(app)
@@ -252,6 +443,177 @@ class TestHealthEndpoint:
         assert response3.status_code == 200
 
 
+class TestAgentApi:
+    """Tests for the cached agent API dispatch."""
+
+    def test_resolves_each_api(self) -> None:
+        """Test that each agent shape maps to the right API."""
+        from src.gateway.server import _agent_api
+
+        class Legacy:
+            async def process_message(self, user_id, content, trace_id): ...
+
+        class Sync:
+            def invoke(self, agent_input, config=None): ...
+
+        class Async:
+            async def ainvoke(self, agent_input, config=None): ...
+
+        assert _agent_api(Legacy()) == "process_message"
+        assert _agent_api(Sync()) == "invoke"
+        assert _agent_api(Async()) == "ainvoke"
+
+    def test_probes_once_per_agent(self) -> None:
+        """Test that repeat lookups for the same agent skip the hasattr probes."""
+        from src.gateway.server import _agent_api
+
+        probes: list[str] = []
+
+        class Probed:
+            def __getattr__(self, name: str):
+                probes.append(name)
+                raise AttributeError(name)
+
+        agent = Probed()
+        assert _agent_api(agent) == "process_message"
+        first = len(probes)
+        assert _agent_api(agent) == "process_message"
+
+        assert len(probes) == first
+        # A different agent object is resolved afresh
+        assert _agent_api(Probed()) == "process_message"
+        assert len(probes) == 2 * first
+
+
+class TestTraceIdMiddleware:
+    """Tests for request-scoped trace_id assignment."""
+
+    def test_propagates_incoming_trace_id(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a caller's X-Trace-Id is reused as the request trace_id."""
+        monkeypatch.delenv("CRON_SECRET", raising=False)
+
+        client = TestClient(app)
+        response = client.post(
+            "/cron/tick", headers={"X-Cloudscheduler": "true", "X-Trace-Id": "upstream-123"}
+        )
+
+        assert response.json()["trace_id"] == "upstream-123"
+
+    def test_generates_trace_id_for_oversized_header(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an oversized X-Trace-Id is replaced with a fresh id."""
+        monkeypatch.delenv("CRON_SECRET", raising=False)
+
+        client = TestClient(app)
+        response = client.post(
+            "/cron/tick", headers={"X-Cloudscheduler": "true", "X-Trace-Id": "x" * 65}
+        )
+
+        trace_id = response.json()["trace_id"]
+        assert len(trace_id) == 32
+        int(trace_id, 16)
+
+    def test_exception_handler_reuses_trace_id(self) -> None:
+        """Test that unhandled errors report the request's trace_id."""
+        with patch("src.gateway.server.parse_webhook", side_effect=RuntimeError("boom")):
+            client = TestClient(app, raise_server_exceptions=False)
+            response = client.post(
+                "/webhook", content=b"{}", headers={"X-Trace-Id": "req-trace"}
+            )
+
+        assert response.status_code == 500
+        assert response.json() == {"error": "Internal server error", "trace_id": "req-trace"}
+
+
+class TestOrjsonResponse:
+    """Tests for the orjson-backed default response class."""
+
+    def test_app_default_response_class(self) -> None:
+        """Test that the app renders plain returns through OrjsonResponse."""
+        from src.gateway.server import OrjsonResponse
+
+        assert app.router.default_response_class is OrjsonResponse
+
+    def test_render_datetime_utc_z(self) -> None:
+        """Test that UTC datetimes render as ISO8601 with a Z suffix."""
+        from datetime import UTC, datetime
+
+        from src.gateway.server import OrjsonResponse
+
+        response = OrjsonResponse({"at": datetime(2026, 2, 11, 22, 0, tzinfo=UTC)}, status_code=500)
+
+        assert response.body == b'{"at":"2026-02-11T22:00:00Z"}'
+        assert response.status_code == 500
+        assert response.media_type == "application/json"
+
+
+class TestLogStructured:
+    """Tests for the structured JSON log helper."""
+
+    def test_log_entry_fields(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that log lines carry the envelope, extras and a UTC timestamp."""
+        import json
+        from datetime import datetime
+
+        from src.gateway.server import log_structured
+
+        with caplog.at_level("INFO", logger="src.gateway.server"):
+            log_structured("INFO", "Hello", trace_id="abc", count=3)
+
+        entry = json.loads(caplog.records[-1].getMessage())
+        assert entry["severity"] == "INFO"
+        assert entry["message"] == "Hello"
+        assert entry["component"] == "gateway"
+        assert entry["trace_id"] == "abc"
+        assert entry["count"] == 3
+        assert entry["timestamp"].endswith("Z")
+        datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00"))
+
+    def test_disabled_level_skips_serialization(self) -> None:
+        """Test that lines below the logger's level are never serialized."""
+        from src.gateway import server
+
+        with (
+            patch.object(server.logger, "isEnabledFor", return_value=False),
+            patch("src.gateway.server.orjson.dumps") as mock_dumps,
+        ):
+            server.log_structured("DEBUG", "Dropped", count=1)
+
+        mock_dumps.assert_not_called()
+
+    def test_trace_id_from_context(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the bound request trace_id is added to every line."""
+        import json
+
+        from src.gateway.server import log_structured, trace_id_var
+
+        token = trace_id_var.set("bound-trace")
+        try:
+            with caplog.at_level("INFO", logger="src.gateway.server"):
+                log_structured("INFO", "Bound")
+        finally:
+            trace_id_var.reset(token)
+        with caplog.at_level("INFO", logger="src.gateway.server"):
+            log_structured("INFO", "Unbound")
+
+        bound, unbound = (json.loads(r.getMessage()) for r in caplog.records[-2:])
+        assert bound["trace_id"] == "bound-trace"
+        assert "trace_id" not in unbound
+
+    def test_webhook_lines_share_trace_id(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that every log line from one webhook request has the same trace_id."""
+        import json
+
+        os.environ["ALLOWED_USERS"] = "user@example.com"
+        payload = {"message": {"sender": {"email": "user@example.com"}, "text": "Hi"}}
+
+        with caplog.at_level("INFO", logger="src.gateway.server"):
+            TestClient(app).post("/webhook", json=payload)
+
+        entries = [json.loads(r.getMessage()) for r in caplog.records if r.name == "src.gateway.server"]
+        assert len(entries) >= 3
+        assert len({entry["trace_id"] for entry in entries}) == 1
+
+
 class TestTruncateResponse:
     """Tests for truncate_response helper function."""
 
@@ -286,6 +648,13 @@ class TestTruncateResponse:
         assert result.startswith("xxx")
         assert "truncated" in result.lower()
 
+    def test_truncate_result_fits_max_length(self) -> None:
+        """Test that the truncated text including the marker fits max_length."""
+        from src.gateway.server import truncate_response
+
+        assert len(truncate_response("x" * 5000)) == 4000
+        assert len(truncate_response("x" * 1000, max_length=500)) == 500
+
     def test_truncate_custom_max_length(self) -> None:
         """Test truncation with custom max_length."""
         from src.gateway.server import truncate_response
@@ -295,3 +664,55 @@ class TestTruncateResponse:
 
         assert len(result) <= 530  # 500 + truncation message
         assert "truncated" in result.lower()
+
+
+class TestLazyResponseModels:
+    """Tests that outbound models stay off the import path."""
+
+    def test_routes_registered_once(self) -> None:
+        """Test that each endpoint is registered on the single app exactly once."""
+        from fastapi.routing import APIRoute
+
+        from src.gateway.main import app as entrypoint_app
+
+        keys = [
+            (route.path, method)
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            for method in route.methods
+        ]
+
+        assert entrypoint_app is app
+        assert len(keys) == len(set(keys))
+
+    def test_routes_skip_response_model_validation(self) -> None:
+        """Test that no endpoint re-validates its own output through response_model."""
+        from fastapi.routing import APIRoute
+
+        routes = [route for route in app.routes if isinstance(route, APIRoute)]
+
+        assert routes
+        for route in routes:
+            assert route.response_model is None, route.path
+
+    def test_server_import_skips_response_models(self) -> None:
+        """Test that importing the server doesn't load models_response."""
+        code = (
+            "import sys, src.gateway.server; "
+            "sys.exit('src.gateway.models_response' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_health_skips_response_models(self) -> None:
+        """Test that serving /health never builds a HealthCheckResponse."""
+        code = (
+            "import sys; from fastapi.testclient import TestClient; "
+            "from src.gateway.server import app; "
+            "assert TestClient(app).get('/health').status_code == 200; "
+            "sys.exit('src.gateway.models_response' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+        assert result.returncode == 0, result.stderr.decode()
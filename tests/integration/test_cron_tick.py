@@ -74,6 +74,10 @@ class TestCronTick:
         assert "timestamp" in data
         assert "trace_id" in data
         assert "metrics" in data
+
+        # 128-bit random trace id, hex encoded
+        assert len(data["trace_id"]) == 32
+        int(data["trace_id"], 16)
     
     def test_tick_requires_authentication(self, test_client, monkeypatch):
         """Test that /cron/tick requires authentication when CRON_SECRET is set."""
@@ -98,9 +102,42 @@ class TestCronTick:
         )
         assert response.status_code == 200
         
+        # Scheme with an empty token - should fail with 401
+        response = test_client.post(
+            "/cron/tick",
+            headers={"Authorization": "Bearer "}
+        )
+        assert response.status_code == 401
+
+        # Non-ASCII token - rejected rather than erroring
+        response = test_client.post(
+            "/cron/tick",
+            headers={"Authorization": "Bearer t\u00e9st".encode()},
+        )
+        assert response.status_code == 401
+
         # Call with X-Cloudscheduler header - should also succeed
         response = test_client.post(
             "/cron/tick",
             headers={"X-Cloudscheduler": "true"}
         )
         assert response.status_code == 200
+
+    def test_tick_reports_scheduler_status_error(self, test_client, test_agent, monkeypatch):
+        """Test that ok=False from the scheduler becomes an error response."""
+        from unittest.mock import AsyncMock
+
+        monkeypatch.delenv("CRON_SECRET", raising=False)
+        scheduler = MagicMock()
+        scheduler.run_tick = AsyncMock(
+            return_value={"ok": False, "error": "bucket unavailable", "error_type": "OSError"}
+        )
+        monkeypatch.setattr(test_agent, "scheduler", scheduler)
+
+        response = test_client.post("/cron/tick", headers={"X-Cloudscheduler": "true"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "error"
+        assert data["metrics"]["error"] == "bucket unavailable"
+        assert data["metrics"]["error_type"] == "OSError"
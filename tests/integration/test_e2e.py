@@ -83,6 +83,7 @@ def test_client_mocked(mock_vertex_ai, monkeypatch, tmp_path):
     monkeypatch.setenv("MEMORY_DIR", str(tmp_path / "memory"))
     monkeypatch.setenv("SKILLS_DIR", "./skills")
     monkeypatch.setenv("GOOGLE_CHAT_FORMAT", "legacy")  # Use legacy format for tests
+    monkeypatch.setenv("VERTEX_WARMUP", "false")  # Keep the fake model's responses in order
     
     # Mock Vertex AI client creation BEFORE importing
     monkeypatch.setattr(
@@ -93,17 +94,17 @@ def test_client_mocked(mock_vertex_ai, monkeypatch, tmp_path):
     # Mock aiplatform.init (no real GCP calls)
     monkeypatch.setattr("google.cloud.aiplatform.init", lambda **kwargs: None)
     
-    # Mock Path.exists to skip credential file check BEFORE importing
-    from pathlib import Path
-    original_exists = Path.exists
+    # Mock os.path.isfile to skip credential file check BEFORE importing
+    original_isfile = os.path.isfile
     monkeypatch.setattr(
-        Path,
-        "exists",
-        lambda self: True if str(self) == "/fake/path.json" else original_exists(self)
+        os.path,
+        "isfile",
+        lambda path: True if path == "/fake/path.json" else original_isfile(path)
     )
     
     # Create app with mocked dependencies
-    from src.main import create_app
+    from src.main import create_app, reset_app_for_tests
+    reset_app_for_tests()
     app = create_app()
     
     return TestClient(app)
@@ -191,3 +192,70 @@ def test_health_check(test_client_mocked):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
+
+
+def test_e2e_webhook_stream(test_client_mocked):
+    """Test streamed flow: webhook/stream → gateway → agent.astream() (MOCKED)."""
+    payload = {
+        "type": "MESSAGE",
+        "message": {
+            "sender": {"email": "test@example.com"},
+            "text": "Hello, how are you?",
+        },
+    }
+
+    response = test_client_mocked.post("/webhook/stream", json=payload)
+
+    assert response.status_code == 200
+    assert response.text == "Mock response from Gemini"
+
+
+def test_unavailable_deep_agent_is_not_attempted(test_client_mocked, monkeypatch):
+    """Test that create_app() skips build_deep_agent() when it can't run."""
+    build_deep_agent = MagicMock()
+    monkeypatch.setattr("src.core.deepagent.is_available", lambda: False)
+    monkeypatch.setattr("src.core.deepagent.build_deep_agent", build_deep_agent)
+
+    from src.main import create_app, reset_app_for_tests
+    reset_app_for_tests()
+    client = TestClient(create_app())
+
+    build_deep_agent.assert_not_called()
+    assert client.get("/health").status_code == 200
+
+
+def test_legacy_agent_impl_skips_deep_agent(test_client_mocked, monkeypatch):
+    """Test EMONK_AGENT_IMPL=legacy builds with build_agent() only."""
+    build_deep_agent = MagicMock()
+    monkeypatch.setenv("EMONK_AGENT_IMPL", "legacy")
+    monkeypatch.setattr("src.core.deepagent.build_deep_agent", build_deep_agent)
+
+    from src.main import create_app, reset_app_for_tests
+    reset_app_for_tests()
+    client = TestClient(create_app())
+
+    payload = {
+        "type": "MESSAGE",
+        "message": {
+            "sender": {"email": "test@example.com"},
+            "text": "Hello",
+        },
+    }
+    response = client.post("/webhook", json=payload)
+    build_deep_agent.assert_not_called()
+    assert response.status_code == 200
+    assert response.json()["text"]
+
+
+def test_create_app_is_built_once(test_client_mocked, monkeypatch):
+    """Test that a second create_app() returns the same app and agent."""
+    from src.gateway import server
+    from src.main import create_app
+
+    agent = server.agent_core
+    build_deep_agent = MagicMock()
+    monkeypatch.setattr("src.core.deepagent.build_deep_agent", build_deep_agent)
+
+    assert create_app() is test_client_mocked.app
+    assert server.agent_core is agent
+    build_deep_agent.assert_not_called()
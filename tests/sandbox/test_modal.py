@@ -2,22 +2,44 @@
 Comprehensive tests for Modal Sandbox Backend.
 
 This test suite ensures coverage of:
-    - Lazy initialization
+    - Lazy initialization and background (eager) start
     - Command execution
     - Timeout handling
     - Lifecycle management (start/stop)
     - Environment variables
     - ImportError when modal is missing
+    - Lazy import of the modal SDK from src.sandbox
     - Filesystem operations
     - Error handling
+    - Shell commands run for real: ls, glob, grep, write/edit, batched uploads/downloads
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import subprocess
+import sys
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
+
+
+@pytest.fixture(autouse=True)
+def clear_image_cache() -> Any:
+    """Keep images and apps cached against one test's mocked modal out of the next."""
+    yield
+    # Not imported here: the import tests need to be the first to load it
+    backend_module = sys.modules.get("src.sandbox.modal")
+    if backend_module is not None:
+        backend_module._IMAGE_CACHE.clear()
+        backend_module._APP_CACHE.clear()
+        backend_module._SANDBOX_SLOTS.clear()
 
 
 class TestModalSandboxImport:
@@ -37,6 +59,16 @@ class TestModalSandboxImport:
                 assert "modal package required" in str(exc_info.value).lower()
                 assert "pip install emonk[modal]" in str(exc_info.value)
 
+    def test_package_import_defers_modal(self) -> None:
+        """Test that importing src.sandbox doesn't load the modal SDK."""
+        code = (
+            "import sys, src.sandbox; "
+            "sys.exit(' '.join(m for m in ('modal', 'src.sandbox.modal') if m in sys.modules) or None)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+        assert result.returncode == 0, result.stderr.decode()
+
     def test_graceful_import_from_init(self) -> None:
         """Test that __init__.py handles missing modal gracefully."""
         # Mock modal as unavailable
@@ -101,7 +133,7 @@ class TestModalSandboxInitialization:
                 assert backend.cpu == 2
                 assert backend.memory_mb == 2048
                 assert len(backend.pip_packages) > 0
-                assert backend.apt_packages == []
+                assert backend.apt_packages == ()
                 assert backend.env_vars == {}
 
     def test_initialization_with_custom_params(self, backend: Any) -> None:
@@ -110,8 +142,8 @@ class TestModalSandboxInitialization:
         assert backend.timeout == 300
         assert backend.cpu == 2
         assert backend.memory_mb == 1024
-        assert backend.pip_packages == ["requests"]
-        assert backend.apt_packages == ["git"]
+        assert backend.pip_packages == ("requests",)
+        assert backend.apt_packages == ("git",)
         assert backend.env_vars == {"TEST_VAR": "test_value"}
 
     def test_sandbox_not_started_on_init(self, backend: Any) -> None:
@@ -120,6 +152,19 @@ class TestModalSandboxInitialization:
         assert backend._sandbox_id is None
         assert backend.id is None
 
+    def test_package_lists_are_frozen_copies(self, mock_modal: Any) -> None:
+        """Test that backends don't share or alias the caller's package lists."""
+        with patch("src.sandbox.modal.modal", mock_modal):
+            with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+                from src.sandbox.modal import DEFAULT_PIP_PACKAGES, ModalSandboxBackend
+
+                packages = ["requests"]
+                backend = ModalSandboxBackend(pip_packages=packages)
+                packages.append("pandas")
+
+                assert backend.pip_packages == ("requests",)
+                assert ModalSandboxBackend().pip_packages is DEFAULT_PIP_PACKAGES
+
     def test_custom_image(self, mock_modal: Any) -> None:
         """Test initialization with custom Modal image."""
         custom_image = MagicMock()
@@ -200,6 +245,83 @@ class TestModalSandboxLifecycle:
         mock_image.apt_install.assert_called_once_with("git")
         mock_image.pip_install.assert_called_once_with("requests")
 
+    @pytest.mark.asyncio
+    async def test_image_reused_across_restarts_and_backends(
+        self, backend: Any, mock_modal_patcher: Any
+    ) -> None:
+        """Test that the image is built once per package set."""
+        from src.sandbox.modal import ModalSandboxBackend
+
+        await backend.start()
+        await backend.stop()
+        await backend.start()
+        # Same packages in another order
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            other = ModalSandboxBackend(pip_packages=["requests"], apt_packages=["git"])
+        await other.start()
+
+        mock_modal_patcher.Image.debian_slim.assert_called_once()
+        images = [call.kwargs["image"] for call in mock_modal_patcher.Sandbox.create.call_args_list]
+        assert len(images) == 3 and all(image is images[0] for image in images)
+
+    @pytest.mark.asyncio
+    async def test_app_looked_up_once_per_name(
+        self, backend: Any, mock_modal_patcher: Any
+    ) -> None:
+        """Test that backends sharing an app_name share one App handle."""
+        from src.sandbox.modal import ModalSandboxBackend
+
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            other = ModalSandboxBackend(app_name="test-sandbox")
+        await backend.start()
+        await other.start()
+
+        mock_modal_patcher.App.lookup.assert_called_once_with(
+            "test-sandbox", create_if_missing=True
+        )
+        apps = [call.kwargs["app"] for call in mock_modal_patcher.Sandbox.create.call_args_list]
+        assert apps == [mock_modal_patcher.App.lookup.return_value] * 2
+
+    @pytest.mark.asyncio
+    async def test_max_sandboxes_waits_for_a_free_slot(
+        self, mock_modal_patcher: Any
+    ) -> None:
+        """Test that start() blocks while max_sandboxes are running."""
+        from src.sandbox.modal import ModalSandboxBackend
+
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            first = ModalSandboxBackend(app_name="capped", max_sandboxes=1)
+            second = ModalSandboxBackend(app_name="capped", max_sandboxes=1)
+        await first.start()
+
+        waiting = asyncio.ensure_future(second.start())
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+        await first.stop()
+        await asyncio.wait_for(waiting, timeout=1)
+        assert second._sandbox is not None
+        assert mock_modal_patcher.Sandbox.create.call_count == 2
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_start_releases_slot(self, mock_modal_patcher: Any) -> None:
+        """Test that a failed Sandbox.create() gives its slot back."""
+        from src.sandbox.modal import ModalSandboxBackend, SandboxError
+
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            backend = ModalSandboxBackend(
+                app_name="capped", max_sandboxes=1, eager_start=False
+            )
+        create = mock_modal_patcher.Sandbox.create
+        create.side_effect = [Exception("boot failed"), create.return_value]
+
+        with pytest.raises(SandboxError):
+            await backend.start()
+        await asyncio.wait_for(backend.start(), timeout=1)
+
+        assert backend._sandbox is not None
+
     @pytest.mark.asyncio
     async def test_start_idempotent(self, backend: Any, mock_modal_patcher: Any) -> None:
         """Test that calling start() multiple times is safe."""
@@ -275,7 +397,7 @@ class TestModalSandboxExecution:
 
         # Mock exec result
         mock_exec_result = MagicMock()
-        mock_exec_result.returncode = 0
+        mock_exec_result.wait = AsyncMock(return_value=0)
         mock_exec_result.stdout = "Hello from sandbox"
         mock_sandbox.exec = AsyncMock(return_value=mock_exec_result)
 
@@ -308,6 +430,50 @@ class TestModalSandboxExecution:
         assert backend._sandbox is not None
         mock_modal_patcher.Sandbox.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_eager_start_boots_in_background(self, mock_modal_patcher: Any) -> None:
+        """Test that a backend created in a running loop starts its sandbox right away."""
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            from src.sandbox.modal import ModalSandboxBackend
+
+            backend = ModalSandboxBackend(app_name="test-sandbox")
+
+        await asyncio.sleep(0)
+        assert backend._sandbox is not None
+
+        await backend.execute("echo 'test'")
+        mock_modal_patcher.Sandbox.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_eager_start_disabled(self, mock_modal_patcher: Any) -> None:
+        """Test that eager_start=False leaves the sandbox for the first execute()."""
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            from src.sandbox.modal import ModalSandboxBackend
+
+            backend = ModalSandboxBackend(app_name="test-sandbox", eager_start=False)
+
+        await asyncio.sleep(0)
+        assert backend._sandbox is None
+
+    @pytest.mark.asyncio
+    async def test_failed_eager_start_surfaces_on_execute(
+        self, mock_modal_patcher: Any
+    ) -> None:
+        """Test that a background start failure is raised by execute(), then retried."""
+        from src.sandbox.modal import SandboxError
+
+        mock_modal_patcher.Sandbox.create.side_effect = [Exception("boot failed"), MagicMock()]
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            from src.sandbox.modal import ModalSandboxBackend
+
+            backend = ModalSandboxBackend(app_name="test-sandbox")
+
+        with pytest.raises(SandboxError, match="boot failed"):
+            await backend.execute("echo 'test'")
+
+        await backend.start()
+        assert backend._sandbox is not None
+
     @pytest.mark.asyncio
     async def test_execute_returns_output(self, backend: Any, mock_modal_patcher: Any) -> None:
         """Test that execute() returns command output."""
@@ -317,6 +483,16 @@ class TestModalSandboxExecution:
         assert result.exit_code == 0
         assert result.truncated is False
 
+    @pytest.mark.asyncio
+    async def test_execute_logs_truncated_command(
+        self, backend: Any, mock_modal_patcher: Any, caplog: Any
+    ) -> None:
+        """Test that the command is logged lazily, cut to 100 characters."""
+        with caplog.at_level(logging.INFO, logger="src.sandbox.modal"):
+            await backend.execute("echo " + "x" * 200)
+
+        assert "Executing command in sandbox: echo " + "x" * 95 in caplog.messages
+
     @pytest.mark.asyncio
     async def test_execute_with_custom_timeout(self, backend: Any, mock_modal_patcher: Any) -> None:
         """Test that execute() respects custom timeout."""
@@ -343,7 +519,7 @@ class TestModalSandboxExecution:
         """Test that execute() handles non-zero exit codes."""
         # Mock failed command
         mock_result = MagicMock()
-        mock_result.returncode = 1
+        mock_result.wait = AsyncMock(return_value=1)
         mock_result.stdout = "Error occurred"
         backend._sandbox = mock_modal_patcher.Sandbox.create.return_value
         backend._sandbox.exec = AsyncMock(return_value=mock_result)
@@ -353,13 +529,26 @@ class TestModalSandboxExecution:
         assert result.exit_code == 1
         assert result.output == "Error occurred"
 
+    @pytest.mark.asyncio
+    async def test_execute_rejects_result_without_stdout(
+        self, backend: Any, mock_modal_patcher: Any
+    ) -> None:
+        """Test that an unknown result shape raises instead of returning its repr."""
+        from src.sandbox.modal import SandboxError
+
+        backend._sandbox = mock_modal_patcher.Sandbox.create.return_value
+        backend._sandbox.exec = AsyncMock(return_value=object())
+
+        with pytest.raises(SandboxError, match="Unsupported Modal result type: object"):
+            await backend.execute("echo 'Hello'")
+
     @pytest.mark.asyncio
     async def test_execute_detects_truncation(self, backend: Any, mock_modal_patcher: Any) -> None:
         """Test that execute() detects truncated output."""
         # Mock large output (>1MB)
         large_output = "x" * (1024 * 1024 + 1)
         mock_result = MagicMock()
-        mock_result.returncode = 0
+        mock_result.wait = AsyncMock(return_value=0)
         mock_result.stdout = large_output
         backend._sandbox = mock_modal_patcher.Sandbox.create.return_value
         backend._sandbox.exec = AsyncMock(return_value=mock_result)
@@ -369,6 +558,49 @@ class TestModalSandboxExecution:
         assert result.truncated is True
 
 
+    @pytest.mark.asyncio
+    async def test_execute_per_call_output_cap(self, backend: Any, mock_modal_patcher: Any) -> None:
+        """Test that max_output_bytes on execute() overrides the backend's cap."""
+        result = await backend.execute("echo 'Hello'", max_output_bytes=5)
+
+        assert result.output == "Hello"
+        assert result.truncated is True
+
+    @pytest.mark.asyncio
+    async def test_execute_stops_reading_streamed_output_at_cap(
+        self, mock_modal_patcher: Any
+    ) -> None:
+        """Test that streamed output is cut at max_output_bytes and the stream closed."""
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            from src.sandbox.modal import ModalSandboxBackend
+
+            backend = ModalSandboxBackend(app_name="test-sandbox", max_output_bytes=10)
+
+        chunks_read = []
+
+        class Stream:
+            aclose = AsyncMock()
+
+            async def __aiter__(self) -> Any:
+                for chunk in ("héllo ", "wörld ", "never read"):
+                    chunks_read.append(chunk)
+                    yield chunk
+
+        stream = Stream()
+        mock_result = MagicMock()
+        mock_result.wait = AsyncMock(return_value=0)
+        mock_result.stdout = stream
+        await backend.start()
+        backend._sandbox.exec = AsyncMock(return_value=mock_result)
+
+        result = await backend.execute("yes")
+
+        assert result.output == "héllo wö"
+        assert result.truncated is True
+        assert chunks_read == ["héllo ", "wörld "]
+        stream.aclose.assert_awaited_once()
+
+
 class TestModalSandboxErrors:
     """Test error handling in sandbox."""
 
@@ -489,11 +721,10 @@ class TestModalSandboxFilesystemOperations:
                 command: str, timeout: int | None = None
             ) -> ExecuteResponse:
                 # Simulate different commands
-                if "ls -la" in command:
-                    # Format with --time-style=+%s: perms links owner group size timestamp . filename
-                    # The . is needed because split(None, 8) expects 9 parts
+                if "-maxdepth" in command:
+                    # ls_info() records: type, size, mtime, path (NUL-terminated)
                     return ExecuteResponse(
-                        output="total 8\n-rw-r--r-- 1 user user 4096 1234567890 . . file.txt\n",
+                        output="f\t4096\t1234567890.5\t/tmp/file.txt\0",
                         exit_code=0,
                         truncated=False,
                     )
@@ -501,12 +732,15 @@ class TestModalSandboxFilesystemOperations:
                     return ExecuteResponse(
                         output="file contents", exit_code=0, truncated=False
                     )
-                elif "echo" in command and ">" in command or "sed" in command:
+                elif "base64 -d" in command:
                     return ExecuteResponse(output="", exit_code=0, truncated=False)
-                elif "find" in command and "-ls" in command:
-                    # Format: inode blocks perms links owner group size date time name
+                elif "python3 -c" in command:
+                    # edit() prints the number of replacements
+                    return ExecuteResponse(output="1\n", exit_code=0, truncated=False)
+                elif "find" in command:
+                    # glob_info() records, same format as ls_info()
                     return ExecuteResponse(
-                        output="12345 8 -rw-r--r-- 1 user user 4096 Jan 1 12:00 ./test.txt\n",
+                        output="f\t4096\t1234567890.5\t./test.txt\0",
                         exit_code=0,
                         truncated=False,
                     )
@@ -532,6 +766,21 @@ class TestModalSandboxFilesystemOperations:
         assert files[0].size == 4096
         assert files[0].is_dir is False
 
+    @pytest.mark.asyncio
+    async def test_grep_raw_skips_unrecognized_lines(self, backend: Any) -> None:
+        """Test that grep parsing keeps names with spaces and skips noise."""
+        from src.sandbox.modal import ExecuteResponse
+
+        async def execute(command: str, timeout: int | None = None) -> ExecuteResponse:
+            return ExecuteResponse(
+                output="Binary file x matches\nsrc/a b.py:3:x = 1:2\n", exit_code=0
+            )
+
+        backend.execute = execute
+
+        [hit] = await backend.grep_raw("x")
+        assert (hit.path, hit.line_number, hit.line_content) == ("src/a b.py", 3, "x = 1:2")
+
     @pytest.mark.asyncio
     async def test_read(self, backend: Any) -> None:
         """Test read returns file contents."""
@@ -663,6 +912,21 @@ class TestModalSandboxEdgeCases:
             backend.execute = mock_execute  # type: ignore[method-assign]
             return backend
 
+    def test_response_types_are_slotted_and_frozen(self) -> None:
+        """Test that result records carry no __dict__ and can be deduplicated."""
+        import dataclasses
+
+        from src.sandbox.modal import GrepMatch
+
+        match = GrepMatch(
+            path="a.py", line_number=1, line_content="x", match_start=0, match_end=1
+        )
+
+        assert not hasattr(match, "__dict__")
+        assert len({match, GrepMatch("a.py", 1, "x", 0, 1)}) == 1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            match.line_number = 2  # type: ignore[misc]
+
     @pytest.mark.asyncio
     async def test_ls_info_handles_error(self, backend: Any) -> None:
         """Test that ls_info raises error on failure."""
@@ -717,3 +981,348 @@ class TestModalSandboxEdgeCases:
         assert len(responses) == 2
         # At least one should fail
         assert not all(r.success for r in responses)
+
+
+class TestModalSandboxLocalShell:
+    """Test generated commands by running them in a local shell.
+
+    Covers write/edit content handling, batched uploads/downloads and the
+    bounded per-file fallback.
+    """
+
+    @pytest.fixture
+    def backend(self, tmp_path: Any) -> Any:
+        """Create backend whose execute() runs commands in a local shell."""
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            from src.sandbox.modal import ExecuteResponse, ModalSandboxBackend
+
+            backend = ModalSandboxBackend(app_name="test-sandbox")
+            backend.commands = []
+            backend.in_flight = 0
+            backend.max_in_flight = 0
+
+            async def mock_execute(
+                command: str, timeout: int | None = None
+            ) -> ExecuteResponse:
+                backend.commands.append(command)
+                backend.in_flight += 1
+                backend.max_in_flight = max(backend.max_in_flight, backend.in_flight)
+                try:
+                    proc = await asyncio.create_subprocess_shell(
+                        command, cwd=tmp_path, stdout=subprocess.PIPE, executable="/bin/bash"
+                    )
+                    stdout, _ = await proc.communicate()
+                finally:
+                    backend.in_flight -= 1
+                return ExecuteResponse(output=stdout.decode(), exit_code=proc.returncode)
+
+            backend.execute = mock_execute  # type: ignore[method-assign]
+            return backend
+
+    @pytest.mark.asyncio
+    async def test_ls_info_lists_entries_sorted(self, backend: Any, tmp_path: Any) -> None:
+        """Test that ls_info reports each entry, including odd names, in name order."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "b\tc\nd.txt").write_text("hello")
+        (tmp_path / "a.txt").write_text("")
+
+        files = await backend.ls_info(str(tmp_path))
+
+        assert [(f.path, f.size, f.is_dir) for f in files] == [
+            (str(tmp_path / "a.txt"), 0, False),
+            (str(tmp_path / "b\tc\nd.txt"), 5, False),
+            (str(tmp_path / "sub"), (tmp_path / "sub").stat().st_size, True),
+        ]
+        assert files[0].modified_time == pytest.approx((tmp_path / "a.txt").stat().st_mtime)
+
+    @pytest.mark.asyncio
+    async def test_write_and_edit_need_no_escaping(self, backend: Any, tmp_path: Any) -> None:
+        """Test that quotes, slashes and regex characters are written and replaced literally."""
+        path = str(tmp_path / "notes.txt")
+        content = "it's a/b [x] $HOME\nit's a/b [x] again"
+
+        written = await backend.write(path, content)
+        edited = await backend.edit(path, "it's a/b [x]", "c\\d's")
+
+        assert written.bytes_written == len(content)
+        assert edited.changes_made == 2
+        assert open(path).read() == "c\\d's $HOME\nc\\d's again"
+
+    @pytest.mark.asyncio
+    async def test_glob_info_name_and_path_patterns(self, backend: Any, tmp_path: Any) -> None:
+        """Test that bare patterns match at any depth and "**/" patterns match paths."""
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        for name in ("top.py", "src/a.py", "src/pkg/b.py", "src/pkg/c.txt"):
+            (tmp_path / name).write_text("x")
+
+        by_name = await backend.glob_info("*.py")
+        by_path = await backend.glob_info("src/**/*.py")
+
+        assert [f.path for f in by_name] == ["./src/a.py", "./src/pkg/b.py", "./top.py"]
+        assert [f.path for f in by_path] == ["./src/a.py", "./src/pkg/b.py"]
+        assert by_name[0].modified_time == pytest.approx((tmp_path / "src/a.py").stat().st_mtime)
+
+    @pytest.mark.asyncio
+    async def test_grep_raw_literal_and_regex_patterns(self, backend: Any, tmp_path: Any) -> None:
+        """Test that literal patterns use grep -F and regex patterns keep their meaning."""
+        (tmp_path / "code.py").write_text("def foo(x):\n    return x -1\n# it's done\n")
+
+        literal = await backend.grep_raw("foo(", "code.py", recursive=False)
+        dash = await backend.grep_raw("-1", "code.py", recursive=False)
+        quote = await backend.grep_raw("it's", ".")
+        regex = await backend.grep_raw("^def f.o", ".")
+
+        assert [m.line_number for m in literal + dash + quote + regex] == [1, 2, 3, 1]
+        assert [command.split()[1] for command in backend.commands] == ["-HnF", "-HnF", "-HnrF", "-Hnr"]
+
+    @pytest.mark.asyncio
+    async def test_grep_raw_regex_match_positions(self, backend: Any, tmp_path: Any) -> None:
+        """Test that match_start/match_end locate what grep's regex matched."""
+        (tmp_path / "code.py").write_text("x = 1  # def\n    def run_all(self):\n")
+
+        [hit] = await backend.grep_raw(r"def [[:alpha:]_]\+(", "code.py", recursive=False)
+        [word] = await backend.grep_raw(r"\<x\>", "code.py", recursive=False)
+
+        assert hit.line_content[hit.match_start : hit.match_end] == "def run_all("
+        assert (word.match_start, word.match_end) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_read_and_write_bytes_are_exact(self, backend: Any, tmp_path: Any) -> None:
+        """Test that non-UTF-8 data round-trips through write_bytes/read_bytes."""
+        path = str(tmp_path / "blob.bin")
+        data = bytes(range(256)) * 4
+
+        written = await backend.write_bytes(path, data)
+
+        assert written.bytes_written == len(data)
+        assert await backend.read_bytes(path) == data
+
+    @pytest.mark.asyncio
+    async def test_download_fallback_keeps_binary_exact(self, backend: Any, tmp_path: Any) -> None:
+        """Test that the per-file download path returns bytes unchanged."""
+        (tmp_path / "blob.bin").write_bytes(b"\xff\xfe\x00binary")
+
+        responses = await backend.download_files(["blob.bin", "missing.bin"])
+
+        assert [(r.success, r.content) for r in responses] == [
+            (True, b"\xff\xfe\x00binary"),
+            (False, b""),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_upload_files_uses_one_exec(self, backend: Any, tmp_path: Any) -> None:
+        """Test that a batch is written exactly, in one exec, creating parent dirs."""
+        files = {
+            str(tmp_path / "a.txt"): b"it's\nEMONK_EOF\n",
+            str(tmp_path / "nested dir" / "b.bin"): bytes(range(256)),
+        }
+
+        responses = await backend.upload_files(files)
+
+        assert len(backend.commands) == 1
+        assert [(r.path, r.success, r.bytes_uploaded) for r in responses] == [
+            (path, True, len(content)) for path, content in files.items()
+        ]
+        for path, content in files.items():
+            assert open(path, "rb").read() == content
+
+    @pytest.mark.asyncio
+    async def test_upload_files_splits_large_batches(
+        self, backend: Any, tmp_path: Any, monkeypatch: Any
+    ) -> None:
+        """Test that scripts are capped in size and keep the input order."""
+        monkeypatch.setattr("src.sandbox.modal.MAX_UPLOAD_SCRIPT_CHARS", 1024)
+        files = {str(tmp_path / f"file{i}.txt"): b"x" * 600 for i in range(4)}
+
+        responses = await backend.upload_files(files)
+
+        assert len(backend.commands) == 4
+        assert [r.path for r in responses] == list(files)
+        assert all(r.success for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_download_files_uses_one_exec(self, backend: Any, tmp_path: Any) -> None:
+        """Test that files come back byte-for-byte from one tar exec."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.bin").write_bytes(bytes(range(256)))
+        (tmp_path / "a.txt").write_bytes(b"hello")
+        paths = ["sub/b.bin", str(tmp_path / "a.txt")]
+
+        responses = await backend.download_files(paths)
+
+        assert len(backend.commands) == 1
+        assert [(r.path, r.success, r.content) for r in responses] == [
+            ("sub/b.bin", True, bytes(range(256))),
+            (str(tmp_path / "a.txt"), True, b"hello"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_download_files_falls_back_per_file(self, backend: Any, tmp_path: Any) -> None:
+        """Test that a missing file fails on its own, capped at MAX_CONCURRENT_TRANSFERS reads."""
+        from src.sandbox.modal import MAX_CONCURRENT_TRANSFERS
+
+        paths = []
+        for i in range(MAX_CONCURRENT_TRANSFERS * 2):
+            (tmp_path / f"file{i}.txt").write_text(f"content{i}")
+            paths.append(f"file{i}.txt")
+        paths.append("missing.txt")
+
+        responses = await backend.download_files(paths)
+
+        # One tar attempt, then one cat per file
+        assert len(backend.commands) == 1 + len(paths)
+        assert backend.max_in_flight <= MAX_CONCURRENT_TRANSFERS
+        assert [r.success for r in responses] == [True] * (len(paths) - 1) + [False]
+        assert responses[0].content == b"content0"
+
+
+class LocalShellProcess:
+    """Stand-in for a Modal container process, backed by a local bash."""
+
+    def __init__(self, proc: asyncio.subprocess.Process) -> None:
+        self.proc = proc
+        self.stdin = self
+        self.stdout = self
+
+    def write(self, data: str) -> None:
+        self.proc.stdin.write(data.encode())
+
+    async def drain(self) -> None:
+        await self.proc.stdin.drain()
+
+    async def __aiter__(self) -> Any:
+        while chunk := await self.proc.stdout.read(4096):
+            yield chunk.decode()
+
+    async def wait(self) -> int:
+        return await self.proc.wait()
+
+
+class TestModalSandboxShellSession:
+    """Test that filesystem helpers share one persistent bash session."""
+
+    @pytest_asyncio.fixture
+    async def backend(self, tmp_path: Any) -> Any:
+        """Create a started backend whose sandbox exec() spawns local bash processes."""
+        with patch("src.sandbox.modal._MODAL_AVAILABLE", True):
+            from src.sandbox.modal import ModalSandboxBackend
+
+            backend = ModalSandboxBackend(app_name="test-sandbox", eager_start=False)
+
+        procs = []
+
+        async def exec_shell(*args: str, **kwargs: Any) -> LocalShellProcess:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                cwd=tmp_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+            procs.append(proc)
+            return LocalShellProcess(proc)
+
+        backend._sandbox = MagicMock()
+        backend._sandbox.exec = AsyncMock(side_effect=exec_shell)
+        backend.execute = AsyncMock()  # type: ignore[method-assign]
+        backend.procs = procs
+        yield backend
+        for proc in procs:
+            # Sessions lead their own group (setsid); kill anything left in it
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(proc.pid, signal.SIGKILL)
+            await proc.wait()
+
+    @pytest.mark.asyncio
+    async def test_helpers_reuse_one_session(self, backend: Any, tmp_path: Any) -> None:
+        """Test that several helper calls open one bash process and skip execute()."""
+        path = str(tmp_path / "notes.txt")
+
+        await backend.write(path, "alpha beta")
+        await backend.edit(path, "beta", "gamma")
+        content = await backend.read(path)
+        files = await backend.ls_info(str(tmp_path))
+
+        assert content == "alpha gamma"
+        assert [f.path for f in files] == [path]
+        backend._sandbox.exec.assert_awaited_once_with(
+            "setsid", "-w", "bash", "--noprofile", "--norc"
+        )
+        backend.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_open_one_session(
+        self, backend: Any, tmp_path: Any
+    ) -> None:
+        """Test that helpers racing to open the session share a single bash process."""
+        await asyncio.gather(
+            backend.write(str(tmp_path / "a.txt"), "a"),
+            backend.write(str(tmp_path / "b.txt"), "b"),
+        )
+
+        backend._sandbox.exec.assert_awaited_once()
+        assert (tmp_path / "a.txt").read_text() + (tmp_path / "b.txt").read_text() == "ab"
+
+    @pytest.mark.asyncio
+    async def test_commands_are_isolated(self, backend: Any, tmp_path: Any) -> None:
+        """Test that cd/exit/stdin reads in one command don't affect the session."""
+        first = await backend._shell_run("cd / && export X=1; cat; exit 3")
+        second = await backend._shell_run("pwd; echo \"${X:-unset}\"")
+
+        assert first.exit_code == 3
+        assert second.exit_code == 0
+        assert second.output == f"{tmp_path}\nunset\n"
+
+    @pytest.mark.asyncio
+    async def test_output_cap_keeps_session_in_sync(self, backend: Any) -> None:
+        """Test that capped output is cut and the next command's output isn't mixed in."""
+        backend.max_output_bytes = 10
+
+        big = await backend._shell_run("head -c 100000 /dev/zero | tr '\\0' x")
+        after = await backend._shell_run("echo ok")
+
+        assert (big.output, big.truncated) == ("x" * 10, True)
+        assert (after.output, after.truncated) == ("ok\n", False)
+
+    @pytest.mark.asyncio
+    async def test_read_bytes_rejects_truncated_output(self, backend: Any, tmp_path: Any) -> None:
+        """Test that a file too large for the output cap fails instead of coming back cut."""
+        from src.sandbox.modal import SandboxError
+
+        backend.max_output_bytes = 16
+        (tmp_path / "big.bin").write_bytes(b"\x00" * 1000)
+        (tmp_path / "small.bin").write_bytes(b"tiny")
+
+        with pytest.raises(SandboxError, match="output limit"):
+            await backend.read_bytes("big.bin")
+        responses = await backend.download_files(["big.bin", "small.bin"])
+
+        assert [(r.success, r.content) for r in responses] == [(False, b""), (True, b"tiny")]
+
+    @pytest.mark.asyncio
+    async def test_timeout_replaces_session(self, backend: Any) -> None:
+        """Test that a stuck command's shell is killed and the next call gets a fresh one."""
+        from src.sandbox.modal import SandboxTimeoutError
+
+        backend.timeout = 1
+        with pytest.raises(SandboxTimeoutError):
+            await backend._shell_run("sleep 30")
+
+        stuck = backend.procs[0]
+        result = await backend._shell_run("echo ok")
+
+        # The old bash and its command were killed, not just dropped
+        assert await asyncio.wait_for(stuck.wait(), timeout=5) == -signal.SIGKILL
+        assert backend._sandbox.exec.await_args_list[1].args[:2] == ("bash", "-c")
+        assert result.output == "ok\n"
+        assert backend._sandbox.exec.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_execute_without_session(self, backend: Any) -> None:
+        """Test that commands use execute() when the sandbox can't open a shell."""
+        backend._sandbox.exec = AsyncMock(side_effect=Exception("unsupported"))
+
+        await backend._shell_run("echo one")
+        await backend._shell_run("echo two")
+
+        assert backend.execute.await_count == 2
+        backend._sandbox.exec.assert_awaited_once()
@@ -307,6 +307,24 @@ description: "Valid"
 
         assert skills == {}
 
+    def test_many_skills_load_in_directory_order(self, skills_dir):
+        """Test that skills parsed on the thread pool merge in sorted order."""
+        names = [f"skill-{i:02d}" for i in range(40)]
+        for name in reversed(names):
+            skill_dir = skills_dir / name
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(f"""---
+name: {name}
+description: "Skill {name}"
+---
+""")
+
+        loader = SkillLoader(str(skills_dir))
+        skills = loader.load_skills()
+
+        assert list(skills) == names
+        assert skills["skill-07"]["description"] == "Skill skill-07"
+
 
 class TestSkillLoaderToolSchemas:
     """Tests for tool schema generation."""
@@ -0,0 +1,174 @@
+"""
+Tests for the skill worker pool.
+
+Verifies warm-worker skill runs (output, exit codes, env, sibling imports),
+output capping, timeouts that kill only the stuck worker, the allowlist
+check SkillsEngine applies before dispatch, and SkillsEngine loading skills
+on first use.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.terminal import MAX_OUTPUT_SIZE, TerminalExecutor
+from src.skills.executor import SkillsEngine
+from src.skills.worker_pool import SkillWorkerPool, _CappedWriter
+
+
+@pytest.fixture
+def pool():
+    """Single-worker pool, terminated after the test."""
+    pool = SkillWorkerPool(processes=1)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def script(tmp_path):
+    """Write a skill script into tmp_path and return its path."""
+    def _write(source: str) -> str:
+        path = tmp_path / "skill.py"
+        path.write_text(source)
+        return str(path)
+    return _write
+
+
+@pytest.mark.asyncio
+async def test_run_captures_output_and_argv(pool, script):
+    """Test that a skill sees its argv and its stdout/stderr are captured."""
+    entry = script(
+        "import sys\n"
+        "if __name__ == '__main__':\n"
+        "    print(' '.join(sys.argv[1:]))\n"
+        "    print('warn', file=sys.stderr)\n"
+    )
+
+    result = await pool.run(entry, ["--key", "value"])
+
+    assert result.exit_code == 0
+    assert result.stdout == "--key value\n"
+    assert result.stderr == "warn\n"
+
+
+@pytest.mark.asyncio
+async def test_run_reports_exit_codes(pool, script):
+    """Test that sys.exit() codes and uncaught exceptions become exit codes."""
+    assert (await pool.run(script("import sys; sys.exit(3)"), [])).exit_code == 3
+
+    result = await pool.run(script("raise ValueError('bad input')"), [])
+
+    assert result.exit_code == 1
+    assert "ValueError: bad input" in result.stderr
+
+
+@pytest.mark.asyncio
+async def test_run_uses_callers_environment(pool, script, monkeypatch):
+    """Test that env changes after the pool started are visible to skills."""
+    entry = script("import os; print(os.environ.get('SKILL_TEST_VAR'))")
+    await pool.run(entry, [])
+
+    monkeypatch.setenv("SKILL_TEST_VAR", "set-later")
+    result = await pool.run(entry, [])
+
+    assert result.stdout.strip() == "set-later"
+
+
+@pytest.mark.asyncio
+async def test_run_imports_modules_next_to_script(pool, script, tmp_path):
+    """Test that a skill can import a sibling module, reloaded on each run."""
+    entry = script("import helper; print(helper.VALUE)")
+    (tmp_path / "helper.py").write_text("VALUE = 'a'\n")
+    first = await pool.run(entry, [])
+
+    (tmp_path / "helper.py").write_text("VALUE = 'bb'\n")
+    second = await pool.run(entry, [])
+
+    assert (first.exit_code, first.stdout) == (0, "a\n")
+    assert (second.exit_code, second.stdout) == (0, "bb\n")
+
+
+@pytest.mark.asyncio
+async def test_run_timeout_replaces_worker(pool, script):
+    """Test that a stuck skill times out and the next call gets a fresh worker."""
+    with pytest.raises(TimeoutError):
+        await pool.run(script("import time; time.sleep(30)"), [], timeout=1)
+
+    result = await pool.run(script("print('ok')"), [])
+
+    assert result.stdout == "ok\n"
+
+
+@pytest.mark.asyncio
+async def test_run_timeout_spares_other_calls(script, tmp_path):
+    """Test that a timeout kills only its own worker, not calls on the others."""
+    pool = SkillWorkerPool(processes=2)
+    try:
+        stuck = script("import time; time.sleep(30)")
+        slow = tmp_path / "slow.py"
+        slow.write_text("import time; time.sleep(2); print('done')")
+        workers = pool._get_pool()
+
+        results = await asyncio.gather(
+            pool.run(stuck, [], timeout=1),
+            pool.run(str(slow), [], timeout=10),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], TimeoutError)
+        assert results[1].stdout == "done\n"
+        assert pool._pool is workers
+        assert (await pool.run(str(slow), [])).stdout == "done\n"
+    finally:
+        await pool.aclose()
+
+
+def test_capped_writer_truncates():
+    """Test that output past MAX_OUTPUT_SIZE is dropped and marked."""
+    writer = _CappedWriter(MAX_OUTPUT_SIZE)
+    writer.write("x" * (MAX_OUTPUT_SIZE - 1))
+    writer.write("yz")
+    writer.write("more")
+
+    output = writer.result()
+
+    assert output.startswith("x" * (MAX_OUTPUT_SIZE - 1) + "y")
+    assert output.endswith("[Output truncated at 1MB limit]")
+
+
+@pytest.mark.asyncio
+async def test_engine_validates_before_dispatch(tmp_path):
+    """Test that SkillsEngine applies the path allowlist on the pool path too."""
+    engine = SkillsEngine(TerminalExecutor(), skills_dir=str(tmp_path), workers=1)
+    engine.skills = {"echo": {"entry_point": "./skills/echo/echo.py"}}
+
+    result = await engine.execute_skill("echo", {"path": "/etc/passwd"})
+
+    assert result.success is False
+    assert "Security violation" in result.error
+    # Rejected before any worker was started
+    assert engine.worker_pool._pool is None
+
+
+def test_engine_workers_zero_disables_pool(tmp_path, monkeypatch):
+    """Test that SKILL_WORKERS=0 keeps the process-per-call path."""
+    monkeypatch.setenv("SKILL_WORKERS", "0")
+
+    engine = SkillsEngine(TerminalExecutor(), skills_dir=str(tmp_path))
+
+    assert engine.worker_pool is None
+
+
+def test_engine_loads_skills_on_first_use(tmp_path):
+    """Test that SKILL.md files are read on first use, not in the constructor."""
+    skill_dir = tmp_path / "echo"
+    skill_dir.mkdir()
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: echo\ndescription: Echo the given arguments back\n---\n")
+
+    engine = SkillsEngine(TerminalExecutor(), skills_dir=str(tmp_path), workers=0)
+    # A constructor that had parsed it would still list "echo"
+    skill_md.write_text("---\nname: echo-later\ndescription: Echo the given arguments back\n---\n")
+
+    assert engine.list_skills() == ["echo-later"]
+    assert engine.skills is engine.skills
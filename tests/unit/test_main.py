@@ -0,0 +1,277 @@
+"""Unit tests for the application entry point (src/main.py).
+
+Tests:
+- Importing src.main doesn't load the Vertex AI / LangChain SDKs
+- Lifespan: agent built at startup, GCS filesystem sync pulled and flushed,
+  heartbeat HTTP client closed and skill workers stopped on shutdown
+- Skill tools: built from the engine's single skills scan
+- Skill tools: sync calls share one (uvloop) loop, async calls await the engine
+- Skill tools: one shared args schema, flags nested or top-level
+- validate_env_vars() against an environment snapshot, credentials file check
+- Background warm-up of the model and GCS clients
+"""
+
+import os
+import subprocess
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def test_import_skips_heavy_sdks():
+    """Test that the SDK imports are deferred until create_app() runs."""
+    code = (
+        "import sys, src.main; "
+        "heavy = [m for m in ('google.cloud.aiplatform', 'langchain_google_vertexai', "
+        "'langchain_core', 'src.core') if m in sys.modules]; "
+        "sys.exit(' '.join(heavy) or None)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+    assert result.returncode == 0, result.stderr.decode()
+
+
+def test_app_is_built_in_lifespan():
+    """Test that the module-level app defers create_app() to its lifespan."""
+    import src.main as main
+
+    assert main.app is main.server.app
+    assert main.app.router.lifespan_context is main.lifespan
+
+
+@pytest.mark.asyncio
+async def test_lifespan_runs_create_app_and_fs_sync(monkeypatch):
+    """Test that startup builds the agent and wires its filesystem sync."""
+    import src.main as main
+
+    agent = MagicMock()
+    agent.fs_sync.sync_from_gcs = AsyncMock()
+    agent.fs_sync.start_periodic_sync = AsyncMock()
+    agent.fs_sync.close = AsyncMock()
+    agent.heartbeat_handler.aclose = AsyncMock()
+
+    def fake_create_app():
+        main.server.agent_core = agent
+        return main.server.app
+
+    monkeypatch.setattr(main, "create_app", fake_create_app)
+    monkeypatch.setattr(main.server, "agent_core", main.server.agent_core)
+
+    async with main.lifespan(main.app):
+        agent.fs_sync.sync_from_gcs.assert_awaited_once()
+        agent.fs_sync.start_periodic_sync.assert_awaited_once()
+        agent.fs_sync.close.assert_not_awaited()
+        agent.heartbeat_handler.aclose.assert_not_awaited()
+
+    agent.fs_sync.close.assert_awaited_once()
+    agent.heartbeat_handler.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_shutdown_closes_skills_engine(monkeypatch):
+    """Test that shutdown stops the skill worker processes."""
+    import src.main as main
+
+    engine = MagicMock()
+    monkeypatch.setattr(main, "create_app", lambda: main.server.app)
+    monkeypatch.setattr(main, "_skills_engine", engine)
+
+    async with main.lifespan(main.app):
+        engine.close.assert_not_called()
+
+    engine.close.assert_called_once_with()
+
+
+@pytest.fixture
+def skill_tools():
+    """Skill tools built over a mocked engine with one skill."""
+    from src.core.interfaces import SkillResult
+    from src.main import load_skills_as_tools
+
+    engine = MagicMock()
+    engine.skills = {"echo": {"description": "Echo args"}}
+    engine.execute_skill = AsyncMock(
+        side_effect=lambda name, args: SkillResult(success=True, output=f"{name}:{args}")
+    )
+
+    with (
+        patch("src.skills.executor.SkillsEngine", return_value=engine),
+        patch("src.skills.loader.SkillLoader") as loader_cls,
+    ):
+        yield load_skills_as_tools("./skills", MagicMock()), engine
+        # The engine's own scan is the only one
+        loader_cls.assert_not_called()
+
+
+def test_skill_tools_built_from_engine_metadata(skill_tools):
+    """Test that tools come from the engine's skills, with their descriptions."""
+    tools, _ = skill_tools
+
+    assert [(tool.name, tool.description) for tool in tools] == [("echo", "Echo args")]
+
+
+def test_skill_tools_sorted_by_name():
+    """Test that tool order doesn't depend on directory scan order."""
+    from src.main import load_skills_as_tools
+
+    engine = MagicMock()
+    engine.skills = {"b": {}, "c": {}, "a": {}}
+
+    with patch("src.skills.executor.SkillsEngine", return_value=engine):
+        tools = load_skills_as_tools("./skills", MagicMock())
+
+    assert [tool.name for tool in tools] == ["a", "b", "c"]
+
+
+def test_skill_tools_bind_their_own_skill():
+    """Test that each tool built in a loop calls its own skill, not the last one."""
+    from src.main import _make_skill_tool
+
+    engine = MagicMock()
+    engine.execute_skill = AsyncMock(
+        side_effect=lambda name, args: MagicMock(success=True, output=name)
+    )
+
+    tools = [_make_skill_tool(engine, name, "desc") for name in ("a", "b")]
+
+    assert [tool.invoke({}) for tool in tools] == ["a", "b"]
+
+
+def test_skill_tools_share_args_schema():
+    """Test that every skill tool uses the module's SkillArgs schema."""
+    from src.main import SkillArgs, _make_skill_tool
+
+    tools = [_make_skill_tool(MagicMock(), name, "desc") for name in ("a", "b")]
+
+    assert all(tool.args_schema is SkillArgs for tool in tools)
+
+
+@pytest.mark.parametrize(
+    "tool_input",
+    [{"arguments": {"query": "news", "num": 3}}, {"query": "news", "num": 3}],
+    ids=["nested", "top-level"],
+)
+def test_skill_tool_passes_flags_to_engine(skill_tools, tool_input):
+    """Test that the model's flags reach the skill, nested or not."""
+    tools, engine = skill_tools
+
+    tools[0].invoke(tool_input)
+
+    engine.execute_skill.assert_awaited_once_with("echo", {"query": "news", "num": 3})
+
+
+def test_skill_tool_sync_reuses_one_loop(skill_tools):
+    """Test that sync skill calls run on the shared loop, not asyncio.run()."""
+    import src.main as main
+
+    tools, _ = skill_tools
+
+    with patch("asyncio.run", side_effect=AssertionError("asyncio.run called")):
+        first = tools[0].invoke({})
+        loop = main._get_skill_loop()
+        second = tools[0].invoke({})
+
+    assert first == second == "echo:{}"
+    assert main._get_skill_loop() is loop
+    assert loop.is_running()
+
+
+def test_skill_loop_uses_uvloop():
+    """Test that the skill loop is a uvloop loop when uvloop is installed."""
+    uvloop = pytest.importorskip("uvloop")
+    import src.main as main
+
+    assert isinstance(main._get_skill_loop(), uvloop.Loop)
+
+
+@pytest.mark.asyncio
+async def test_skill_tool_async_awaits_engine(skill_tools):
+    """Test that ainvoke awaits the skill on the caller's loop."""
+    tools, engine = skill_tools
+
+    assert await tools[0].ainvoke({}) == "echo:{}"
+    engine.execute_skill.assert_awaited_once_with("echo", {})
+
+
+@pytest.mark.asyncio
+async def test_skill_tool_error_result(skill_tools):
+    """Test that a failed skill is rendered as an error string."""
+    from src.core.interfaces import SkillResult
+
+    tools, engine = skill_tools
+    engine.execute_skill.side_effect = None
+    engine.execute_skill.return_value = SkillResult(success=False, output="", error="boom")
+
+    assert await tools[0].ainvoke({}) == "Error: boom"
+
+
+def test_validate_env_vars_uses_snapshot(monkeypatch):
+    """Test that validation reads the given snapshot, not os.environ."""
+    from src.main import validate_env_vars
+
+    monkeypatch.delenv("ALLOWED_USERS", raising=False)
+
+    validate_env_vars({"ALLOWED_USERS": "user@example.com", "MODEL_PROVIDER": "other"})
+
+
+def test_validate_env_vars_reports_missing():
+    """Test that every missing required variable is named in the error."""
+    from src.main import validate_env_vars
+
+    with pytest.raises(RuntimeError, match="ALLOWED_USERS, VERTEX_AI_PROJECT_ID"):
+        validate_env_vars({"ENVIRONMENT": "production"})
+
+
+def test_validate_env_vars_exports_absolute_creds_path(tmp_path, monkeypatch):
+    """Test that a relative credentials path is exported as an absolute one."""
+    from src.main import validate_env_vars
+
+    (tmp_path / "sa.json").write_text("{}")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "sa.json")
+
+    validate_env_vars({
+        "ALLOWED_USERS": "user@example.com",
+        "MODEL_PROVIDER": "other",
+        "GOOGLE_APPLICATION_CREDENTIALS": "sa.json",
+    })
+
+    assert os.environ["GOOGLE_APPLICATION_CREDENTIALS"] == str(tmp_path / "sa.json")
+
+
+def test_validate_env_vars_rejects_missing_creds_file(tmp_path):
+    """Test that a credentials path that isn't a file is rejected."""
+    from src.main import validate_env_vars
+
+    with pytest.raises(RuntimeError, match="file not found"):
+        validate_env_vars({
+            "ALLOWED_USERS": "user@example.com",
+            "MODEL_PROVIDER": "other",
+            "GOOGLE_APPLICATION_CREDENTIALS": str(tmp_path),
+        })
+
+
+def test_warm_up_clients_calls_model_and_bucket():
+    """Test that warm-up makes one tiny model call and a bucket lookup."""
+    from src.main import _warm_up_clients
+
+    model = MagicMock()
+    store = MagicMock()
+
+    _warm_up_clients(model, store)
+
+    model.invoke.assert_called_once_with(".", max_output_tokens=1)
+    store.bucket.exists.assert_called_once()
+
+
+def test_warm_up_clients_swallows_errors():
+    """Test that a failing warm-up doesn't raise into the startup thread."""
+    from src.main import _warm_up_clients
+
+    model = MagicMock()
+    model.invoke.side_effect = RuntimeError("no credentials yet")
+    store = MagicMock()
+    store.bucket.exists.side_effect = RuntimeError("network down")
+
+    _warm_up_clients(model, store)